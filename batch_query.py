@@ -0,0 +1,229 @@
+# coding=utf-8
+#!/usr/bin/env python
+# -----------------
+# file      : batch_query.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Headless batch runner of path queries.
+
+    python batch_query.py roads.bin --queries queries.txt --workers 4 > results.jsonl
+    python batch_query.py roads.gr.gz --coordinates roads.co.gz < queries.txt
+
+The graph is a graph.graph_file binary (memory-mapped by every worker), a DIMACS .gr file (with optional .co
+coordinates) or an edge list (see graph.loader). Every query line is "begin end [algorithm]" separated by
+whitespace or commas, or a JSON object {"begin": ..., "end": ..., "algorithm": ..., "id": ...}; empty lines and
+lines starting with '#' are skipped. One JSON line is written per query in the input order: id, begin, end,
+algorithm, nodes and edges of the path, total_weight, iterations, seconds (or error). Queries are read and
+results are written as a stream, at most "--window" chunks of queries are in flight at any moment.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from graph.algorithms import search_algorithm
+from graph.graph_file import open_graph
+from graph.loader import load_dimacs, load_edge_list
+from graph.query_server import path_result
+from graph.shared_graph import share_graph, attach_graph
+
+# graph of the current process and the object keeping it alive (GraphFile or SharedGraph)
+_graph = None
+_holder = None
+
+
+def _is_binary(file_name):
+    return file_name.endswith('.bin')
+
+
+def load_graph(file_name, coordinates=None, delimiter=','):
+    # returns (CompactGraph, holder), holder must be closed when the graph is no longer needed (may be None)
+    if _is_binary(file_name):
+        holder = open_graph(file_name)
+        return holder.graph(), holder
+    name = file_name[:-3] if file_name.endswith('.gz') else file_name
+    if name.endswith('.gr'):
+        return load_dimacs(file_name, coordinates, compact=True).graph(), None
+    return load_edge_list(file_name, compact=True, delimiter=delimiter).graph(), None
+
+
+def _initialize_worker(source):
+    # "source" is ('file', name of a binary graph file) or ('shared', descriptor of graph.shared_graph)
+    global _graph, _holder
+    kind, value = source
+    _holder = open_graph(value) if kind == 'file' else attach_graph(value)
+    _graph = _holder.graph()
+
+
+def _answer(graph, query):
+    uid, begin, end, algorithm = query
+    result = {'id': uid, 'begin': begin, 'end': end, 'algorithm': algorithm}
+    started = time.perf_counter()
+    try:
+        path = search_algorithm(algorithm)(begin, end, graph)
+    except Exception as error:
+        result['error'] = str(error)
+    else:
+        result.update(path_result(path))
+    result['seconds'] = time.perf_counter() - started
+    return json.dumps(result)
+
+
+def _answer_chunk(queries):
+    return [_answer(_graph, query) for query in queries]
+
+
+def parse_queries(lines, algorithm='dijkstra'):
+    # yields (id, begin, end, algorithm), id is the line number unless it is given in a JSON query
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            if line.startswith('{'):
+                query = json.loads(line)
+                if not isinstance(query, dict):
+                    raise ValueError('JSON query must be an object')
+                parsed = (query.get('id', number), int(query['begin']), int(query['end']),
+                          query.get('algorithm', algorithm))
+            else:
+                fields = line.replace(',', ' ').split()
+                if len(fields) < 2:
+                    raise ValueError('query must contain begin and end')
+                parsed = number, int(fields[0]), int(fields[1]), fields[2] if len(fields) > 2 else algorithm
+        except (ValueError, KeyError, TypeError) as error:
+            # TypeError: begin or end is null, a list or an object
+            parsed = number, None, None, 'invalid query {0!r}: {1}'.format(line, error)
+        yield parsed
+
+
+def _chunks(queries, size):
+    while True:
+        chunk = list(islice(queries, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _invalid(query):
+    return query[1] is None
+
+
+def _write_chunk(output, chunk, lines):
+    # invalid queries are answered by the main process, "lines" are results of the valid ones in order
+    answers = iter(lines)
+    for query in chunk:
+        if _invalid(query):
+            output.write(json.dumps({'id': query[0], 'error': query[3]}))
+        else:
+            output.write(next(answers))
+        output.write('\n')
+    output.flush()
+
+
+def run_batch(graph_file, queries, output, workers=1, chunk_size=64, window=8, coordinates=None, delimiter=','):
+
+    # "queries" is an iterable of (id, begin, end, algorithm) (see parse_queries()), results go to "output"
+    # as JSON lines in the same order. Returns number of answered queries.
+
+    graph, holder = load_graph(graph_file, coordinates, delimiter)
+    shared = None
+    answered = 0
+    try:
+        if workers <= 1:
+            for chunk in _chunks(iter(queries), chunk_size):
+                _write_chunk(output, chunk, [_answer(graph, query) for query in chunk if not _invalid(query)])
+                answered += len(chunk)
+            return answered
+
+        if _is_binary(graph_file):
+            source = ('file', graph_file)  # workers map the same file, pages are shared by the OS
+        else:
+            shared = share_graph(graph)
+            source = ('shared', shared.descriptor())
+
+        pool = multiprocessing.Pool(workers, _initialize_worker, (source,))
+        try:
+            pending = deque()
+            for chunk in _chunks(iter(queries), chunk_size):
+                valid = [query for query in chunk if not _invalid(query)]
+                pending.append((chunk, pool.apply_async(_answer_chunk, (valid,))))
+                if len(pending) >= window * workers:
+                    done, result = pending.popleft()
+                    _write_chunk(output, done, result.get())
+                    answered += len(done)
+            while pending:
+                done, result = pending.popleft()
+                _write_chunk(output, done, result.get())
+                answered += len(done)
+        finally:
+            pool.terminate()
+            pool.join()
+        return answered
+    finally:
+        graph = None
+        if shared is not None:
+            shared.close()
+        if holder is not None:
+            holder.close()
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Answer path queries from a file or stdin, print JSON lines')
+    parser.add_argument('graph', help='graph file: .bin (graph.graph_file), .gr[.gz] (DIMACS) or an edge list')
+    parser.add_argument('--coordinates', help='DIMACS .co[.gz] file with node coordinates')
+    parser.add_argument('--delimiter', default=',', help='delimiter of edge list columns')
+    parser.add_argument('--queries', default='-', help='query file, "-" for stdin (default)')
+    parser.add_argument('--algorithm', default='dijkstra', help='algorithm of queries which do not name one')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--chunk-size', type=int, default=64, help='queries sent to a worker at once')
+    parser.add_argument('--window', type=int, default=8, help='chunks in flight per worker')
+    arguments = parser.parse_args(argv)
+
+    source = sys.stdin if arguments.queries == '-' else open(arguments.queries)
+    try:
+        run_batch(arguments.graph, parse_queries(source, arguments.algorithm), sys.stdout, arguments.workers,
+                  arguments.chunk_size, arguments.window, arguments.coordinates, arguments.delimiter)
+    except BrokenPipeError:
+        pass
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
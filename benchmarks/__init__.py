@@ -0,0 +1,40 @@
+# coding=utf-8
+#!/usr/bin/env python
+# -----------------
+# file      : __init__.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Headless benchmarks of the graph package, run them from the repository root:
+
+    python -m benchmarks.memory_benchmark
+    python -m benchmarks.benchmark_suite
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
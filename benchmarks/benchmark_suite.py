@@ -0,0 +1,228 @@
+# coding=utf-8
+#!/usr/bin/env python
+# -----------------
+# file      : benchmark_suite.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Search benchmarks on synthetic graphs (see graph.generators) with regression tracking.
+
+    python -m benchmarks.benchmark_suite --sizes 1000 10000 --output current.json
+    python -m benchmarks.benchmark_suite --compare baseline.json
+    python -m benchmarks.benchmark_suite --input current.json --compare baseline.json
+
+Every generator, size, representation (Graph or CompactGraph) and algorithm is measured on the same random
+queries: throughput, latency percentiles, peak memory allocated during a query (traced in a separate pass,
+tracing slows searches down) and the mean number of settled nodes. Compare mode reports measurements which are
+worse than the baseline by more than the threshold and exits with status 1 if there are any.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import sys
+import gc
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+from time import perf_counter
+
+from graph.compact_graph import CompactGraph
+from graph.algorithms import algorithms
+from graph.astar_search import astar_search
+from graph.generators import generators, generate
+
+# measurement -> True if greater values are better
+metrics = {'throughput': True, 'latency_p50': False, 'latency_p90': False, 'latency_p99': False, 'peak_memory': False}
+
+
+def percentile(values, fraction):
+    # nearest-rank percentile of sorted values
+    if not values:
+        return 0.0
+    return values[max(0, int(math.ceil(fraction * len(values))) - 1)]
+
+
+def _search_function(name, representation, coordinates):
+    function = algorithms[name]
+    if name == 'astar' and representation == 'graph' and coordinates is not None:
+        return lambda begin, end, graph: astar_search(begin, end, graph, coordinates=coordinates)
+    return function
+
+
+def _peak_memory(function, graph, queries):
+    gc.collect()
+    peak = 0
+    tracemalloc.start()
+    try:
+        for begin, end in queries:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            function(begin, end, graph)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(function, graph, queries, memory_queries):
+    function(queries[0][0], queries[0][1], graph)  # warm up
+    latencies = []
+    settled = 0
+    started = perf_counter()
+    for begin, end in queries:
+        query_started = perf_counter()
+        path = function(begin, end, graph)
+        latencies.append(perf_counter() - query_started)
+        stats = path.stats()
+        if stats is not None:
+            settled += stats.settled()
+    elapsed = perf_counter() - started
+
+    latencies.sort()
+    return {
+        'queries': len(queries),
+        'throughput': len(queries) / elapsed if elapsed > 0 else 0.0,
+        'latency_mean': sum(latencies) / len(latencies),
+        'latency_p50': percentile(latencies, 0.5),
+        'latency_p90': percentile(latencies, 0.9),
+        'latency_p99': percentile(latencies, 0.99),
+        'latency_max': latencies[-1],
+        'peak_memory': _peak_memory(function, graph, queries[:memory_queries]),
+        'settled_mean': settled / float(len(queries))
+    }
+
+
+def run(kinds, sizes, names, representations, queries_number=100, memory_queries=10, seed=0, progress=None):
+    results = []
+    for kind in kinds:
+        for size in sizes:
+            graph, coordinates = generate(kind, size, seed)
+            ids = sorted(graph.nodes())
+            rand = random.Random(seed)
+            queries = [(rand.choice(ids), rand.choice(ids)) for _ in range(queries_number)]
+            snapshots = {'graph': graph}
+            if 'compact' in representations:
+                snapshots['compact'] = CompactGraph(graph, coordinates)
+            for representation in representations:
+                for name in names:
+                    function = _search_function(name, representation, coordinates)
+                    result = {'generator': kind, 'size': size, 'nodes': graph.nodes_number(),
+                              'edges': graph.edges_number(), 'representation': representation, 'algorithm': name}
+                    result.update(measure(function, snapshots[representation], queries, memory_queries))
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'results': results
+    }
+
+
+def _key(result):
+    return result['generator'], result['size'], result['representation'], result['algorithm']
+
+
+def compare(current, baseline, threshold=0.1):
+    # Returns list of (key, metric, baseline value, current value, relative change) for measurements
+    # which are worse than baseline by more than "threshold" (a fraction).
+    base = dict((_key(result), result) for result in baseline['results'])
+    regressions = []
+    for result in current['results']:
+        key = _key(result)
+        old = base.get(key, None)
+        if old is None:
+            continue
+        for metric, greater_is_better in metrics.items():
+            before = old.get(metric, 0)
+            after = result.get(metric, 0)
+            if not before or not after:
+                continue
+            change = (before / float(after) - 1.0) if greater_is_better else (after / float(before) - 1.0)
+            if change > threshold:
+                regressions.append((key, metric, before, after, change))
+    return regressions
+
+
+def _print_result(result):
+    print('{generator:>12} {nodes:>8} {representation:>8} {algorithm:>24}  {throughput:10.1f} q/s  '
+          'p50 {p50:8.3f} ms  p99 {p99:8.3f} ms  peak {memory:9.1f} KiB  settled {settled_mean:9.1f}'.format(
+              p50=result['latency_p50'] * 1000.0, p99=result['latency_p99'] * 1000.0,
+              memory=result['peak_memory'] / 1024.0, **result))
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmark search algorithms on synthetic graphs')
+    parser.add_argument('--generators', nargs='+', default=sorted(generators), choices=sorted(generators))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000])
+    parser.add_argument('--algorithms', nargs='+', default=sorted(algorithms), choices=sorted(algorithms))
+    parser.add_argument('--representations', nargs='+', default=['graph', 'compact'], choices=['graph', 'compact'])
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('--memory-queries', type=int, default=10, help='queries traced for peak memory')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--input', help='do not run benchmarks, take results from this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to check results against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed relative slowdown, 0.1 is 10%%')
+    parser.add_argument('--quiet', action='store_true')
+    arguments = parser.parse_args(argv)
+
+    if arguments.input:
+        with open(arguments.input) as source:
+            current = json.load(source)
+    else:
+        current = run(arguments.generators, arguments.sizes, arguments.algorithms, arguments.representations,
+                      arguments.queries, arguments.memory_queries, arguments.seed,
+                      None if arguments.quiet else _print_result)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as destination:
+            json.dump(current, destination, indent=1, sort_keys=True)
+
+    if arguments.compare:
+        with open(arguments.compare) as source:
+            baseline = json.load(source)
+        regressions = compare(current, baseline, arguments.threshold)
+        for key, metric, before, after, change in regressions:
+            print('REGRESSION {0} {1}: {2:.6g} -> {3:.6g} ({4:+.1%})'.format('/'.join(str(k) for k in key), metric,
+                                                                            before, after, change))
+        if regressions:
+            return 1
+        print('no regressions against {0}'.format(arguments.compare))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,119 @@
+# coding=utf-8
+#!/usr/bin/env python
+# -----------------
+# file      : memory_benchmark.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Memory used by Graph objects: bytes per node and bytes per edge.
+
+Nodes are measured on a graph without edges, edges are measured as the difference after connecting
+the same nodes, half of the edges are mutual (two node-side records per edge). The change log (see
+Graph.changes_since()) is dropped before every measurement and its size is reported on its own.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import sys
+import gc
+import json
+import random
+import argparse
+import tracemalloc
+
+from graph.graph import Graph, EdgeDirection
+from graph.compact_graph import CompactGraph
+
+
+def _allocated():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure(nodes_number, edges_number, seed=0):
+    rand = random.Random(seed)
+    pairs = []
+    while len(pairs) < edges_number:
+        first = rand.randint(1, nodes_number)
+        second = rand.randint(1, nodes_number)
+        if first != second:
+            direction = EdgeDirection.MUTUAL if len(pairs) % 2 else EdgeDirection.STRAIGHT
+            pairs.append((first, second, direction, rand.randint(1, 100)))
+
+    tracemalloc.start()
+    try:
+        start = _allocated()
+        graph = Graph()
+        for uid in range(1, nodes_number + 1):
+            graph.add_node(1, uid)
+        graph._drop_changes()
+        with_nodes = _allocated()
+        for first, second, direction, weight in pairs:
+            graph.connect_nodes(first, second, direction, weight)
+        with_change_log = _allocated()
+        graph._drop_changes()
+        with_edges = _allocated()
+        compact = CompactGraph(graph)
+        with_snapshot = _allocated()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'nodes': nodes_number,
+        'edges': edges_number,
+        'bytes_per_node': (with_nodes - start) / nodes_number,
+        'bytes_per_edge': (with_edges - with_nodes) / edges_number,
+        'snapshot_bytes_per_edge': (with_snapshot - with_edges) / edges_number,
+        'snapshot_arcs': compact.arcs_number(),
+        'change_log_entries': min(edges_number, Graph.change_log_size),
+        'change_log_bytes': with_change_log - with_edges
+    }
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Measure memory used by graph.graph.Graph')
+    parser.add_argument('--nodes', type=int, default=100000)
+    parser.add_argument('--edges', type=int, default=300000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    arguments = parser.parse_args(argv)
+
+    result = measure(arguments.nodes, arguments.edges, arguments.seed)
+    if arguments.json:
+        print(json.dumps(result))
+    else:
+        print('nodes: {nodes}, edges: {edges}'.format(**result))
+        print('bytes per node: {bytes_per_node:.1f}'.format(**result))
+        print('bytes per edge: {bytes_per_edge:.1f}'.format(**result))
+        print('CompactGraph bytes per edge: {snapshot_bytes_per_edge:.1f}'.format(**result))
+        print('change log: {change_log_bytes} bytes for {change_log_entries} entries'.format(**result))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+# coding=utf-8
+# -----------------
+# file      : algorithms.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Registry of point-to-point search algorithms available by name.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from .depth_first_search import depth_first_search
+from .breadth_first_search import breadth_first_search
+from .dijkstra_search import dijkstra_search
+from .astar_search import astar_search
+from .bidirectional_dijkstra_search import bidirectional_dijkstra_search
+
+#######################################################################################################################
+#######################################################################################################################
+
+algorithms = {
+    'dfs': depth_first_search,
+    'bfs': breadth_first_search,
+    'dijkstra': dijkstra_search,
+    'astar': astar_search,
+    'bidirectional_dijkstra': bidirectional_dijkstra_search
+}
+
+# results of these algorithms do not depend on weights (but Path.total_weight() does)
+unweighted_algorithms = (depth_first_search, breadth_first_search)
+
+
+def search_algorithm(algorithm):
+    if callable(algorithm):
+        return algorithm
+    function = algorithms.get(algorithm, None)
+    if function is None:
+        raise ValueError('unknown search algorithm: {0!r}'.format(algorithm))
+    return function
+
+#######################################################################################################################
+#######################################################################################################################
@@ -35,9 +35,12 @@ __version__ = '0.0.1'  # this is last application version when this script file
 __email__ = 'victor.zarubkin@gmail.com'
 ############################################################################
 
-from .graph import Path
-from sortedcontainers.sortedlistwithkey import SortedListWithKey as sortedList
-from PySide.QtCore import QLineF
+from math import hypot
+from .graph import path_from_parents, Path
+from .compact_graph import CompactGraph
+from .coordinates import coordinates_function, node_position, euclidean_distance
+from .priority_queue import create_priority_queue, QueueType
+from .search_stats import SearchStats, containers_size, queue_entry_size
 
 #######################################################################################################################
 #######################################################################################################################
@@ -45,58 +48,78 @@ from PySide.QtCore import QLineF
 _infinite_weight = 1e28
 
 
-class _AstarNode(object):
+def astar_heuristics(current_node, target_node):
+    # nodes without a position (e.g. a headless graph) get zero heuristics, A* then behaves as Dijkstra
+    current_position = node_position(current_node)
+    target_position = node_position(target_node)
+    if current_position is None or target_position is None:
+        return 0
+    return int(euclidean_distance(current_position, target_position))
 
-    def __init__(self, node, cost, parent, edge):
-        object.__init__(self)
-        self.id = node.id()
-        self.parent_id = parent.id() if parent is not None else 0
-        self.node = node
-        self.parent = parent
-        self.edge = edge
-        self.cost = cost
-        self.heuristics_cost = None
 
-    def __lt__(self, other):
-        return self.cost < other.cost
+def astar_search(begin, end, graph, queue_type=QueueType.BINARY_HEAP, landmarks=None, coordinates=None,
+                 cancellation=None, hooks=None):
 
-    def __eq__(self, other):
-        return self.id == other.id
+    # "landmarks" is graph.landmarks.LandmarkTable, if it is set then ALT lower bound is used as heuristics
+    # instead of euclidean distance between nodes.
+    # "coordinates" are node coordinates (see graph.coordinates), by default positions of node data items are used.
 
+    global _infinite_weight
 
-def astar_heuristics(current_node, target_node):
-    return int(QLineF(current_node.data().pos(), target_node.data().pos()).length())
+    stats = SearchStats()
 
+    if not graph.may_reach(begin, end):
+        return stats.attach(Path())
 
-def astar_search(begin, end, graph):
-
-    global _infinite_weight
+    if isinstance(graph, CompactGraph):
+        return _astar_search_compact(begin, end, graph, queue_type, landmarks, coordinates, cancellation, hooks, stats)
 
     start = graph.node(begin)
     if start is None:
-        return Path()
+        return stats.attach(Path())
 
     finish = graph.node(end)
     if finish is None or finish.id() == start.id():
-        return Path()
-
-    nodes = {}
-    for node_id in graph.nodes():
-        node = graph.node(node_id)
-        cost = 0 if node_id == begin else _infinite_weight
-        nodes[node_id] = _AstarNode(node, cost, None, None)
-
-    visited_nodes = []
-    priority_queue = sortedList([nodes[start.id()]], key=lambda x: x.cost, load=len(nodes))
+        return stats.attach(Path())
+
+    lower_bound = landmarks.heuristics(landmarks.index(end)) if landmarks is not None else None
+    position = coordinates_function(coordinates)
+    if position is not None:
+        finish_position = position(end)
+    costs = {begin: 0}
+    heuristics_costs = {}
+    parents = {}
+    visited_nodes = set()
+    priority_queue = create_priority_queue(queue_type)
+    priority_queue.push(begin, 0)
     iterations = 0
+    relaxations = 0
+    pushes = 1
+    peak_queue = 0
+    found = False
+    stats.lap('prepare')
 
     while priority_queue:
 
         iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
 
-        current = priority_queue.pop(0)
-        visited_nodes.append(current.id)
-        edges = current.node.edges()
+        queue_size = len(priority_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        current_id, _ = priority_queue.pop()
+        visited_nodes.add(current_id)
+        cost = costs[current_id]
+        if hooks is not None:
+            hooks.on_settle(current_id, cost)
+        if current_id == end:
+            found = True
+            break
+
+        current = graph.node(current_id)
+        edges = current.edges()
 
         for edge_id in edges:
 
@@ -104,43 +127,155 @@ def astar_search(begin, end, graph):
             if edge is None:
                 continue
 
-            edge_info = edges[edge_id]
-            if edge_info.tail() in visited_nodes:
+            tail_id = edges[edge_id].tail()
+            if tail_id in visited_nodes:
                 continue
 
-            tail = nodes.get(edge_info.tail(), None)
+            tail = graph.node(tail_id)
             if tail is None:
                 continue
 
-            if tail.heuristics_cost is None:
-                tail.heuristics_cost = astar_heuristics(tail.node, finish)
-
-            cost = current.cost + edge.weight() + tail.node.weight() + tail.heuristics_cost
-            if cost < tail.cost:
-                tail.cost = cost
-                tail.parent_id = current.id
-                tail.parent = current.node
-                tail.edge = edge
-                priority_queue.discard(tail)
-                priority_queue.add(tail)
-            elif tail not in priority_queue:
-                priority_queue.add(tail)
-
-            if tail.id == end:
-                del priority_queue[:]
-                break
-
-    path = []
-    current = nodes[end]
-    while current.parent_id != 0 and current.edge is not None:
-        path.append((current.parent, current.node, current.edge))
-        current = nodes[current.parent_id]
-
-    if path and current.id == begin:
-        path.reverse()
-        return Path(path, iterations)
-
-    return Path()
+            relaxations += 1
+            tail_cost = cost + edge.weight() + tail.weight()
+            if hooks is not None:
+                hooks.on_relax(current_id, tail_id, edge_id, tail_cost)
+            if tail_cost < costs.get(tail_id, _infinite_weight):
+                costs[tail_id] = tail_cost
+                parents[tail_id] = (current, tail, edge)
+                heuristics_cost = heuristics_costs.get(tail_id, None)
+                if heuristics_cost is None:
+                    if lower_bound is not None:
+                        heuristics_cost = lower_bound(landmarks.index(tail_id))
+                    elif position is not None:
+                        heuristics_cost = int(euclidean_distance(position(tail_id), finish_position))
+                    else:
+                        heuristics_cost = astar_heuristics(tail, finish)
+                    heuristics_costs[tail_id] = heuristics_cost
+                if heuristics_cost >= _infinite_weight:
+                    continue
+                priority_queue.push(tail_id, tail_cost + heuristics_cost)
+                pushes += 1
+                if hooks is not None:
+                    hooks.on_push(tail_id, tail_cost + heuristics_cost)
+
+    stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                 containers_size(costs, heuristics_costs, parents, visited_nodes) + peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if not found:
+        return stats.attach(Path())
+    return stats.attach(path_from_parents(parents, begin, end, iterations))
+
+
+def _astar_search_compact(begin, end, graph, queue_type, landmarks, coordinates, cancellation, hooks, stats):
+
+    global _infinite_weight
+
+    start = graph.index(begin)
+    finish = graph.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    offsets = graph.offsets()
+    targets = graph.targets()
+    edge_weights = graph.edge_weights()
+    node_weights = graph.node_weights()
+
+    n = graph.nodes_number()
+    position = coordinates_function(coordinates)
+    if position is not None:
+        finish_position = position(end)
+    xs, ys = graph.coordinates()
+    if xs is not None:
+        finish_x = xs[finish]
+        finish_y = ys[finish]
+    if landmarks is not None:
+        if landmarks.graph() is graph:
+            lower_bound = landmarks.heuristics(finish)
+        else:
+            landmarks_finish = landmarks.heuristics(landmarks.index(end))
+            lower_bound = lambda index: landmarks_finish(landmarks.index(graph.node_id(index)))
+    else:
+        lower_bound = None
+    heuristics_costs = {}
+    blocked_arcs = graph.blocked_arcs()
+    ids = graph.ids()
+    edge_ids = graph.edge_ids()
+
+    costs = [_infinite_weight] * n
+    parents = [-1] * n
+    parent_arcs = [-1] * n
+    visited_nodes = bytearray(n)
+    costs[start] = 0
+    priority_queue = create_priority_queue(queue_type)
+    priority_queue.push(start, 0)
+    iterations = 0
+    relaxations = 0
+    pushes = 1
+    peak_queue = 0
+    stats.lap('prepare')
+
+    while priority_queue:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        queue_size = len(priority_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        current, _ = priority_queue.pop()
+        visited_nodes[current] = 1
+        cost = costs[current]
+        if hooks is not None:
+            hooks.on_settle(ids[current], cost)
+        if current == finish:
+            break
+
+        for arc in range(offsets[current], offsets[current + 1]):
+
+            if blocked_arcs is not None and blocked_arcs[arc]:
+                continue
+
+            tail = targets[arc]
+            if visited_nodes[tail]:
+                continue
+
+            relaxations += 1
+            tail_cost = cost + edge_weights[arc] + node_weights[tail]
+            if hooks is not None:
+                hooks.on_relax(ids[current], ids[tail], edge_ids[arc], tail_cost)
+            if tail_cost < costs[tail]:
+                costs[tail] = tail_cost
+                parents[tail] = current
+                parent_arcs[tail] = arc
+                heuristics_cost = heuristics_costs.get(tail, None)
+                if heuristics_cost is None:
+                    if lower_bound is not None:
+                        heuristics_cost = lower_bound(tail)
+                    elif position is not None:
+                        heuristics_cost = int(euclidean_distance(position(graph.node_id(tail)), finish_position))
+                    elif xs is not None:
+                        heuristics_cost = int(hypot(xs[tail] - finish_x, ys[tail] - finish_y))
+                    else:
+                        heuristics_cost = 0
+                    heuristics_costs[tail] = heuristics_cost
+                if heuristics_cost >= _infinite_weight:
+                    continue
+                priority_queue.push(tail, tail_cost + heuristics_cost)
+                pushes += 1
+                if hooks is not None:
+                    hooks.on_push(ids[tail], tail_cost + heuristics_cost)
+
+    stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                 containers_size(costs, heuristics_costs, parents, parent_arcs, visited_nodes) +
+                 peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if not visited_nodes[finish]:
+        return stats.attach(Path())
+    return stats.attach(graph.path_from_parents(parents, parent_arcs, start, finish, iterations))
 
 #######################################################################################################################
 #######################################################################################################################
@@ -0,0 +1,265 @@
+# coding=utf-8
+# -----------------
+# file      : async_search.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+asyncio front-end for path searches.
+
+    searcher = AsyncSearch(graph)
+    path = await searcher.search(begin, end, 'dijkstra', timeout=0.5)
+
+Searches run in an executor over a CompactGraph snapshot taken at construction. Requests wait in a bounded
+admission queue (search() blocks while it is full), requests which are queued at the same time and share
+the source are answered by one Dijkstra's shortest path tree. A request that misses its deadline raises
+asyncio.TimeoutError, its search is stopped cooperatively as soon as nobody waits for it.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from .compact_graph import CompactGraph
+from .algorithms import search_algorithm
+from .graph import Path
+from .shortest_path_tree import shortest_path_tree
+from .cancellation import Cancellation, SearchCancelled
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class _Request(object):
+
+    def __init__(self, begin, end, algorithm, deadline, future):
+        object.__init__(self)
+        self.begin = begin
+        self.end = end
+        self.algorithm = algorithm
+        self.deadline = deadline
+        self.future = future
+        self.abandoned = False
+        self.batch = None
+
+
+class _Batch(object):
+
+    def __init__(self, requests):
+        object.__init__(self)
+        self.requests = requests
+        deadlines = [request.deadline for request in requests]
+        self.cancellation = Cancellation(None if None in deadlines else max(deadlines))
+
+    def abandon(self, request):
+        request.abandoned = True
+        if all(r.abandoned for r in self.requests):
+            self.cancellation.cancel()
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class AsyncSearch(object):
+
+    # "executor" must run functions in threads of this process (cancellation is shared memory),
+    # by default ThreadPoolExecutor with "max_running" threads is created.
+    # "max_pending" is size of the admission queue, "max_running" is number of batches calculated at the same time.
+
+    def __init__(self, graph, executor=None, max_pending=1024, max_running=4):
+        object.__init__(self)
+        self._graph = graph if isinstance(graph, CompactGraph) else CompactGraph(graph)
+        self._ownExecutor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(max_running)
+        self._maxPending = max_pending
+        self._maxRunning = max_running
+        self._queue = None
+        self._slots = None
+        self._dispatcher = None
+        self._running = set()
+        self._batched = 0
+
+    def graph(self):
+        return self._graph
+
+    def pending(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def batched(self):
+        # number of requests that were answered by a shortest path tree shared with other requests
+        return self._batched
+
+    async def search(self, begin, end, algorithm='dijkstra', deadline=None, timeout=None):
+
+        # "deadline" is a time.monotonic() value, "timeout" is in seconds, the earliest of them is used.
+
+        search_algorithm(algorithm)  # raises ValueError for unknown algorithms
+        if not isinstance(algorithm, str):
+            raise ValueError('algorithm must be specified by name')
+        if timeout is not None:
+            timeout_deadline = time.monotonic() + timeout
+            deadline = timeout_deadline if deadline is None else min(deadline, timeout_deadline)
+
+        self._start()
+        request = _Request(begin, end, algorithm, deadline, asyncio.get_running_loop().create_future())
+
+        try:
+            await asyncio.wait_for(self._queue.put(request), self._remaining(deadline))
+            return await asyncio.wait_for(asyncio.shield(request.future), self._remaining(deadline))
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            if request.batch is not None:
+                request.batch.abandon(request)
+            else:
+                request.abandoned = True
+            if request.future.done() and not request.future.cancelled():
+                request.future.exception()  # the batch may have failed at the same moment, mark it retrieved
+            raise
+
+    async def close(self):
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        while self._queue is not None and not self._queue.empty():
+            self._reject(self._queue.get_nowait())
+        for task in list(self._running):
+            await asyncio.gather(task, return_exceptions=True)
+        if self._ownExecutor:
+            self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _reject(request):
+        if request.future.done():
+            return
+        if request.abandoned:
+            request.future.cancel()
+        else:
+            request.future.set_exception(RuntimeError('search front-end is closed'))
+
+    @staticmethod
+    def _remaining(deadline):
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def _start(self):
+        if self._dispatcher is None:
+            self._queue = asyncio.Queue(self._maxPending)
+            self._slots = asyncio.Semaphore(self._maxRunning)
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        requests = []
+        try:
+            while True:
+                requests = []
+                await self._slots.acquire()
+                requests.append(await self._queue.get())
+                while not self._queue.empty():
+                    requests.append(self._queue.get_nowait())
+
+                # group requests: Dijkstra's requests by source, other ones by the whole query
+                groups = {}
+                for request in requests:
+                    if request.abandoned:
+                        continue
+                    if request.algorithm == 'dijkstra':
+                        key = (request.begin, request.algorithm)
+                    else:
+                        key = (request.begin, request.end, request.algorithm)
+                    groups.setdefault(key, []).append(request)
+
+                first = True
+                for group in groups.values():
+                    if not first:
+                        await self._slots.acquire()
+                    first = False
+                    batch = _Batch(group)
+                    for request in group:
+                        request.batch = batch
+                    task = loop.create_task(self._run(loop, batch))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+                if first:
+                    self._slots.release()
+        except asyncio.CancelledError:
+            # closed while waiting for a free slot: drained requests without a batch are never submitted
+            for request in requests:
+                if request.batch is None:
+                    self._reject(request)
+            raise
+
+    async def _run(self, loop, batch):
+        try:
+            results = await loop.run_in_executor(self._executor, self._calculate, batch)
+        except SearchCancelled:
+            results = None
+            error = asyncio.TimeoutError()
+        except Exception as exception:
+            results = None
+            error = exception
+        finally:
+            self._slots.release()
+
+        if results is not None and len(results) > 1:
+            self._batched += len(batch.requests)
+
+        for request in batch.requests:
+            if request.future.done():
+                continue
+            if request.abandoned:
+                request.future.cancel()
+                continue
+            if results is None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(results[request.end])
+
+    def _calculate(self, batch):
+        requests = batch.requests
+        cancellation = batch.cancellation
+        first = requests[0]
+
+        ends = set(request.end for request in requests)
+        if len(ends) == 1:
+            algorithm = search_algorithm(first.algorithm)
+            return {first.end: algorithm(first.begin, first.end, self._graph, cancellation=cancellation)}
+
+        tree = shortest_path_tree(first.begin, self._graph, targets=ends, cancellation=cancellation)
+        if tree is None:
+            return dict((end, Path()) for end in ends)
+        return dict((end, tree.path(end)) for end in ends)
+
+#######################################################################################################################
+#######################################################################################################################
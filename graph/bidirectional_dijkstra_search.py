@@ -0,0 +1,331 @@
+# coding=utf-8
+# -----------------
+# file      : bidirectional_dijkstra_search.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from .graph import Path
+from .compact_graph import CompactGraph
+from .priority_queue import create_priority_queue, QueueType
+from .search_stats import SearchStats, containers_size, queue_entry_size
+
+#######################################################################################################################
+#######################################################################################################################
+
+_infinite_weight = 1e28
+
+
+def bidirectional_dijkstra_search(begin, end, graph, queue_type=QueueType.BINARY_HEAP, cancellation=None,
+                                  hooks=None):
+
+    # Forward search settles nodes by cost from "begin", backward search settles nodes by cost to "end".
+    # Weight of a node is added when the path enters it (like in Path.total_weight()), so
+    # cost(begin -> v) includes weight of v and cost(v -> end) does not.
+    # Search stops as soon as sum of the last extracted keys of both queues reaches the best meeting cost.
+    # Hooks get costs of the corresponding direction, peak queue size is the sum of both queues.
+
+    global _infinite_weight
+
+    stats = SearchStats()
+
+    if not graph.may_reach(begin, end):
+        return stats.attach(Path())
+
+    if isinstance(graph, CompactGraph):
+        return _bidirectional_dijkstra_search_compact(begin, end, graph, queue_type, cancellation, hooks, stats)
+
+    start = graph.node(begin)
+    if start is None:
+        return stats.attach(Path())
+
+    finish = graph.node(end)
+    if finish is None or finish.id() == start.id():
+        return stats.attach(Path())
+
+    forward_costs = {begin: 0}
+    backward_costs = {end: 0}
+    forward_parents = {}
+    backward_parents = {}
+    forward_visited = set()
+    backward_visited = set()
+    forward_queue = create_priority_queue(queue_type)
+    backward_queue = create_priority_queue(queue_type)
+    forward_queue.push(begin, 0)
+    backward_queue.push(end, 0)
+    forward_key = 0
+    backward_key = 0
+    best_cost = _infinite_weight
+    meeting_id = 0
+    iterations = 0
+    relaxations = 0
+    pushes = 2
+    peak_queue = 0
+    stats.lap('prepare')
+
+    while forward_queue and backward_queue and forward_key + backward_key < best_cost:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        queue_size = len(forward_queue) + len(backward_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        if len(forward_queue) <= len(backward_queue):
+            current_id, forward_key = forward_queue.pop()
+            forward_visited.add(current_id)
+            if hooks is not None:
+                hooks.on_settle(current_id, forward_key)
+            current = graph.node(current_id)
+            edges = current.edges()
+            for edge_id in edges:
+                edge = graph.edge(edge_id)
+                if edge is None:
+                    continue
+                tail_id = edges[edge_id].tail()
+                if tail_id in forward_visited:
+                    continue
+                tail = graph.node(tail_id)
+                if tail is None:
+                    continue
+                relaxations += 1
+                tail_cost = forward_key + edge.weight() + tail.weight()
+                if hooks is not None:
+                    hooks.on_relax(current_id, tail_id, edge_id, tail_cost)
+                if tail_cost < forward_costs.get(tail_id, _infinite_weight):
+                    forward_costs[tail_id] = tail_cost
+                    forward_parents[tail_id] = (current, tail, edge)
+                    forward_queue.push(tail_id, tail_cost)
+                    pushes += 1
+                    if hooks is not None:
+                        hooks.on_push(tail_id, tail_cost)
+                    total_cost = tail_cost + backward_costs.get(tail_id, _infinite_weight)
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting_id = tail_id
+        else:
+            current_id, backward_key = backward_queue.pop()
+            backward_visited.add(current_id)
+            if hooks is not None:
+                hooks.on_settle(current_id, backward_key)
+            current = graph.node(current_id)
+            head_cost = backward_key + current.weight()
+            incoming = current.incoming_edges()
+            for edge_id in incoming:
+                edge = graph.edge(edge_id)
+                if edge is None:
+                    continue
+                head_id = incoming[edge_id].head()
+                if head_id in backward_visited:
+                    continue
+                head = graph.node(head_id)
+                if head is None:
+                    continue
+                relaxations += 1
+                cost = head_cost + edge.weight()
+                if hooks is not None:
+                    hooks.on_relax(head_id, current_id, edge_id, cost)
+                if cost < backward_costs.get(head_id, _infinite_weight):
+                    backward_costs[head_id] = cost
+                    backward_parents[head_id] = (head, current, edge)
+                    backward_queue.push(head_id, cost)
+                    pushes += 1
+                    if hooks is not None:
+                        hooks.on_push(head_id, cost)
+                    total_cost = cost + forward_costs.get(head_id, _infinite_weight)
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting_id = head_id
+
+    stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                 containers_size(forward_costs, backward_costs, forward_parents, backward_parents, forward_visited,
+                                 backward_visited) + peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if meeting_id == 0:
+        return stats.attach(Path())
+
+    path = []
+    current_id = meeting_id
+    while current_id != begin:
+        entry = forward_parents[current_id]
+        path.append(entry)
+        current_id = entry[0].id()
+    path.reverse()
+    current_id = meeting_id
+    while current_id != end:
+        entry = backward_parents[current_id]
+        path.append(entry)
+        current_id = entry[1].id()
+
+    return stats.attach(Path(path, iterations))
+
+
+def _bidirectional_dijkstra_search_compact(begin, end, graph, queue_type, cancellation, hooks, stats):
+
+    global _infinite_weight
+
+    start = graph.index(begin)
+    finish = graph.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    offsets = graph.offsets()
+    targets = graph.targets()
+    reverse_offsets = graph.reverse_offsets()
+    reverse_sources = graph.reverse_sources()
+    reverse_arcs = graph.reverse_arcs()
+    edge_weights = graph.edge_weights()
+    node_weights = graph.node_weights()
+    ids = graph.ids()
+    edge_ids = graph.edge_ids()
+
+    n = graph.nodes_number()
+    blocked_arcs = graph.blocked_arcs()
+    forward_costs = [_infinite_weight] * n
+    backward_costs = [_infinite_weight] * n
+    forward_parents = [-1] * n
+    forward_parent_arcs = [-1] * n
+    backward_parent_arcs = [-1] * n
+    forward_visited = bytearray(n)
+    backward_visited = bytearray(n)
+    forward_costs[start] = 0
+    backward_costs[finish] = 0
+    forward_queue = create_priority_queue(queue_type)
+    backward_queue = create_priority_queue(queue_type)
+    forward_queue.push(start, 0)
+    backward_queue.push(finish, 0)
+    forward_key = 0
+    backward_key = 0
+    best_cost = _infinite_weight
+    meeting = -1
+    iterations = 0
+    relaxations = 0
+    pushes = 2
+    peak_queue = 0
+    stats.lap('prepare')
+
+    while forward_queue and backward_queue and forward_key + backward_key < best_cost:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        queue_size = len(forward_queue) + len(backward_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        if len(forward_queue) <= len(backward_queue):
+            current, forward_key = forward_queue.pop()
+            forward_visited[current] = 1
+            if hooks is not None:
+                hooks.on_settle(ids[current], forward_key)
+            for arc in range(offsets[current], offsets[current + 1]):
+                if blocked_arcs is not None and blocked_arcs[arc]:
+                    continue
+                tail = targets[arc]
+                if forward_visited[tail]:
+                    continue
+                relaxations += 1
+                tail_cost = forward_key + edge_weights[arc] + node_weights[tail]
+                if hooks is not None:
+                    hooks.on_relax(ids[current], ids[tail], edge_ids[arc], tail_cost)
+                if tail_cost < forward_costs[tail]:
+                    forward_costs[tail] = tail_cost
+                    forward_parents[tail] = current
+                    forward_parent_arcs[tail] = arc
+                    forward_queue.push(tail, tail_cost)
+                    pushes += 1
+                    if hooks is not None:
+                        hooks.on_push(ids[tail], tail_cost)
+                    total_cost = tail_cost + backward_costs[tail]
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting = tail
+        else:
+            current, backward_key = backward_queue.pop()
+            backward_visited[current] = 1
+            if hooks is not None:
+                hooks.on_settle(ids[current], backward_key)
+            head_cost = backward_key + node_weights[current]
+            for i in range(reverse_offsets[current], reverse_offsets[current + 1]):
+                head = reverse_sources[i]
+                if backward_visited[head]:
+                    continue
+                arc = reverse_arcs[i]
+                if blocked_arcs is not None and blocked_arcs[arc]:
+                    continue
+                relaxations += 1
+                cost = head_cost + edge_weights[arc]
+                if hooks is not None:
+                    hooks.on_relax(ids[head], ids[current], edge_ids[arc], cost)
+                if cost < backward_costs[head]:
+                    backward_costs[head] = cost
+                    backward_parent_arcs[head] = arc
+                    backward_queue.push(head, cost)
+                    pushes += 1
+                    if hooks is not None:
+                        hooks.on_push(ids[head], cost)
+                    total_cost = cost + forward_costs[head]
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting = head
+
+    stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                 containers_size(forward_costs, backward_costs, forward_parents, forward_parent_arcs,
+                                 backward_parent_arcs, forward_visited, backward_visited) +
+                 peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if meeting < 0:
+        return stats.attach(Path())
+
+    arcs = []
+    current = meeting
+    while current != start:
+        head = forward_parents[current]
+        arcs.append((head, forward_parent_arcs[current]))
+        current = head
+    arcs.reverse()
+    current = meeting
+    while current != finish:
+        arc = backward_parent_arcs[current]
+        arcs.append((current, arc))
+        current = targets[arc]
+
+    return stats.attach(graph.make_path(arcs, iterations))
+
+#######################################################################################################################
+#######################################################################################################################
@@ -35,33 +35,60 @@ __version__ = '0.0.1'  # this is last application version when this script file
 __email__ = 'victor.zarubkin@gmail.com'
 ############################################################################
 
-from .graph import Path
+from array import array
+from collections import deque
+from .graph import Path, path_from_parents
+from .compact_graph import CompactGraph
+from .search_stats import SearchStats, containers_size, frontier_entry_size
 
 #######################################################################################################################
 #######################################################################################################################
 
 
-def breadth_first_search(begin, end, graph):
+def breadth_first_search(begin, end, graph, cancellation=None, hooks=None):
+
+    # Hooks get number of edges from "begin" as costs.
+
+    stats = SearchStats()
+
+    if not graph.may_reach(begin, end):
+        return stats.attach(Path())
+
+    if isinstance(graph, CompactGraph):
+        return _breadth_first_search_compact(begin, end, graph, cancellation, hooks, stats)
 
     start = graph.node(begin)
     if start is None:
-        return Path()
+        return stats.attach(Path())
 
     finish = graph.node(end)
     if finish is None or finish.id() == start.id():
-        return Path()
+        return stats.attach(Path())
 
-    visited_nodes = [start.id()]
-    path = []
-    queue = [start]
-    finish_found = False
+    parents = {}
+    levels = {begin: 0}
+    queue = deque([start])
     iterations = 0
+    relaxations = 0
+    peak_queue = 0
+    found = False
+    stats.lap('prepare')
 
-    while queue and not finish_found:
+    while queue:
 
         iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
 
-        current = queue.pop(0)
+        queue_size = len(queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        current = queue.popleft()
+        current_id = current.id()
+        level = levels[current_id] + 1
+        if hooks is not None:
+            hooks.on_settle(current_id, level - 1)
         edges = current.edges()
 
         for uid in edges:
@@ -70,44 +97,219 @@ def breadth_first_search(begin, end, graph):
             if edge is None:
                 continue
 
-            edge_info = edges[uid]
-            if edge_info.tail() in visited_nodes:
+            tail_id = edges[uid].tail()
+            if tail_id in levels:
                 continue
 
-            head = graph.node(edge_info.head())
-            tail = graph.node(edge_info.tail())
-            if head is None or tail is None:
+            tail = graph.node(tail_id)
+            if tail is None:
                 continue
 
-            path.append((current, tail, edge))
-            if tail.id() == finish.id():
-                finish_found = True
+            relaxations += 1
+            if hooks is not None:
+                hooks.on_relax(current_id, tail_id, uid, level)
+                hooks.on_push(tail_id, level)
+            parents[tail_id] = (current, tail, edge)
+            levels[tail_id] = level
+            if tail_id == end:
+                found = True
                 break
 
             queue.append(tail)
-            visited_nodes.append(tail.id())
 
-    if finish_found and path:
+        if found:
+            break
+
+    stats.record(iterations, relaxations, len(levels), iterations, peak_queue,
+                 containers_size(parents, levels, queue) + peak_queue * frontier_entry_size)
+    stats.lap('search')
+
+    if not found:
+        return stats.attach(Path())
+    return stats.attach(path_from_parents(parents, begin, end, iterations))
+
+
+def _breadth_first_search_compact(begin, end, graph, cancellation, hooks, stats):
+
+    start = graph.index(begin)
+    finish = graph.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    levels, parents, parent_arcs, iterations = compact_bfs(graph, start, finish, cancellation, hooks=hooks,
+                                                           stats=stats)
+    if levels[finish] < 0:
+        return stats.attach(Path())
+
+    return stats.attach(graph.path_from_parents(parents, parent_arcs, start, finish, iterations))
+
 
-        resulting_path = [path[-1]]
-        if len(path) > 1:
+def compact_bfs(graph, start, target=-1, cancellation=None, alpha=14, beta=24, hooks=None, stats=None):
 
-            prev_id = path[-1][0].id()
-            for i in range(-2, -(len(path) + 1), -1):
+    # Level-synchronous direction-optimizing BFS over CompactGraph node indices (Beamer et al.).
+    # Top-down step expands arcs of the frontier, bottom-up step looks for a parent in the frontier among
+    # predecessors of every unvisited node. Bottom-up is used while the frontier has more than 1/alpha of
+    # unexplored arcs and until the frontier shrinks below 1/beta of nodes.
+    # Returns hop levels (-1 for unreachable nodes), parent indices, parent arc positions and number of iterations.
+    # If "target" is given then the search stops after the level where it was reached.
+    # Every frontier node counts as settled (and popped), the peak queue size is the largest frontier.
 
-                head, tail, edge = path[i]
-                if tail.id() == prev_id:
+    offsets = graph.offsets()
+    targets = graph.targets()
+    blocked_arcs = graph.blocked_arcs()
+    ids = graph.ids()
+    edge_ids = graph.edge_ids()
 
-                    resulting_path.append(path[i])
-                    prev_id = head.id()
-                    if prev_id == start.id():
+    n = graph.nodes_number()
+    levels = array('q', [-1]) * n
+    parents = array('q', [-1]) * n
+    parent_arcs = array('q', [-1]) * n
+    levels[start] = 0
+    frontier = [start]
+    unexplored_arcs = graph.arcs_number() - (offsets[start + 1] - offsets[start])
+    bottom_up = False
+    level = 0
+    iterations = 0
+    relaxations = 0
+    settled = 0
+    peak_queue = 0
+    if stats is not None:
+        stats.lap('prepare')
+
+    while frontier:
+
+        settled += len(frontier)
+        if len(frontier) > peak_queue:
+            peak_queue = len(frontier)
+        if hooks is not None:
+            for current in frontier:
+                hooks.on_settle(ids[current], level)
+
+        if bottom_up:
+            bottom_up = len(frontier) * beta >= n
+        else:
+            frontier_arcs = 0
+            for current in frontier:
+                frontier_arcs += offsets[current + 1] - offsets[current]
+            bottom_up = frontier_arcs * alpha > unexplored_arcs
+
+        level += 1
+        next_frontier = []
+
+        if bottom_up:
+
+            reverse_offsets = graph.reverse_offsets()
+            reverse_sources = graph.reverse_sources()
+            reverse_arcs = graph.reverse_arcs()
+            in_frontier = bytearray(n)
+            for current in frontier:
+                in_frontier[current] = 1
+
+            for current in range(n):
+
+                if levels[current] >= 0:
+                    continue
+
+                iterations += 1
+                if cancellation is not None:
+                    cancellation.check(iterations)
+
+                for position in range(reverse_offsets[current], reverse_offsets[current + 1]):
+                    head = reverse_sources[position]
+                    if in_frontier[head]:
+                        if blocked_arcs is not None and blocked_arcs[reverse_arcs[position]]:
+                            continue
+                        relaxations += 1
+                        if hooks is not None:
+                            hooks.on_relax(ids[head], ids[current], edge_ids[reverse_arcs[position]], level)
+                            hooks.on_push(ids[current], level)
+                        levels[current] = level
+                        parents[current] = head
+                        parent_arcs[current] = reverse_arcs[position]
+                        next_frontier.append(current)
                         break
 
-            resulting_path.reverse()
+        else:
+
+            for current in frontier:
 
-        return Path(resulting_path, iterations)
+                iterations += 1
+                if cancellation is not None:
+                    cancellation.check(iterations)
+
+                for arc in range(offsets[current], offsets[current + 1]):
+                    tail = targets[arc]
+                    if levels[tail] < 0:
+                        if blocked_arcs is not None and blocked_arcs[arc]:
+                            continue
+                        relaxations += 1
+                        if hooks is not None:
+                            hooks.on_relax(ids[current], ids[tail], edge_ids[arc], level)
+                            hooks.on_push(ids[tail], level)
+                        levels[tail] = level
+                        parents[tail] = current
+                        parent_arcs[tail] = arc
+                        next_frontier.append(tail)
+
+        if target >= 0 and levels[target] >= 0:
+            break
+
+        for current in next_frontier:
+            unexplored_arcs -= offsets[current + 1] - offsets[current]
+        frontier = next_frontier
+
+    if stats is not None:
+        discovered = n - levels.count(-1)
+        stats.record(settled, relaxations, discovered, settled, peak_queue,
+                     containers_size(levels, parents, parent_arcs) + peak_queue * frontier_entry_size)
+        stats.lap('search')
+
+    return levels, parents, parent_arcs, iterations
+
+
+def hop_distances(begin, graph, cancellation=None):
+
+    # Returns {node id: number of edges on the shortest (by edge count) path from "begin"} for all reachable nodes.
+
+    if isinstance(graph, CompactGraph):
+        start = graph.index(begin)
+        if start < 0:
+            return {}
+        levels = compact_bfs(graph, start, cancellation=cancellation)[0]
+        ids = graph.ids()
+        return dict((ids[i], level) for i, level in enumerate(levels) if level >= 0)
+
+    start = graph.node(begin)
+    if start is None:
+        return {}
+
+    distances = {begin: 0}
+    queue = deque([start])
+    iterations = 0
+
+    while queue:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        current = queue.popleft()
+        level = distances[current.id()] + 1
+        edges = current.edges()
+
+        for uid in edges:
+            if graph.edge(uid) is None:
+                continue
+            tail_id = edges[uid].tail()
+            if tail_id in distances:
+                continue
+            tail = graph.node(tail_id)
+            if tail is None:
+                continue
+            distances[tail_id] = level
+            queue.append(tail)
 
-    return Path()
+    return distances
 
 #######################################################################################################################
 #######################################################################################################################
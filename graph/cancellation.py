@@ -0,0 +1,84 @@
+# coding=utf-8
+# -----------------
+# file      : cancellation.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Cooperative cancellation of searches.
+
+Search functions accept optional "cancellation" argument and call its check() every iteration,
+check() looks at the clock at the first iteration and then every check_interval iterations and raises SearchCancelled
+when the search was cancelled or its deadline has passed.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import time
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class Cancellation(object):
+
+    check_interval = 256  # must be a power of 2
+
+    def __init__(self, deadline=None):
+        # "deadline" is a time.monotonic() value or None
+        object.__init__(self)
+        self._deadline = deadline
+        self._cancelled = False
+
+    def deadline(self):
+        return self._deadline
+
+    def set_deadline(self, deadline):
+        self._deadline = deadline
+
+    def cancel(self):
+        self._cancelled = True
+
+    def cancelled(self):
+        if not self._cancelled and self._deadline is not None and time.monotonic() >= self._deadline:
+            self._cancelled = True
+        return self._cancelled
+
+    def check(self, iterations=0):
+        if (iterations - 1) & (self.check_interval - 1):
+            return
+        if self.cancelled():
+            raise SearchCancelled()
+
+#######################################################################################################################
+#######################################################################################################################
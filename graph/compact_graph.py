@@ -0,0 +1,280 @@
+# coding=utf-8
+# -----------------
+# file      : compact_graph.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Frozen compressed-sparse-row (CSR) snapshot of graph.graph.Graph.
+
+Nodes are renumbered into dense indices 0..n-1 (ordered by node id), outgoing arcs of node i are
+stored in targets[offsets[i]:offsets[i + 1]]. Every search function of this package accepts
+CompactGraph instead of Graph and returns the same Path.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from array import array
+from bisect import bisect_left
+from .graph import Path
+from .coordinates import coordinates_function, node_position
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _weights_array(values):
+    # keep integer weights integer (so Path.total_weight() is the same as for Graph), fall back to doubles otherwise
+    for value in values:
+        if not isinstance(value, int):
+            return array('d', values)
+    return array('q', values)
+
+
+def _typecode(values):
+    # "values" is an array or a memoryview
+    typecode = getattr(values, 'typecode', None)
+    if typecode is None:
+        typecode = values.format
+    return typecode
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class CompactGraph(object):
+
+    def __init__(self, graph, coordinates=None):
+        # node coordinates are taken from "coordinates" (see graph.coordinates) or from positions of node data items
+        object.__init__(self)
+
+        position = coordinates_function(coordinates)
+        ids = sorted(graph.nodes())
+        index = dict((uid, i) for i, uid in enumerate(ids))
+
+        node_weights = []
+        offsets = [0]
+        targets = []
+        edge_ids = []
+        edge_weights = []
+        xs = []
+        ys = []
+
+        for uid in ids:
+            node = graph.node(uid)
+            node_weights.append(node.weight())
+            edges = node.edges()
+            for edge_id in sorted(edges):
+                edge = graph.edge(edge_id)
+                if edge is None:
+                    continue
+                target = index.get(edges[edge_id].tail(), -1)
+                if target < 0:
+                    continue
+                targets.append(target)
+                edge_ids.append(edge_id)
+                edge_weights.append(edge.weight())
+            offsets.append(len(targets))
+            if xs is not None:
+                xy = position(uid) if position is not None else node_position(node)
+                if xy is None:
+                    xs = ys = None
+                else:
+                    xs.append(xy[0])
+                    ys.append(xy[1])
+
+        if xs is None or not ids:
+            xs = ys = None
+        self._assign(graph.version(), array('q', ids), _weights_array(node_weights), array('q', offsets),
+                     array('q', targets), array('q', edge_ids), _weights_array(edge_weights), len(set(edge_ids)),
+                     array('d', xs) if xs is not None else None, array('d', ys) if ys is not None else None)
+
+    @staticmethod
+    def from_arrays(version, ids, node_weights, offsets, targets, edge_ids, edge_weights, edges_number,
+                    xs=None, ys=None, reverse_offsets=None, reverse_sources=None, reverse_arcs=None):
+        # Wraps existing arrays without copying, any indexable sequences will do (arrays, memoryviews of
+        # shared memory or mmap). Arrays must not be modified while the snapshot is in use.
+        graph = CompactGraph.__new__(CompactGraph)
+        graph._assign(version, ids, node_weights, offsets, targets, edge_ids, edge_weights, edges_number, xs, ys)
+        if reverse_offsets is not None:
+            graph._reverse_offsets = reverse_offsets
+            graph._reverse_sources = reverse_sources
+            graph._reverse_arcs = reverse_arcs
+        return graph
+
+    def _assign(self, version, ids, node_weights, offsets, targets, edge_ids, edge_weights, edges_number, xs, ys):
+        self._version = version
+        self._ids = ids
+        self._node_weights = node_weights
+        self._offsets = offsets
+        self._targets = targets
+        self._edge_ids = edge_ids
+        self._edge_weights = edge_weights
+        self._edges_number = edges_number
+        self._xs = xs
+        self._ys = ys
+        self._reverse_offsets = None
+        self._reverse_sources = None
+        self._reverse_arcs = None
+        self._reachability = None
+
+    def __contains__(self, uid):
+        return self.index(uid) >= 0
+
+    def version(self):
+        # version of the source Graph at the moment of snapshot, compare with Graph.version() to check if it is stale
+        return self._version
+
+    def blocked_arcs(self):
+        # per arc mask of a subgraph view, non-zero for arcs which must be skipped by searches (see graph.subgraph)
+        return None
+
+    def reachability(self):
+        return self._reachability
+
+    def set_reachability(self, reachability):
+        # see Graph.set_reachability()
+        if reachability is not None and reachability.graph() is not self:
+            raise ValueError('reachability index was built for another graph')
+        self._reachability = reachability
+
+    def may_reach(self, begin, end):
+        reachability = self._reachability
+        return reachability is None or not reachability.valid() or not reachability.rejects(begin, end)
+
+    def nodes_number(self):
+        return len(self._ids)
+
+    def edges_number(self):
+        return self._edges_number
+
+    def arcs_number(self):
+        return len(self._targets)
+
+    def index(self, uid):
+        i = bisect_left(self._ids, uid)
+        if i < len(self._ids) and self._ids[i] == uid:
+            return i
+        return -1
+
+    def node_id(self, index):
+        return self._ids[index]
+
+    def ids(self):
+        return self._ids
+
+    def node_weights(self):
+        return self._node_weights
+
+    def offsets(self):
+        return self._offsets
+
+    def targets(self):
+        return self._targets
+
+    def edge_ids(self):
+        return self._edge_ids
+
+    def edge_weights(self):
+        return self._edge_weights
+
+    def reverse_offsets(self):
+        if self._reverse_offsets is None:
+            self._build_reverse()
+        return self._reverse_offsets
+
+    def reverse_sources(self):
+        if self._reverse_sources is None:
+            self._build_reverse()
+        return self._reverse_sources
+
+    def reverse_arcs(self):
+        # position of every incoming arc in targets(), edge_ids() and edge_weights() arrays
+        if self._reverse_arcs is None:
+            self._build_reverse()
+        return self._reverse_arcs
+
+    def integer_weights(self):
+        # True if both node and edge weights are stored as integers
+        return _typecode(self._node_weights) == 'q' and _typecode(self._edge_weights) == 'q'
+
+    def has_coordinates(self):
+        return self._xs is not None
+
+    def coordinates(self):
+        return self._xs, self._ys
+
+    def make_path(self, arcs, iterations=0):
+        # "arcs" is a sequence of (head index, arc position) pairs ordered from the first node to the last one
+        path = Path(iterations=iterations)
+        for head, arc in arcs:
+            tail = self._targets[arc]
+            path.append_arc(self._ids[head], self._ids[tail], self._edge_ids[arc], self._edge_weights[arc],
+                            self._node_weights[head], self._node_weights[tail])
+        return path
+
+    def path_from_parents(self, parents, parent_arcs, start, finish, iterations=0):
+        arcs = []
+        current = finish
+        while current != start:
+            arc = parent_arcs[current]
+            if arc < 0:
+                return Path()
+            head = parents[current]
+            arcs.append((head, arc))
+            current = head
+        if not arcs:
+            return Path()
+        arcs.reverse()
+        return self.make_path(arcs, iterations)
+
+    def _build_reverse(self):
+        n = len(self._ids)
+        offsets = self._offsets
+        targets = self._targets
+        reverse_offsets = [0] * (n + 1)
+        for target in targets:
+            reverse_offsets[target + 1] += 1
+        for i in range(n):
+            reverse_offsets[i + 1] += reverse_offsets[i]
+        positions = reverse_offsets[:-1]
+        sources = [0] * len(targets)
+        arcs = [0] * len(targets)
+        for source in range(n):
+            for arc in range(offsets[source], offsets[source + 1]):
+                target = targets[arc]
+                position = positions[target]
+                sources[position] = source
+                arcs[position] = arc
+                positions[target] = position + 1
+        self._reverse_offsets = array('q', reverse_offsets)
+        self._reverse_sources = array('q', sources)
+        self._reverse_arcs = array('q', arcs)
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,254 @@
+# coding=utf-8
+# -----------------
+# file      : condensation.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Strongly connected components and condensation DAG.
+
+Components are found by iterative Tarjan's algorithm (no recursion, so deep graphs do not hit recursion limit).
+Condensation numbers components in reverse topological order (every arc of the DAG leads from a greater component
+index to a lower one), so "end" can not be reached from "begin" if component of "begin" is lower than component
+of "end". For small condensations full transitive closure is kept as bit sets, then reachability is exact.
+
+    graph.set_reachability(Condensation(graph))  # searches reject impossible queries in O(1) from now on
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from array import array
+from .graph import ChangeKind
+from .compact_graph import CompactGraph
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _tarjan(offsets, targets, n):
+
+    # Returns component index of every node and number of components, components are numbered in order of
+    # completion which is reverse topological order of the condensation.
+
+    order = array('q', [-1]) * n
+    low = array('q', [0]) * n
+    components = array('q', [-1]) * n
+    on_stack = bytearray(n)
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(n):
+
+        if order[root] >= 0:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [[root, offsets[root]]]
+
+        while work:
+
+            entry = work[-1]
+            current, arc = entry
+            arc_end = offsets[current + 1]
+            descended = False
+
+            while arc < arc_end:
+                tail = targets[arc]
+                arc += 1
+                if order[tail] < 0:
+                    entry[1] = arc
+                    order[tail] = low[tail] = counter
+                    counter += 1
+                    stack.append(tail)
+                    on_stack[tail] = 1
+                    work.append([tail, offsets[tail]])
+                    descended = True
+                    break
+                if on_stack[tail] and order[tail] < low[current]:
+                    low[current] = order[tail]
+
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[current] < low[parent]:
+                    low[parent] = low[current]
+
+            if low[current] == order[current]:
+                while True:
+                    node = stack.pop()
+                    on_stack[node] = 0
+                    components[node] = count
+                    if node == current:
+                        break
+                count += 1
+
+    return components, count
+
+
+def strongly_connected_components(graph):
+    # Returns lists of node ids of strongly connected components in topological order of the condensation.
+    condensation = Condensation(graph, closure_limit=0)
+    return [list(condensation.members(c)) for c in condensation.topological_order()]
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class Condensation(object):
+
+    # "closure_limit" is maximum number of components for which transitive closure is calculated
+    # (it takes components number squared bits of memory).
+
+    def __init__(self, graph, closure_limit=4096):
+        object.__init__(self)
+        self._graph = graph
+        self._version = graph.version()
+        self._checkedVersion = self._version
+        self._stale = False
+
+        compact = graph if isinstance(graph, CompactGraph) else CompactGraph(graph)
+        offsets = compact.offsets()
+        targets = compact.targets()
+        ids = compact.ids()
+        n = compact.nodes_number()
+
+        components, count = _tarjan(offsets, targets, n)
+        self._count = count
+        self._components = dict((ids[i], components[i]) for i in range(n))
+
+        members = [[] for _ in range(count)]
+        successors = [set() for _ in range(count)]
+        for head in range(n):
+            component = components[head]
+            members[component].append(ids[head])
+            for arc in range(offsets[head], offsets[head + 1]):
+                tail_component = components[targets[arc]]
+                if tail_component != component:
+                    successors[component].add(tail_component)
+        self._members = [tuple(m) for m in members]
+        self._successors = [tuple(sorted(s)) for s in successors]
+
+        self._closure = None
+        if count <= closure_limit:
+            closure = []
+            for component in range(count):
+                reach = 1 << component
+                for successor in self._successors[component]:
+                    reach |= closure[successor]
+                closure.append(reach)
+            self._closure = closure
+
+    def graph(self):
+        return self._graph
+
+    def version(self):
+        return self._version
+
+    def components_number(self):
+        return self._count
+
+    def component(self, uid):
+        # component index of the node or -1
+        return self._components.get(uid, -1)
+
+    def members(self, component):
+        return self._members[component]
+
+    def successors(self, component):
+        # components directly reachable from given one in the condensation DAG
+        return self._successors[component]
+
+    def topological_order(self):
+        return range(self._count - 1, -1, -1)
+
+    def has_closure(self):
+        return self._closure is not None
+
+    def valid(self):
+        # Condensation stays valid while edges are only removed or changed without reconnection
+        # (removals can not make unreachable node reachable). New edges make it stale.
+        graph = self._graph
+        version = graph.version()
+        if not self._stale and version != self._checkedVersion:
+            changes = graph.changes_since(self._checkedVersion)
+            if changes is None:
+                self._stale = True
+            else:
+                for change in changes:
+                    if change.kind() == ChangeKind.STRUCTURE and change.edges() and not change.increase():
+                        self._stale = True
+                        break
+            self._checkedVersion = version
+        return not self._stale
+
+    def rejects(self, begin, end):
+        # O(1): True if "end" is certainly not reachable from "begin" (as of the moment of construction)
+        first = self._components.get(begin, -1)
+        second = self._components.get(end, -1)
+        if first < 0 or second < 0 or first == second:
+            return False
+        if first < second:
+            return True
+        if self._closure is not None:
+            return not (self._closure[first] >> second) & 1
+        return False
+
+    def reachable(self, begin, end):
+        # exact answer (as of the moment of construction), O(1) with closure, DFS over condensation DAG otherwise
+        first = self._components.get(begin, -1)
+        second = self._components.get(end, -1)
+        if first < 0 or second < 0:
+            return False
+        if first == second:
+            return True
+        if first < second:
+            return False
+        if self._closure is not None:
+            return bool((self._closure[first] >> second) & 1)
+        visited = set([first])
+        stack = [first]
+        while stack:
+            component = stack.pop()
+            for successor in self._successors[component]:
+                if successor == second:
+                    return True
+                if successor > second and successor not in visited:
+                    visited.add(successor)
+                    stack.append(successor)
+        return False
+
+#######################################################################################################################
+#######################################################################################################################
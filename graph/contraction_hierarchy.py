@@ -0,0 +1,408 @@
+# coding=utf-8
+# -----------------
+# file      : contraction_hierarchy.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Contraction Hierarchies: preprocessing of a graph into node ranks plus shortcut edges and
+fast point-to-point queries on the result.
+
+Weight of an arc u -> v is edge weight plus weight of v, so shortest paths (and Path.total_weight()) are
+the same as for dijkstra_search. Shortcuts remember the two arcs they replace and are unpacked into
+original edges when Path is built.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from array import array
+from heapq import heappush, heappop
+from .graph import Path
+from .compact_graph import CompactGraph, _weights_array
+from .priority_queue import create_priority_queue, QueueType
+from .search_stats import SearchStats, containers_size, queue_entry_size
+
+#######################################################################################################################
+#######################################################################################################################
+
+_infinite_weight = 1e28
+
+
+class ContractionHierarchy(object):
+
+    # maximum number of nodes settled by one witness search, if it is exceeded then shortcut is added anyway
+    witness_settle_limit = 500
+
+    def __init__(self, graph):
+        object.__init__(self)
+        self._graph = graph if isinstance(graph, CompactGraph) else CompactGraph(graph)
+
+        # pairs are arcs of the hierarchy: original arcs (arc >= 0) and shortcuts (made of pairs "first" and "second")
+        self._heads = []
+        self._tails = []
+        self._arcs = []
+        self._firsts = []
+        self._seconds = []
+        self._weights = []
+
+        n = self._graph.nodes_number()
+        self._out = [{} for _ in range(n)]
+        self._in = [{} for _ in range(n)]
+        self._ranks = [-1] * n
+        self._shortcuts_number = 0
+
+        self._load_arcs()
+        up, down = self._contract()
+        self._build_arrays(up, down)
+
+        self._out = None
+        self._in = None
+
+    def graph(self):
+        return self._graph
+
+    def version(self):
+        return self._graph.version()
+
+    def index(self, uid):
+        return self._graph.index(uid)
+
+    def nodes_number(self):
+        return self._graph.nodes_number()
+
+    def shortcuts_number(self):
+        return self._shortcuts_number
+
+    def ranks(self):
+        return self._ranks
+
+    def up_offsets(self):
+        return self._up_offsets
+
+    def up_targets(self):
+        return self._up_targets
+
+    def up_weights(self):
+        return self._up_weights
+
+    def up_pairs(self):
+        return self._up_pairs
+
+    def down_offsets(self):
+        return self._down_offsets
+
+    def down_sources(self):
+        return self._down_sources
+
+    def down_weights(self):
+        return self._down_weights
+
+    def down_pairs(self):
+        return self._down_pairs
+
+    def unpack(self, pair):
+        # returns list of (head index, original arc position) pairs
+        arcs = []
+        stack = [pair]
+        while stack:
+            pair = stack.pop()
+            arc = self._arcs[pair]
+            if arc >= 0:
+                arcs.append((self._heads[pair], arc))
+            else:
+                stack.append(self._seconds[pair])
+                stack.append(self._firsts[pair])
+        return arcs
+
+    def _add_pair(self, head, tail, weight, arc, first, second):
+        pair = len(self._heads)
+        self._heads.append(head)
+        self._tails.append(tail)
+        self._weights.append(weight)
+        self._arcs.append(arc)
+        self._firsts.append(first)
+        self._seconds.append(second)
+        self._out[head][tail] = (weight, pair)
+        self._in[tail][head] = (weight, pair)
+        return pair
+
+    def _load_arcs(self):
+        graph = self._graph
+        offsets = graph.offsets()
+        targets = graph.targets()
+        edge_weights = graph.edge_weights()
+        node_weights = graph.node_weights()
+        blocked_arcs = graph.blocked_arcs()
+        for head in range(graph.nodes_number()):
+            out = self._out[head]
+            for arc in range(offsets[head], offsets[head + 1]):
+                tail = targets[arc]
+                if tail == head or (blocked_arcs is not None and blocked_arcs[arc]):
+                    continue
+                weight = edge_weights[arc] + node_weights[tail]
+                existing = out.get(tail, None)
+                if existing is None or weight < existing[0]:
+                    self._add_pair(head, tail, weight, arc, -1, -1)
+
+    def _witness_costs(self, source, excluded, max_cost, targets):
+        out = self._out
+        costs = {source: 0}
+        heap = [(0, source)]
+        remaining = set(targets)
+        settled = 0
+        while heap:
+            cost, current = heappop(heap)
+            if cost > costs[current]:
+                continue
+            if cost > max_cost:
+                break
+            remaining.discard(current)
+            settled += 1
+            if not remaining or settled > self.witness_settle_limit:
+                break
+            for tail, (weight, _) in out[current].items():
+                if tail == excluded:
+                    continue
+                tail_cost = cost + weight
+                if tail_cost < costs.get(tail, _infinite_weight):
+                    costs[tail] = tail_cost
+                    heappush(heap, (tail_cost, tail))
+        return costs
+
+    def _shortcuts(self, node):
+        shortcuts = []
+        incoming = self._in[node]
+        outgoing = self._out[node]
+        if not incoming or not outgoing:
+            return shortcuts
+        max_out_weight = max(weight for weight, _ in outgoing.values())
+        for head, (head_weight, head_pair) in incoming.items():
+            targets = [tail for tail in outgoing if tail != head]
+            if not targets:
+                continue
+            costs = self._witness_costs(head, node, head_weight + max_out_weight, targets)
+            for tail in targets:
+                tail_weight, tail_pair = outgoing[tail]
+                weight = head_weight + tail_weight
+                if costs.get(tail, _infinite_weight) > weight:
+                    shortcuts.append((head, tail, weight, head_pair, tail_pair))
+        return shortcuts
+
+    def _priority(self, node, shortcuts, contracted_neighbours):
+        edge_difference = len(shortcuts) - len(self._in[node]) - len(self._out[node])
+        return edge_difference + contracted_neighbours[node]
+
+    def _contract(self):
+        n = self._graph.nodes_number()
+        contracted_neighbours = [0] * n
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+
+        heap = [(self._priority(node, self._shortcuts(node), contracted_neighbours), node) for node in range(n)]
+        heap.sort()
+
+        # lazy updates: priority of extracted node is recalculated and the node is put back
+        # if it is not the minimum anymore
+        rank = 0
+        while heap:
+            _, node = heappop(heap)
+            shortcuts = self._shortcuts(node)
+            priority = self._priority(node, shortcuts, contracted_neighbours)
+            if heap and priority > heap[0][0]:
+                heappush(heap, (priority, node))
+                continue
+
+            self._ranks[node] = rank
+            rank += 1
+
+            for tail, (weight, pair) in self._out[node].items():
+                up[node].append((tail, weight, pair))
+                del self._in[tail][node]
+                contracted_neighbours[tail] += 1
+            for head, (weight, pair) in self._in[node].items():
+                down[node].append((head, weight, pair))
+                del self._out[head][node]
+                contracted_neighbours[head] += 1
+            self._out[node] = {}
+            self._in[node] = {}
+
+            for head, tail, weight, first, second in shortcuts:
+                existing = self._out[head].get(tail, None)
+                if existing is None or weight < existing[0]:
+                    self._add_pair(head, tail, weight, -1, first, second)
+                    self._shortcuts_number += 1
+
+        return up, down
+
+    def _build_arrays(self, up, down):
+        self._up_offsets, self._up_targets, self._up_weights, self._up_pairs = self._csr(up)
+        self._down_offsets, self._down_sources, self._down_weights, self._down_pairs = self._csr(down)
+        self._heads = array('q', self._heads)
+        self._tails = array('q', self._tails)
+        self._arcs = array('q', self._arcs)
+        self._firsts = array('q', self._firsts)
+        self._seconds = array('q', self._seconds)
+        self._weights = _weights_array(self._weights)
+        self._ranks = array('q', self._ranks)
+
+    @staticmethod
+    def _csr(adjacency):
+        offsets = [0]
+        nodes = []
+        weights = []
+        pairs = []
+        for arcs in adjacency:
+            for node, weight, pair in arcs:
+                nodes.append(node)
+                weights.append(weight)
+                pairs.append(pair)
+            offsets.append(len(nodes))
+        return array('q', offsets), array('q', nodes), _weights_array(weights), array('q', pairs)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def contraction_hierarchy_search(begin, end, hierarchy, queue_type=QueueType.BINARY_HEAP):
+
+    # "hierarchy" takes the place of "graph" of other searches, queries are checked against hierarchy.graph()
+    # (the snapshot the hierarchy was built for) first, so its reachability index and blocked nodes apply.
+
+    global _infinite_weight
+
+    stats = SearchStats()
+    if not hierarchy.graph().may_reach(begin, end):
+        return stats.attach(Path())
+
+    start = hierarchy.index(begin)
+    finish = hierarchy.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    up_offsets = hierarchy.up_offsets()
+    up_targets = hierarchy.up_targets()
+    up_weights = hierarchy.up_weights()
+    up_pairs = hierarchy.up_pairs()
+    down_offsets = hierarchy.down_offsets()
+    down_sources = hierarchy.down_sources()
+    down_weights = hierarchy.down_weights()
+    down_pairs = hierarchy.down_pairs()
+
+    forward_costs = {start: 0}
+    backward_costs = {finish: 0}
+    forward_parents = {}
+    backward_parents = {}
+    forward_queue = create_priority_queue(queue_type)
+    backward_queue = create_priority_queue(queue_type)
+    forward_queue.push(start, 0)
+    backward_queue.push(finish, 0)
+    best_cost = _infinite_weight
+    meeting = -1
+    iterations = 0
+    settled = 0
+    relaxations = 0
+    pushes = 2
+    peak_queue = 0
+    stats.lap('prepare')
+
+    # Both searches go upwards in the hierarchy only. Each of them stops when its minimum key
+    # is not less than the best meeting cost found so far.
+    while forward_queue or backward_queue:
+
+        iterations += 1
+        queue_size = len(forward_queue) + len(backward_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        if forward_queue and (not backward_queue or len(forward_queue) <= len(backward_queue)):
+            current, cost = forward_queue.pop()
+            if cost >= best_cost:
+                forward_queue.clear()
+                continue
+            settled += 1
+            for i in range(up_offsets[current], up_offsets[current + 1]):
+                tail = up_targets[i]
+                tail_cost = cost + up_weights[i]
+                relaxations += 1
+                if tail_cost < forward_costs.get(tail, _infinite_weight):
+                    forward_costs[tail] = tail_cost
+                    forward_parents[tail] = (current, up_pairs[i])
+                    forward_queue.push(tail, tail_cost)
+                    pushes += 1
+                    total_cost = tail_cost + backward_costs.get(tail, _infinite_weight)
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting = tail
+        else:
+            current, cost = backward_queue.pop()
+            if cost >= best_cost:
+                backward_queue.clear()
+                continue
+            settled += 1
+            for i in range(down_offsets[current], down_offsets[current + 1]):
+                head = down_sources[i]
+                head_cost = cost + down_weights[i]
+                relaxations += 1
+                if head_cost < backward_costs.get(head, _infinite_weight):
+                    backward_costs[head] = head_cost
+                    backward_parents[head] = (current, down_pairs[i])
+                    backward_queue.push(head, head_cost)
+                    pushes += 1
+                    total_cost = head_cost + forward_costs.get(head, _infinite_weight)
+                    if total_cost < best_cost:
+                        best_cost = total_cost
+                        meeting = head
+
+    stats.record(settled, relaxations, pushes, iterations, peak_queue,
+                 containers_size(forward_costs, backward_costs, forward_parents, backward_parents) +
+                 peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if meeting < 0:
+        return stats.attach(Path())
+
+    pairs = []
+    current = meeting
+    while current != start:
+        current, pair = forward_parents[current]
+        pairs.append(pair)
+    pairs.reverse()
+    current = meeting
+    while current != finish:
+        current, pair = backward_parents[current]
+        pairs.append(pair)
+
+    arcs = []
+    for pair in pairs:
+        arcs.extend(hierarchy.unpack(pair))
+
+    return stats.attach(hierarchy.graph().make_path(arcs, iterations))
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,72 @@
+# coding=utf-8
+# -----------------
+# file      : coordinates.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Node coordinates for geometric A* heuristics without any GUI dependencies.
+
+Coordinates may be given as:
+ - function node_id -> (x, y);
+ - mapping node_id -> (x, y);
+ - pair of sequences (xs, ys) indexed by node id.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from math import hypot
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def coordinates_function(coordinates):
+    if coordinates is None or callable(coordinates):
+        return coordinates
+    if hasattr(coordinates, 'keys'):
+        return coordinates.__getitem__
+    xs, ys = coordinates
+    return lambda uid: (xs[uid], ys[uid])
+
+
+def node_position(node):
+    # position of a node which data is a graphical item (anything having pos() with x() and y(), e.g. QGraphicsItem)
+    data = node.data()
+    if data is None or not hasattr(data, 'pos'):
+        return None
+    pos = data.pos()
+    return pos.x(), pos.y()
+
+
+def euclidean_distance(first, second):
+    return hypot(first[0] - second[0], first[1] - second[1])
+
+#######################################################################################################################
+#######################################################################################################################
@@ -36,6 +36,8 @@ __email__ = 'victor.zarubkin@gmail.com'
 ############################################################################
 
 from .graph import Path
+from .compact_graph import CompactGraph
+from .search_stats import SearchStats, containers_size, stack_entry_size, compact_stack_entry_size
 
 #######################################################################################################################
 #######################################################################################################################
@@ -49,24 +51,42 @@ class _StackEntry(object):
         self.keys = it
 
 
-def depth_first_search(begin, end, graph):
+def depth_first_search(begin, end, graph, cancellation=None, hooks=None):
+
+    # Hooks get depth of the node in the stack as costs, a node is settled when it is pushed to the stack.
+
+    stats = SearchStats()
+
+    if not graph.may_reach(begin, end):
+        return stats.attach(Path())
+
+    if isinstance(graph, CompactGraph):
+        return _depth_first_search_compact(begin, end, graph, cancellation, hooks, stats)
 
     start = graph.node(begin)
     if start is None:
-        return Path()
+        return stats.attach(Path())
 
     finish = graph.node(end)
     if finish is None or finish.id() == start.id():
-        return Path()
+        return stats.attach(Path())
 
     visited_nodes = [start.id()]
     path = []
     stack = [_StackEntry(start, iter(start.edges()))]
     iterations = 0
+    pops = 0
+    peak_queue = 1
+    found = False
+    if hooks is not None:
+        hooks.on_settle(begin, 0)
+    stats.lap('prepare')
 
     while stack:
 
         iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
 
         go_next = False
         current = stack[-1]
@@ -89,22 +109,121 @@ def depth_first_search(begin, end, graph):
 
             entry = (head, tail, edge)
             path.append(entry)
+            if hooks is not None:
+                hooks.on_relax(head.id(), tail.id(), uid, len(path))
+                hooks.on_push(tail.id(), len(path))
+                hooks.on_settle(tail.id(), len(path))
             if tail.id() == finish.id():
-                return Path(path, iterations)
+                found = True
+                break
 
             go_next = True
             stack.append(_StackEntry(tail, iter(tail.edges())))
             visited_nodes.append(tail.id())
+            if len(stack) > peak_queue:
+                peak_queue = len(stack)
+            break
+
+        if found:
             break
 
         if not go_next:
             stack.pop()
+            pops += 1
             try:
                 path.pop()
             except IndexError:
                 pass
 
-    return Path()
+    pushes = len(visited_nodes)
+    stats.record(pushes + found, pushes - 1 + found, pushes, pops, peak_queue,
+                 containers_size(visited_nodes, path, stack) + peak_queue * stack_entry_size)
+    stats.lap('search')
+
+    if not found:
+        return stats.attach(Path())
+    return stats.attach(Path(path, iterations))
+
+
+def _depth_first_search_compact(begin, end, graph, cancellation, hooks, stats):
+
+    start = graph.index(begin)
+    finish = graph.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    offsets = graph.offsets()
+    targets = graph.targets()
+
+    blocked_arcs = graph.blocked_arcs()
+    ids = graph.ids()
+    edge_ids = graph.edge_ids()
+    visited_nodes = bytearray(graph.nodes_number())
+    visited_nodes[start] = 1
+    path = []
+    stack = [[start, offsets[start]]]
+    iterations = 0
+    pushes = 1
+    pops = 0
+    peak_queue = 1
+    found = False
+    if hooks is not None:
+        hooks.on_settle(begin, 0)
+    stats.lap('prepare')
+
+    while stack:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        go_next = False
+        current = stack[-1]
+        node, arc = current
+        arc_end = offsets[node + 1]
+
+        while arc < arc_end:
+
+            tail = targets[arc]
+            arc += 1
+            if visited_nodes[tail] or (blocked_arcs is not None and blocked_arcs[arc - 1]):
+                continue
+
+            current[1] = arc
+            path.append((node, arc - 1))
+            if hooks is not None:
+                hooks.on_relax(ids[node], ids[tail], edge_ids[arc - 1], len(path))
+                hooks.on_push(ids[tail], len(path))
+                hooks.on_settle(ids[tail], len(path))
+            if tail == finish:
+                found = True
+                break
+
+            go_next = True
+            stack.append([tail, offsets[tail]])
+            visited_nodes[tail] = 1
+            pushes += 1
+            if len(stack) > peak_queue:
+                peak_queue = len(stack)
+            break
+
+        if found:
+            break
+
+        if not go_next:
+            stack.pop()
+            pops += 1
+            if path:
+                path.pop()
+
+    stats.record(pushes + found, pushes - 1 + found, pushes, pops, peak_queue,
+                 containers_size(visited_nodes, path, stack) +
+                 peak_queue * compact_stack_entry_size)
+    stats.lap('search')
+
+    if not found:
+        return stats.attach(Path())
+    return stats.attach(graph.make_path(path, iterations))
 
 #######################################################################################################################
 #######################################################################################################################
@@ -35,8 +35,10 @@ __version__ = '0.0.1'  # this is last application version when this script file
 __email__ = 'victor.zarubkin@gmail.com'
 ############################################################################
 
-from .graph import Path
-from sortedcontainers.sortedlistwithkey import SortedListWithKey as sortedList
+from .graph import path_from_parents, Path
+from .compact_graph import CompactGraph
+from .priority_queue import create_priority_queue, QueueType
+from .search_stats import SearchStats, containers_size, queue_entry_size
 
 #######################################################################################################################
 #######################################################################################################################
@@ -44,58 +46,58 @@ from sortedcontainers.sortedlistwithkey import SortedListWithKey as sortedList
 _infinite_weight = 1e28
 
 
-class _DijkstraNode(object):
+def dijkstra_search(begin, end, graph, queue_type=QueueType.BINARY_HEAP, cancellation=None, hooks=None):
 
-    def __init__(self, node, cost, parent, edge):
-        object.__init__(self)
-        self.id = node.id()
-        self.parent_id = parent.id() if parent is not None else 0
-        self.node = node
-        self.parent = parent
-        self.edge = edge
-        self.cost = cost
-
-    def __lt__(self, other):
-        return self.cost < other.cost
+    global _infinite_weight
 
-    def __eq__(self, other):
-        return self.id == other.id
+    stats = SearchStats()
 
+    if not graph.may_reach(begin, end):
+        return stats.attach(Path())
 
-def dijkstra_search(begin, end, graph):
-
-    global _infinite_weight
+    if isinstance(graph, CompactGraph):
+        return _dijkstra_search_compact(begin, end, graph, queue_type, cancellation, hooks, stats)
 
     start = graph.node(begin)
     if start is None:
-        return Path()
+        return stats.attach(Path())
 
     finish = graph.node(end)
     if finish is None or finish.id() == start.id():
-        return Path()
-
-    nodes = {}
-    for node_id in graph.nodes():
-        node = graph.node(node_id)
-        cost = 0 if node_id == begin else _infinite_weight
-        nodes[node_id] = _DijkstraNode(node, cost, None, None)
+        return stats.attach(Path())
 
-    visited_nodes = []
-    priority_queue = sortedList([nodes[start.id()]], key=lambda x: x.cost, load=len(nodes))
+    costs = {begin: 0}
+    parents = {}
+    visited_nodes = set()
+    priority_queue = create_priority_queue(queue_type)
+    priority_queue.push(begin, 0)
     iterations = 0
-
-    # "resulting_cost" is used to reduce total number of visited nodes.
-    # Explanation: when you have already found target node you can check if other search paths are shorter than
-    # the found one, and if not then there is no need to explore such path further.
-    resulting_cost = _infinite_weight
+    relaxations = 0
+    pushes = 1
+    peak_queue = 0
+    found = False
+    stats.lap('prepare')
 
     while priority_queue:
 
         iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        queue_size = len(priority_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
 
-        current = priority_queue.pop(0)
-        visited_nodes.append(current.id)
-        edges = current.node.edges()
+        current_id, cost = priority_queue.pop()
+        visited_nodes.add(current_id)
+        if hooks is not None:
+            hooks.on_settle(current_id, cost)
+        if current_id == end:
+            found = True
+            break
+
+        current = graph.node(current_id)
+        edges = current.edges()
 
         for edge_id in edges:
 
@@ -103,40 +105,138 @@ def dijkstra_search(begin, end, graph):
             if edge is None:
                 continue
 
-            edge_info = edges[edge_id]
-            if edge_info.tail() in visited_nodes:
+            tail_id = edges[edge_id].tail()
+            if tail_id in visited_nodes:
                 continue
 
-            tail = nodes.get(edge_info.tail(), None)
+            tail = graph.node(tail_id)
             if tail is None:
                 continue
 
-            cost = current.cost + edge.weight() + tail.node.weight()
-            if tail.id == end:
-                resulting_cost = min(cost, resulting_cost)
-
-            if cost < tail.cost:
-                tail.cost = cost
-                tail.parent_id = current.id
-                tail.parent = current.node
-                tail.edge = edge
-                priority_queue.discard(tail)
-                if cost < resulting_cost:
-                    priority_queue.add(tail)
-            elif cost < resulting_cost and tail not in priority_queue:
-                priority_queue.add(tail)
-
-    path = []
-    current = nodes[end]
-    while current.parent_id != 0 and current.edge is not None:
-        path.append((current.parent, current.node, current.edge))
-        current = nodes[current.parent_id]
-
-    if path and current.id == begin:
-        path.reverse()
-        return Path(path, iterations)
-
-    return Path()
+            relaxations += 1
+            tail_cost = cost + edge.weight() + tail.weight()
+            if hooks is not None:
+                hooks.on_relax(current_id, tail_id, edge_id, tail_cost)
+            if tail_cost < costs.get(tail_id, _infinite_weight):
+                costs[tail_id] = tail_cost
+                parents[tail_id] = (current, tail, edge)
+                priority_queue.push(tail_id, tail_cost)
+                pushes += 1
+                if hooks is not None:
+                    hooks.on_push(tail_id, tail_cost)
+
+    stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                 containers_size(costs, parents, visited_nodes) + peak_queue * queue_entry_size)
+    stats.lap('search')
+
+    if not found:
+        return stats.attach(Path())
+    return stats.attach(path_from_parents(parents, begin, end, iterations))
+
+
+def _dijkstra_search_compact(begin, end, graph, queue_type, cancellation, hooks, stats):
+
+    start = graph.index(begin)
+    finish = graph.index(end)
+    if start < 0 or finish < 0 or start == finish:
+        return stats.attach(Path())
+
+    _, parents, parent_arcs, visited_nodes, iterations = compact_dijkstra(graph, start, (finish,), queue_type,
+                                                                         cancellation, hooks, stats)
+    if not visited_nodes[finish]:
+        return stats.attach(Path())
+
+    return stats.attach(graph.path_from_parents(parents, parent_arcs, start, finish, iterations))
+
+
+def compact_dijkstra(graph, start, targets=None, queue_type=QueueType.BINARY_HEAP, cancellation=None, hooks=None,
+                     stats=None):
+
+    # Dijkstra's search over CompactGraph node indices from "start" to all nodes or until all "targets" are settled.
+    # Returns costs, parent indices, parent arc positions and settled flags of nodes plus number of iterations.
+    # Counters are recorded to "stats" (SearchStats) if it is given, hooks get node and edge ids.
+
+    global _infinite_weight
+
+    offsets = graph.offsets()
+    arc_targets = graph.targets()
+    edge_weights = graph.edge_weights()
+    node_weights = graph.node_weights()
+    blocked_arcs = graph.blocked_arcs()
+    ids = graph.ids()
+    edge_ids = graph.edge_ids()
+
+    n = graph.nodes_number()
+    costs = [_infinite_weight] * n
+    parents = [-1] * n
+    parent_arcs = [-1] * n
+    visited_nodes = bytearray(n)
+    costs[start] = 0
+    priority_queue = create_priority_queue(queue_type)
+    priority_queue.push(start, 0)
+    iterations = 0
+    relaxations = 0
+    pushes = 1
+    peak_queue = 0
+
+    wanted = bytearray(n)
+    remaining = -1
+    if targets is not None:
+        for target in targets:
+            wanted[target] = 1
+        remaining = sum(wanted)
+
+    if stats is not None:
+        stats.lap('prepare')
+
+    while priority_queue:
+
+        iterations += 1
+        if cancellation is not None:
+            cancellation.check(iterations)
+
+        queue_size = len(priority_queue)
+        if queue_size > peak_queue:
+            peak_queue = queue_size
+
+        current, cost = priority_queue.pop()
+        visited_nodes[current] = 1
+        if hooks is not None:
+            hooks.on_settle(ids[current], cost)
+        if wanted[current]:
+            remaining -= 1
+            if remaining == 0:
+                break
+
+        for arc in range(offsets[current], offsets[current + 1]):
+
+            if blocked_arcs is not None and blocked_arcs[arc]:
+                continue
+
+            tail = arc_targets[arc]
+            if visited_nodes[tail]:
+                continue
+
+            relaxations += 1
+            tail_cost = cost + edge_weights[arc] + node_weights[tail]
+            if hooks is not None:
+                hooks.on_relax(ids[current], ids[tail], edge_ids[arc], tail_cost)
+            if tail_cost < costs[tail]:
+                costs[tail] = tail_cost
+                parents[tail] = current
+                parent_arcs[tail] = arc
+                priority_queue.push(tail, tail_cost)
+                pushes += 1
+                if hooks is not None:
+                    hooks.on_push(ids[tail], tail_cost)
+
+    if stats is not None:
+        stats.record(iterations, relaxations, pushes, iterations, peak_queue,
+                     containers_size(costs, parents, parent_arcs, visited_nodes, wanted) +
+                     peak_queue * queue_entry_size)
+        stats.lap('search')
+
+    return costs, parents, parent_arcs, visited_nodes, iterations
 
 #######################################################################################################################
 #######################################################################################################################
@@ -0,0 +1,185 @@
+# coding=utf-8
+# -----------------
+# file      : distance_matrix.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Many-to-many distances: one one-to-all Dijkstra's search per source, sources are spread over
+a multiprocessing pool.
+
+The graph snapshot (CompactGraph) and target list are handed to every worker process once: with "fork"
+start method workers simply inherit them, otherwise they are passed to the pool initializer,
+so tasks carry only a source index.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import multiprocessing
+from array import array
+from .graph import Path
+from .compact_graph import CompactGraph
+from .priority_queue import QueueType
+from .shortest_path_tree import ShortestPathTree, tree_arrays
+
+#######################################################################################################################
+#######################################################################################################################
+
+_infinity = float('inf')
+
+# (graph, target indices, queue type, keep trees) of the current worker process
+_shared = None
+
+
+def _initialize_worker(shared):
+    global _shared
+    if shared is not None:
+        _shared = shared
+
+
+def _row(start):
+    graph, targets, queue_type, keep_trees = _shared
+    if start < 0:
+        return array('d', [_infinity] * len(targets)), None
+
+    wanted = sorted(set(target for target in targets if target >= 0))
+    costs, parents, parent_arcs, iterations = tree_arrays(graph, start, wanted, queue_type)
+
+    start_weight = graph.node_weights()[start]
+    row = array('d')
+    for target in targets:
+        if target < 0:
+            row.append(_infinity)
+        elif target == start:
+            row.append(0)
+        elif parent_arcs[target] < 0:
+            row.append(_infinity)
+        else:
+            row.append(costs[target] + start_weight)
+
+    if keep_trees:
+        return row, (costs, parents, parent_arcs, iterations)
+    return row, None
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class DistanceMatrix(object):
+
+    # distance(source, target) is the same as Path.total_weight() of the shortest path, unreachable is infinity
+
+    def __init__(self, graph, sources, targets, rows, trees=None):
+        object.__init__(self)
+        self._graph = graph
+        self._sources = list(sources)
+        self._targets = list(targets)
+        self._sourceIndices = dict((uid, i) for i, uid in enumerate(self._sources))
+        self._targetIndices = dict((uid, i) for i, uid in enumerate(self._targets))
+        self._rows = rows
+        self._trees = trees
+
+    def sources(self):
+        return self._sources
+
+    def targets(self):
+        return self._targets
+
+    def rows(self):
+        return self._rows
+
+    def row(self, source):
+        return self._rows[self._sourceIndices[source]]
+
+    def distance(self, source, target):
+        return self._rows[self._sourceIndices[source]][self._targetIndices[target]]
+
+    def tree(self, source):
+        # ShortestPathTree of the source if the matrix was calculated with paths, None otherwise
+        if self._trees is None:
+            return None
+        return self._trees[self._sourceIndices[source]]
+
+    def path(self, source, target):
+        tree = self.tree(source)
+        if tree is None:
+            return Path()
+        return tree.path(target)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def distance_matrix(sources, targets, graph, processes=None, with_paths=False, queue_type=QueueType.BINARY_HEAP,
+                    chunksize=1):
+
+    # "processes" is number of worker processes (None means number of CPUs, 1 means calculate in this process).
+    # If "with_paths" is True then shortest path trees of all sources are kept for DistanceMatrix.path().
+
+    global _shared
+
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph(graph)
+
+    source_indices = [graph.index(uid) for uid in sources]
+    target_indices = [graph.index(uid) for uid in targets]
+    shared = (graph, target_indices, queue_type, with_paths)
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1, min(processes, len(source_indices)))
+
+    previous = _shared
+    _shared = shared
+    try:
+        if processes == 1:
+            results = [_row(start) for start in source_indices]
+        else:
+            context = multiprocessing.get_context()
+            inherited = context.get_start_method() == 'fork'
+            pool = context.Pool(processes, _initialize_worker, (None if inherited else shared,))
+            try:
+                results = list(pool.imap(_row, source_indices, chunksize))
+            finally:
+                pool.close()
+                pool.join()
+    finally:
+        _shared = previous
+
+    rows = [row for row, _ in results]
+    trees = None
+    if with_paths:
+        trees = []
+        for start, (_, tree) in zip(source_indices, results):
+            trees.append(ShortestPathTree(graph, start, *tree) if tree is not None else None)
+
+    return DistanceMatrix(graph, sources, targets, rows, trees)
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,258 @@
+# coding=utf-8
+# -----------------
+# file      : dstar_lite.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Incremental replanning with D* Lite (Koenig, Likhachev).
+
+The planner searches backwards from the goal and keeps its search state between queries, so when weights
+or enabled flags of nodes and edges change (or the start moves) only the affected part of the graph is
+searched again. Changes are taken from Graph.changes_since() automatically; update_node() and update_edge()
+may be used to report changes made to items which are not owned by a Graph.
+
+Costs are compared together with the number of arcs, so zero weights (and zero weight cycles) are allowed
+and the path with fewer arcs is returned among paths of the same total weight.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from .graph import Path
+from .coordinates import coordinates_function, euclidean_distance
+from .priority_queue import BinaryHeap
+
+#######################################################################################################################
+#######################################################################################################################
+
+_infinity = float('inf')
+_unreachable = (_infinity, 0)
+
+
+class DStarLitePlanner(object):
+
+    def __init__(self, graph, begin, end, coordinates=None):
+        object.__init__(self)
+        self._graph = graph
+        self._start = begin
+        self._last = begin
+        self._goal = end
+        self._position = coordinates_function(coordinates)
+        self._iterations = 0
+        self._reset()
+
+    def start(self):
+        return self._start
+
+    def goal(self):
+        return self._goal
+
+    def iterations(self):
+        # total number of nodes expanded by this planner
+        return self._iterations
+
+    def move_start(self, begin):
+        self._synchronize()
+        self._km += self._heuristics(self._last, begin)
+        self._last = begin
+        self._start = begin
+
+    def update_node(self, uid):
+        # weight or state of the node has changed: costs of all edges entering it have changed
+        for head_id in self._predecessors(uid):
+            self._update_rhs(head_id)
+
+    def update_edge(self, uid):
+        edge = self._graph.edge(uid)
+        if edge is not None:
+            for node in (edge.head(), edge.tail()):
+                if node is not None:
+                    self._update_rhs(node.id())
+
+    def path(self):
+        self._synchronize()
+        graph = self._graph
+        start = graph.node(self._start)
+        if start is None or graph.node(self._goal) is None or self._start == self._goal:
+            return Path()
+
+        iterations = self._compute_shortest_path()
+        if self._rhs.get(self._start, _unreachable) == _unreachable:
+            return Path(iterations=iterations)
+
+        path = []
+        visited_nodes = set([self._start])
+        current = start
+        while current.id() != self._goal:
+            best = None
+            best_cost = _unreachable
+            for edge, tail in self._successors(current):
+                if tail.id() in visited_nodes:
+                    continue
+                cost = self._step(edge, tail, self._g(tail.id()))
+                if cost < best_cost:
+                    best = (current, tail, edge)
+                    best_cost = cost
+            if best is None:
+                return Path(iterations=iterations)
+            path.append(best)
+            current = best[1]
+            visited_nodes.add(current.id())
+
+        return Path(path, iterations)
+
+    def _reset(self):
+        self._km = 0
+        self._gs = {}
+        self._rhs = {self._goal: (0, 0)}
+        self._queue = BinaryHeap()
+        self._queue.push(self._goal, (self._heuristics(self._start, self._goal), 0, 0, 0))
+        self._version = self._graph.version()
+
+    def _predecessors(self, uid):
+        node = self._graph.node(uid)
+        if node is None:
+            return set()
+        incoming = node.incoming_edges()
+        return set(incoming[edge_id].head() for edge_id in incoming)
+
+    def _synchronize(self):
+        version = self._graph.version()
+        if version == self._version:
+            return
+        changes = self._graph.changes_since(self._version)
+        self._version = version
+        if changes is None:
+            self._reset()
+            return
+        for change in changes:
+            if change.edges():
+                # change of an edge is logged with its end nodes (before and after reconnection),
+                # they are the only nodes whose outgoing arcs could change
+                for node_id in change.nodes():
+                    self._update_rhs(node_id)
+            else:
+                for node_id in change.nodes():
+                    self.update_node(node_id)
+
+    def _heuristics(self, first, second):
+        if self._position is None:
+            return 0
+        return int(euclidean_distance(self._position(first), self._position(second)))
+
+    def _g(self, uid):
+        return self._gs.get(uid, _unreachable)
+
+    def _key(self, uid):
+        cost = min(self._gs.get(uid, _unreachable), self._rhs.get(uid, _unreachable))
+        return cost[0] + self._heuristics(self._start, uid) + self._km, cost[1], cost[0], cost[1]
+
+    def _successors(self, node):
+        graph = self._graph
+        edges = node.edges()
+        for edge_id in edges:
+            edge = graph.edge(edge_id)
+            if edge is None:
+                continue
+            tail = graph.node(edges[edge_id].tail())
+            if tail is not None:
+                yield edge, tail
+
+    @staticmethod
+    def _step(edge, tail, cost):
+        # cost of going to "tail" and then on with "cost", the number of arcs breaks ties: every arc costs more
+        # than nothing even if its weight is 0, so zero weight cycles can not keep outdated costs of each other
+        if not edge.enabled() or not tail.enabled():
+            return _unreachable
+        return edge.weight() + tail.weight() + cost[0], cost[1] + 1
+
+    def _update_rhs(self, uid):
+        if uid != self._goal:
+            node = self._graph.node(uid)
+            rhs = _unreachable
+            if node is not None:
+                for edge, tail in self._successors(node):
+                    cost = self._step(edge, tail, self._g(tail.id()))
+                    if cost < rhs:
+                        rhs = cost
+            self._rhs[uid] = rhs
+        self._update_vertex(uid)
+
+    def _update_vertex(self, uid):
+        if self._gs.get(uid, _unreachable) != self._rhs.get(uid, _unreachable):
+            self._queue.update(uid, self._key(uid))
+        else:
+            self._queue.remove(uid)
+
+    def _top_key(self):
+        if not self._queue:
+            return _infinity, _infinity, _infinity, _infinity
+        return self._queue.peek()[1]
+
+    def _compute_shortest_path(self):
+        iterations = 0
+        queue = self._queue
+        gs = self._gs
+        rhs = self._rhs
+        start = self._start
+        while self._top_key() < self._key(start) or rhs.get(start, _unreachable) > gs.get(start, _unreachable):
+            iterations += 1
+            current, old_key = queue.peek()
+            new_key = self._key(current)
+            if old_key < new_key:
+                queue.update(current, new_key)
+                continue
+            current_g = gs.get(current, _unreachable)
+            current_rhs = rhs.get(current, _unreachable)
+            if current_g > current_rhs:
+                gs[current] = current_rhs
+                queue.remove(current)
+                node = self._graph.node(current)
+                incoming = node.incoming_edges() if node is not None else {}
+                for edge_id in incoming:
+                    head_id = incoming[edge_id].head()
+                    if head_id == self._goal:
+                        continue
+                    edge = self._graph.edge(edge_id)
+                    if edge is None:
+                        continue
+                    cost = self._step(edge, node, current_rhs)
+                    if cost < rhs.get(head_id, _unreachable):
+                        rhs[head_id] = cost
+                    self._update_vertex(head_id)
+            else:
+                gs[current] = _unreachable
+                for head_id in self._predecessors(current):
+                    self._update_rhs(head_id)
+                self._update_rhs(current)
+        self._iterations += iterations
+        return iterations
+
+#######################################################################################################################
+#######################################################################################################################
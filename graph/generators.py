@@ -0,0 +1,239 @@
+# coding=utf-8
+# -----------------
+# file      : generators.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Synthetic graphs for benchmarks and experiments without any GUI.
+
+Every generator is deterministic for a given seed and returns (Graph, coordinates), where coordinates map
+node id to (x, y) or are None (see graph.coordinates). Weights of edges between placed nodes are not less than
+euclidean distance between them, so A* heuristics stay admissible.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import random
+from math import ceil, log, hypot, sqrt, pi
+from .graph import Graph, EdgeDirection
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _build(nodes_number, edges, node_weights=None):
+    # "edges" is an iterable of (head id, tail id, direction, weight)
+    graph = Graph()
+    if node_weights is None:
+        graph.add_nodes((uid, 1) for uid in range(1, nodes_number + 1))
+    else:
+        graph.add_nodes((uid, node_weights[uid - 1]) for uid in range(1, nodes_number + 1))
+    graph.add_edges((0, head, tail, direction, weight) for head, tail, direction, weight in edges)
+    return graph
+
+
+def _length(coordinates, first, second):
+    x1, y1 = coordinates[first]
+    x2, y2 = coordinates[second]
+    return max(1, int(ceil(hypot(x1 - x2, y1 - y2))))
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def grid_graph(width, height, obstacles=0.2, cell=10, seed=0):
+
+    # 4-connected grid of width x height cells with mutual edges, "obstacles" is a share of blocked cells
+    # (they have no nodes). Cells are "cell" units apart, weight of every edge is "cell".
+
+    rand = random.Random(seed)
+    ids = {}
+    coordinates = {}
+    for y in range(height):
+        for x in range(width):
+            if rand.random() >= obstacles:
+                uid = len(ids) + 1
+                ids[(x, y)] = uid
+                coordinates[uid] = (x * cell, y * cell)
+
+    edges = []
+    for (x, y), uid in ids.items():
+        for neighbour in ((x + 1, y), (x, y + 1)):
+            other = ids.get(neighbour, 0)
+            if other:
+                edges.append((uid, other, EdgeDirection.MUTUAL, cell))
+
+    return _build(len(ids), edges), coordinates
+
+
+def random_geometric_graph(nodes_number, degree=6.0, size=1000.0, seed=0):
+
+    # Random points in a size x size square, points closer than the radius giving average "degree" are connected
+    # by mutual edges weighted by their distance. Neighbours are found with a bucket grid in O(n + m) time.
+
+    rand = random.Random(seed)
+    radius = size * sqrt(degree / (pi * max(nodes_number, 1)))
+    coordinates = dict((uid, (rand.random() * size, rand.random() * size)) for uid in range(1, nodes_number + 1))
+
+    buckets = {}
+    for uid, (x, y) in coordinates.items():
+        buckets.setdefault((int(x / radius), int(y / radius)), []).append(uid)
+
+    edges = []
+    for uid, (x, y) in coordinates.items():
+        column = int(x / radius)
+        row = int(y / radius)
+        for i in (column - 1, column, column + 1):
+            for j in (row - 1, row, row + 1):
+                for other in buckets.get((i, j), ()):
+                    if other > uid:
+                        other_x, other_y = coordinates[other]
+                        if hypot(x - other_x, y - other_y) <= radius:
+                            edges.append((uid, other, EdgeDirection.MUTUAL, _length(coordinates, uid, other)))
+
+    return _build(nodes_number, edges), coordinates
+
+
+def erdos_renyi_graph(nodes_number, degree=4.0, max_weight=100, seed=0):
+
+    # Directed G(n, p) graph with p = degree / (n - 1) and random integer weights from 1 to "max_weight".
+    # Pairs are enumerated with geometric skips (Batagelj and Brandes), so it takes O(n + m) time.
+
+    rand = random.Random(seed)
+    n = nodes_number
+    edges = []
+    if n > 1:
+        p = min(1.0, degree / float(n - 1))
+        pairs = n * (n - 1)
+        position = -1
+        log_q = log(1.0 - p) if p < 1.0 else None
+        while True:
+            if log_q is None:
+                position += 1
+            else:
+                position += 1 + int(log(1.0 - rand.random()) / log_q)
+            if position >= pairs:
+                break
+            head, tail = divmod(position, n - 1)
+            if tail >= head:
+                tail += 1  # skip loops
+            edges.append((head + 1, tail + 1, EdgeDirection.STRAIGHT, rand.randint(1, max_weight)))
+
+    return _build(n, edges), None
+
+
+def scale_free_graph(nodes_number, attachments=2, max_weight=100, seed=0):
+
+    # Barabasi-Albert preferential attachment: every new node is connected by mutual edges to "attachments"
+    # distinct existing nodes chosen with probability proportional to their degree.
+
+    rand = random.Random(seed)
+    edges = []
+    targets = []  # every node appears here once per incident edge
+    first = min(attachments + 1, nodes_number)
+    for uid in range(2, first + 1):
+        for other in range(1, uid):
+            edges.append((uid, other, EdgeDirection.MUTUAL, rand.randint(1, max_weight)))
+            targets.extend((uid, other))
+
+    for uid in range(first + 1, nodes_number + 1):
+        chosen = set()
+        while len(chosen) < attachments:
+            chosen.add(rand.choice(targets))
+        for other in chosen:
+            edges.append((uid, other, EdgeDirection.MUTUAL, rand.randint(1, max_weight)))
+            targets.extend((uid, other))
+
+    return _build(nodes_number, edges), None
+
+
+def road_graph(width, height, spacing=100.0, highway_every=8, removed=0.15, one_way=0.1, seed=0):
+
+    # Road-like planar network: junctions of a jittered width x height lattice connected to their 4 neighbours.
+    # Some street segments are removed or made one-way, every "highway_every"-th row and column is a highway
+    # which is never removed. Weights are travel times: distance on highways, 1.5 to 3 times distance on streets.
+
+    rand = random.Random(seed)
+    jitter = spacing * 0.3
+    coordinates = {}
+    for y in range(height):
+        for x in range(width):
+            coordinates[y * width + x + 1] = (x * spacing + rand.uniform(-jitter, jitter),
+                                              y * spacing + rand.uniform(-jitter, jitter))
+
+    edges = []
+    for y in range(height):
+        for x in range(width):
+            uid = y * width + x + 1
+            for dx, dy in ((1, 0), (0, 1)):
+                if x + dx >= width or y + dy >= height:
+                    continue
+                other = uid + dx + dy * width
+                highway = (y % highway_every == 0) if dx else (x % highway_every == 0)
+                length = _length(coordinates, uid, other)
+                if highway:
+                    edges.append((uid, other, EdgeDirection.MUTUAL, length))
+                    continue
+                if rand.random() < removed:
+                    continue
+                weight = int(ceil(length * rand.uniform(1.5, 3.0)))
+                if rand.random() < one_way:
+                    direction = EdgeDirection.STRAIGHT if rand.random() < 0.5 else EdgeDirection.REVERSE
+                else:
+                    direction = EdgeDirection.MUTUAL
+                edges.append((uid, other, direction, weight))
+
+    return _build(width * height, edges), coordinates
+
+
+generators = {
+    'grid': grid_graph,
+    'geometric': random_geometric_graph,
+    'erdos_renyi': erdos_renyi_graph,
+    'scale_free': scale_free_graph,
+    'road': road_graph
+}
+
+
+def generate(kind, nodes_number, seed=0):
+    # graph of about "nodes_number" nodes made by one of the generators with default parameters
+    if kind == 'grid':
+        side = max(1, int(round(sqrt(nodes_number / 0.8))))
+        return grid_graph(side, side, seed=seed)
+    if kind == 'road':
+        side = max(1, int(round(sqrt(nodes_number))))
+        return road_graph(side, side, seed=seed)
+    function = generators.get(kind, None)
+    if function is None:
+        raise ValueError('unknown graph generator: {0!r}'.format(kind))
+    return function(nodes_number, seed=seed)
+
+#######################################################################################################################
+#######################################################################################################################
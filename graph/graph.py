@@ -37,6 +37,8 @@ __email__ = 'victor.zarubkin@gmail.com'
 
 # imports section
 
+from collections import deque
+
 #######################################################################################################################
 #######################################################################################################################
 
@@ -55,14 +57,55 @@ class EdgeDirection(object):
 #######################################################################################################################
 
 
+class ChangeKind(object):
+
+    STRUCTURE = 1  # nodes or edges were added, removed or reconnected
+    WEIGHT = 2  # only weights of nodes or edges were changed
+    STATE = 3  # nodes or edges were enabled or disabled
+
+
+class GraphChange(object):
+
+    # "increase" is True when the change can only make paths longer (weight grows, edge is removed, item is disabled)
+
+    def __init__(self, version, kind, nodes=(), edges=(), increase=False):
+        object.__init__(self)
+        self._version = version
+        self._kind = kind
+        self._nodes = nodes
+        self._edges = edges
+        self._increase = increase
+
+    def version(self):
+        return self._version
+
+    def kind(self):
+        return self._kind
+
+    def nodes(self):
+        return self._nodes
+
+    def edges(self):
+        return self._edges
+
+    def increase(self):
+        return self._increase
+
+#######################################################################################################################
+#######################################################################################################################
+
+
 class _Base(object):
 
+    __slots__ = ('_enabled', '_id', '_weight', '_dynamicWeight', '_graph')
+
     def __init__(self, uid, weight=1):
         object.__init__(self)
         self._enabled = True
         self._id = uid
         self._weight = weight
         self._dynamicWeight = 0
+        self._graph = None
 
     def id(self):
         return self._id
@@ -71,10 +114,14 @@ class _Base(object):
         return self._enabled
 
     def enable(self):
-        self._enabled = True
+        if not self._enabled:
+            self._enabled = True
+            self._notify(ChangeKind.STATE, False)
 
     def disable(self):
-        self._enabled = False
+        if self._enabled:
+            self._enabled = False
+            self._notify(ChangeKind.STATE, True)
 
     def base_weight(self):
         return self._weight
@@ -83,17 +130,27 @@ class _Base(object):
         return self._weight + self._dynamicWeight
 
     def set_base_weight(self, weight):
-        if weight >= 0:
+        if weight >= 0 and weight != self._weight:
+            increase = weight > self._weight
             self._weight = weight
+            self._notify(ChangeKind.WEIGHT, increase)
 
     def add_weight(self, weight):
         if weight < 0:
             self.subtract_weight(-weight)
-        else:
+        elif weight > 0:
             self._dynamicWeight += weight
+            self._notify(ChangeKind.WEIGHT, True)
 
     def subtract_weight(self, weight):
-        self._dynamicWeight = max(self._dynamicWeight - abs(weight), 0)
+        dynamic_weight = max(self._dynamicWeight - abs(weight), 0)
+        if dynamic_weight != self._dynamicWeight:
+            self._dynamicWeight = dynamic_weight
+            self._notify(ChangeKind.WEIGHT, False)
+
+    def _notify(self, kind, increase):
+        if self._graph is not None:
+            self._graph._on_change(self, kind, increase)
 
 #######################################################################################################################
 #######################################################################################################################
@@ -101,6 +158,10 @@ class _Base(object):
 
 class EdgeInfo(object):
 
+    # Standalone (edge id, head id, tail id) record, used by Path. Node.edges() holds _EdgeEnd views instead.
+
+    __slots__ = ('_id', '_head', '_tail')
+
     def __init__(self, uid, head, tail):
         object.__init__(self)
         self._head = head.id() if isinstance(head, _Base) else head
@@ -117,9 +178,45 @@ class EdgeInfo(object):
         return self._tail
 
 
+class _EdgeEnd(object):
+
+    # Outgoing edge as seen from its head node, the same interface as EdgeInfo.
+    # Ids are read from the Edge itself, so nothing is duplicated per endpoint.
+
+    __slots__ = ('_edge',)
+
+    def __init__(self, edge):
+        object.__init__(self)
+        self._edge = edge
+
+    def id(self):
+        return self._edge._id
+
+    def head(self):
+        return self._edge._head._id
+
+    def tail(self):
+        return self._edge._tail._id
+
+
+class _ReverseEdgeEnd(_EdgeEnd):
+
+    # the second end of a mutual edge (from its tail node to its head node)
+
+    __slots__ = ()
+
+    def head(self):
+        return self._edge._tail._id
+
+    def tail(self):
+        return self._edge._head._id
+
+
 class Edge(_Base):
 
-    def __init__(self, uid, head, tail, direction=EdgeDirection.STRAIGHT, weight=1):
+    __slots__ = ('_head', '_tail', '_direction')
+
+    def __init__(self, uid, head, tail, direction=EdgeDirection.STRAIGHT, weight=1, graph=None):
         _Base.__init__(self, uid, weight)
         self._head = head
         self._tail = tail
@@ -127,10 +224,9 @@ class Edge(_Base):
         if self._direction == EdgeDirection.REVERSE:
             self._direction = EdgeDirection.STRAIGHT
             self._head, self._tail = self._tail, self._head
-        if self._head is not None:
-            self._head.add_edge(EdgeInfo(self.id(), self._head, self._tail))
-        if self._direction == EdgeDirection.MUTUAL and self._tail is not None:
-            self._tail.add_edge(EdgeInfo(self.id(), self._tail, self._head))
+        self._graph = graph
+        if self._head is not None and self._tail is not None:
+            self._attach()
 
     def direction(self):
         return self._direction
@@ -142,7 +238,10 @@ class Edge(_Base):
         return self._tail
 
     def connect(self, head, tail, direction=None):
-        self.disconnect()
+        if self._head is not None and self._id in self._head.edges():
+            # log the old end nodes too, otherwise consumers of the change log would not know about them
+            self._detach()
+            self._notify(ChangeKind.STRUCTURE, True)
         if direction is not None and EdgeDirection.appropriate(direction):
             self._direction = direction
         self._head = head
@@ -150,15 +249,44 @@ class Edge(_Base):
         if self._direction == EdgeDirection.REVERSE:
             self._direction = EdgeDirection.STRAIGHT
             self._head, self._tail = self._tail, self._head
-        self._head.add_edge(EdgeInfo(self.id(), self._head, self._tail))
-        if self._direction == EdgeDirection.MUTUAL:
-            self._tail.add_edge(EdgeInfo(self.id(), self._tail, self._head))
+        self._attach()
+        self._notify(ChangeKind.STRUCTURE, False)
 
     def disconnect(self):
+        self._detach()
+        self._notify(ChangeKind.STRUCTURE, True)
+
+    def _attach(self):
+        # the same end object is stored as outgoing edge of one node and as incoming edge of the other one
+        graph = self._graph
+        end = _EdgeEnd(self)
+        self._head.add_edge(end)
+        self._tail._incoming[self._id] = end
+        if graph is not None:
+            graph._index_arc(self._head, self._tail, self._id)
+            graph._join_components(self._head.id(), self._tail.id())
+        if self._direction == EdgeDirection.MUTUAL:
+            end = _ReverseEdgeEnd(self)
+            self._tail.add_edge(end)
+            self._head._incoming[self._id] = end
+            if graph is not None:
+                graph._index_arc(self._tail, self._head, self._id)
+
+    def _detach(self):
+        uid = self._id
+        graph = self._graph
         if self._head is not None:
-            self._head.remove_edge(self.id())
-        if self._direction == EdgeDirection.MUTUAL and self._tail is not None:
-            self._tail.remove_edge(self.id())
+            self._head.remove_edge(uid)
+            self._head._incoming.pop(uid, None)
+        if self._tail is not None:
+            self._tail._incoming.pop(uid, None)
+            if self._direction == EdgeDirection.MUTUAL:
+                self._tail.remove_edge(uid)
+        if graph is not None and self._head is not None and self._tail is not None:
+            graph._split_components()
+            graph._unindex_arc(self._head, self._tail, uid)
+            if self._direction == EdgeDirection.MUTUAL:
+                graph._unindex_arc(self._tail, self._head, uid)
 
 #######################################################################################################################
 #######################################################################################################################
@@ -166,9 +294,13 @@ class Edge(_Base):
 
 class Node(_Base):
 
+    __slots__ = ('_edges', '_incoming', '_tails', '_data')
+
     def __init__(self, uid, weight=1, data=None):
         _Base.__init__(self, uid, weight)
         self._edges = {}
+        self._incoming = {}
+        self._tails = None  # tail id -> id of an edge leading there, kept by Graph (None while there are no arcs)
         self._data = data
 
     def data(self):
@@ -180,8 +312,12 @@ class Node(_Base):
     def edges(self):
         return self._edges
 
+    def incoming_edges(self):
+        # {edge id: edge info} of edges entering this node, head() of edge info is the predecessor node id
+        return self._incoming
+
     def add_edge(self, edge):
-        if isinstance(edge, EdgeInfo):
+        if isinstance(edge, (EdgeInfo, _EdgeEnd)):
             uid = edge.id()
             if uid > 0 and uid not in self._edges:
                 self._edges[uid] = edge
@@ -189,7 +325,7 @@ class Node(_Base):
     def remove_edge(self, edge):
         if isinstance(edge, int):
             uid = edge
-        elif isinstance(edge, (Edge, EdgeInfo)):
+        elif isinstance(edge, (Edge, EdgeInfo, _EdgeEnd)):
             uid = edge.id()
         else:
             uid = 0
@@ -202,6 +338,9 @@ class Node(_Base):
 
 class Graph(object):
 
+    # maximum number of the latest changes kept for changes_since()
+    change_log_size = 4096
+
     def __init__(self):
         object.__init__(self)
         self._nodes = {}
@@ -210,14 +349,63 @@ class Graph(object):
         self._free_id_edge_max = 1
         self._free_ids_node = []
         self._free_ids_edge = []
+        self._reachability = None
+        # union-find over node ids: weakly connected components (edge directions are ignored), nodes without entry
+        # are roots of single node components; it is built on demand and rebuilt on demand after edges are removed
+        self._componentParents = {}
+        self._componentSizes = {}
+        self._componentsValid = False
+        self._version = 0
+        self._changes = deque(maxlen=self.change_log_size)
 
     def clear(self):
+        for node in self._nodes.values():
+            node._graph = None
+        for edge in self._edges.values():
+            edge._graph = None
         self._nodes.clear()
         self._edges.clear()
         self._free_id_node_max = 1
         self._free_id_edge_max = 1
         self._free_ids_node = []
         self._free_ids_edge = []
+        self._split_components()
+        self._drop_changes()
+
+    def version(self):
+        return self._version
+
+    def reachability(self):
+        return self._reachability
+
+    def set_reachability(self, reachability):
+        # "reachability" is a preprocessed index of this graph (see graph.condensation) or None
+        if reachability is not None and reachability.graph() is not self:
+            raise ValueError('reachability index was built for another graph')
+        self._reachability = reachability
+
+    def connected(self, first, second):
+        # True if the nodes are in the same weakly connected component, amortized O(1)
+        if not self._componentsValid:
+            self._build_components()
+        return self._find_component(first) == self._find_component(second)
+
+    def may_reach(self, begin, end):
+        # False if "end" is known to be unreachable from "begin", search functions return empty path at once then
+        if begin in self._nodes and end in self._nodes and not self.connected(begin, end):
+            return False
+        reachability = self._reachability
+        return reachability is None or not reachability.valid() or not reachability.rejects(begin, end)
+
+    def changes_since(self, version):
+        # Returns list of GraphChange made after given version or None if the log does not cover all of them
+        # (then consumer has to rebuild everything it has calculated for the graph).
+        if version >= self._version:
+            return []
+        changes = self._changes
+        if not changes or changes[0].version() > version + 1:
+            return None
+        return [change for change in changes if change.version() > version]
 
     def nodes_number(self):
         return len(self._nodes)
@@ -236,10 +424,38 @@ class Graph(object):
 
     def remove_edge(self, identifier):
         if identifier in self._edges:
-            self._edges[identifier].disconnect()
+            edge = self._edges[identifier]
+            edge.disconnect()
+            edge._graph = None
             del self._edges[identifier]
             self._free_ids_edge.append(identifier)
 
+    def find_edge(self, first, second):
+        # returns an edge leading from the first node to the second one (ids or nodes) or None in O(1) time
+        if isinstance(first, Node):
+            first = first.id()
+        if isinstance(second, Node):
+            second = second.id()
+        node = self._nodes.get(first, None)
+        if node is None or node._tails is None:
+            return None
+        uid = node._tails.get(second, None)
+        if uid is None:
+            return None
+        return self._edges.get(uid, None)
+
+    def remove_node(self, identifier):
+        # removes the node with all its edges in O(degree) time, the id will be reused by add_node()
+        node = self._nodes.get(identifier, None)
+        if node is None:
+            return
+        for edge_id in list(node.edges()) + list(node.incoming_edges()):
+            self.remove_edge(edge_id)
+        node._graph = None
+        del self._nodes[identifier]
+        self._free_ids_node.append(identifier)
+        self._record_change(ChangeKind.STRUCTURE, (identifier,), (), True)
+
     def add_node(self, weight, uid=0, data=None):
         if uid in self._nodes:
             return None
@@ -247,10 +463,15 @@ class Graph(object):
             uid = self._get_free_id_for_node()
             if uid == self._free_id_node_max:
                 self._free_id_node_max += 1
-        self._nodes[uid] = Node(uid, weight, data)
-        return self._nodes[uid]
-
-    def connect_nodes(self, first, second, direction, weight=1):
+        node = Node(uid, weight, data)
+        node._graph = self
+        self._nodes[uid] = node
+        self._record_change(ChangeKind.STRUCTURE, (uid,), (), False)
+        return node
+
+    def connect_nodes(self, first, second, direction, weight=1, merge=False):
+        # If "merge" is True and the nodes are already connected then the existing edge is returned (its weight is
+        # kept), an existing edge of the opposite direction becomes mutual. Otherwise a parallel edge is created.
         if not EdgeDirection.appropriate(direction):
             return None
         node1 = first if isinstance(first, Node) else self.node(first)
@@ -261,54 +482,173 @@ class Graph(object):
             return None
         if node1.id() == node2.id():
             return None
-        # try to find mutual edge
-        # edge = self._find_mutual_edge(node1, node2, direction)
-        # if edge is not None:
-        #     if edge.direction() != direction:
-        #         if direction == EdgeDirection.REVERSE and edge.head().id() == node1.id():
-        #             edge.connect(node2, node1, EdgeDirection.STRAIGHT)
-        #         elif direction == EdgeDirection.MUTUAL:
-        #             edge.connect(node1, node2, EdgeDirection.MUTUAL)
-        #     return edge
+        if merge:
+            edge = self._merge_edge(node1, node2, direction)
+            if edge is not None:
+                return edge
         # create new edge
         uid = self._get_free_id_for_edge()
         if uid == self._free_id_edge_max:
             self._free_id_edge_max += 1
-        self._edges[uid] = Edge(uid, node1, node2, direction, weight)
-        return self._edges[uid]
-
-    def _find_mutual_edge(self, first, second, direction=None):
-        if first.id() == second.id():
+        edge = Edge(uid, node1, node2, direction, weight, self)
+        self._edges[uid] = edge
+        self._record_change(ChangeKind.STRUCTURE, (node1.id(), node2.id()), (uid,), False)
+        return edge
+
+    def add_nodes(self, nodes):
+        # Bulk version of add_node(): "nodes" is an iterable of (uid, weight) pairs with explicit ids,
+        # existing ids are skipped. Bulk changes are not logged one by one, the change log is dropped instead.
+        # Returns number of added nodes.
+        added = 0
+        all_nodes = self._nodes
+        for uid, weight in nodes:
+            if uid < 1 or uid in all_nodes:
+                continue
+            node = Node(uid, weight)
+            node._graph = self
+            all_nodes[uid] = node
+            added += 1
+        if added:
+            self._drop_changes()
+        return added
+
+    def add_edges(self, edges):
+        # Bulk version of connect_nodes(): "edges" is an iterable of (uid, head id, tail id, direction, weight),
+        # uid < 1 means any free id. Edges with existing ids, unknown nodes or loops are skipped.
+        # Returns number of added edges.
+        added = 0
+        all_nodes = self._nodes
+        all_edges = self._edges
+        for uid, head, tail, direction, weight in edges:
+            if uid in all_edges or head == tail or not EdgeDirection.appropriate(direction):
+                continue
+            node1 = all_nodes.get(head, None)
+            node2 = all_nodes.get(tail, None)
+            if node1 is None or node2 is None:
+                continue
+            if uid < 1:
+                uid = self._get_free_id_for_edge()
+                if uid == self._free_id_edge_max:
+                    self._free_id_edge_max += 1
+            all_edges[uid] = Edge(uid, node1, node2, direction, weight, self)
+            added += 1
+        if added:
+            self._drop_changes()
+        return added
+
+    def _merge_edge(self, first, second, direction):
+        # Returns an existing edge between the nodes which covers "direction" or None if there is no edge at all.
+        # An edge covering only the opposite direction becomes mutual.
+        forward = self.find_edge(first, second)
+        backward = self.find_edge(second, first)
+        if forward is None and backward is None:
             return None
-        edge = self._find_edge(first.edges(), second, direction)
-        if edge is not None:
-            return edge
-        if direction == EdgeDirection.MUTUAL:
-            edge = self._find_edge(second.edges(), first, EdgeDirection.MUTUAL)
-            if edge is not None:
-                return edge
-        return None
+        wants_forward = direction != EdgeDirection.REVERSE
+        wants_backward = direction != EdgeDirection.STRAIGHT
+        if (forward is not None or not wants_forward) and (backward is not None or not wants_backward):
+            return forward if forward is not None and wants_forward else backward
+        edge = forward if forward is not None else backward
+        edge.connect(edge.head(), edge.tail(), EdgeDirection.MUTUAL)
+        return edge
 
-    def _find_edge(self, edges, node, direction):
+    @staticmethod
+    def _index_arc(head, tail, uid):
+        # the index is kept by head nodes: a global dict keyed by (head, tail) pairs would cost a tuple per arc
+        if head._tails is None:
+            head._tails = {tail.id(): uid}
+        else:
+            head._tails.setdefault(tail.id(), uid)
+
+    @staticmethod
+    def _unindex_arc(head, tail, uid):
+        tails = head._tails
+        tail_id = tail.id()
+        if tails is None or tails.get(tail_id, None) != uid:
+            return
+        # there may be parallel edges, the next one takes the place of removed edge
+        edges = head.edges()
         for edge_id in edges:
-            edge = self.edge(edge_id)
-            if edge is None:
-                continue
-            if edge.tail().id() == node.id() and edge.direction() == EdgeDirection.REVERSE:
-                if direction is None or edge.direction() == direction:
-                    return edge
-        return None
+            if edge_id != uid and edges[edge_id].tail() == tail_id:
+                tails[tail_id] = edge_id
+                return
+        del tails[tail_id]
+        if not tails:
+            head._tails = None
+
+    def _record_change(self, kind, nodes, edges, increase):
+        self._version += 1
+        self._changes.append(GraphChange(self._version, kind, nodes, edges, increase))
+
+    def _find_component(self, uid):
+        parents = self._componentParents
+        while True:
+            parent = parents.get(uid, uid)
+            if parent == uid:
+                return uid
+            grandparent = parents.get(parent, parent)
+            if grandparent != parent:
+                parents[uid] = grandparent  # path halving
+            uid = grandparent
+
+    def _join_components(self, first, second):
+        if not self._componentsValid:
+            return
+        first = self._find_component(first)
+        second = self._find_component(second)
+        if first == second:
+            return
+        sizes = self._componentSizes
+        first_size = sizes.get(first, 1)
+        second_size = sizes.get(second, 1)
+        if first_size < second_size:
+            first, second = second, first
+        self._componentParents[second] = first
+        sizes[first] = first_size + second_size
+        sizes.pop(second, None)
+
+    def _split_components(self):
+        # removed edge may split a component, union-find can not do that: drop it until the next query
+        if self._componentsValid:
+            self._componentsValid = False
+            self._componentParents = {}
+            self._componentSizes = {}
+
+    def _build_components(self):
+        self._componentParents = {}
+        self._componentSizes = {}
+        self._componentsValid = True
+        for edge in self._edges.values():
+            head = edge.head()
+            tail = edge.tail()
+            if head is not None and tail is not None and edge.id() in head.edges():
+                self._join_components(head.id(), tail.id())
+
+    def _drop_changes(self):
+        # everything may have changed: drop the log, so changes_since() of any older version returns None
+        self._version += 1
+        self._changes.clear()
+
+    def _on_change(self, item, kind, increase):
+        if isinstance(item, Edge):
+            nodes = tuple(node.id() for node in (item.head(), item.tail()) if node is not None)
+            self._record_change(kind, nodes, (item.id(),), increase)
+        else:
+            self._record_change(kind, (item.id(),), (), increase)
 
     def _get_free_id_for_node(self):
-        if self._free_ids_node:
-            return self._free_ids_node.pop()
+        while self._free_ids_node:
+            uid = self._free_ids_node.pop()
+            if uid not in self._nodes:  # the id could be taken explicitly after it was freed
+                return uid
         while self._free_id_node_max in self._nodes:
             self._free_id_node_max += 1
         return self._free_id_node_max
 
     def _get_free_id_for_edge(self):
-        if self._free_ids_edge:
-            return self._free_ids_edge.pop()
+        while self._free_ids_edge:
+            uid = self._free_ids_edge.pop()
+            if uid not in self._edges:
+                return uid
         while self._free_id_edge_max in self._edges:
             self._free_id_edge_max += 1
         return self._free_id_edge_max
@@ -319,11 +659,14 @@ class Graph(object):
 
 class Path(object):
 
+    __slots__ = ('_path', '_totalWeight', '_iterations', '_stats')
+
     def __init__(self, path=[], iterations=0):
         object.__init__(self)
         self._path = []
         self._totalWeight = 0
         self._iterations = iterations
+        self._stats = None
         for head, tail, edge in path:
             self.append(head, tail, edge)
 
@@ -345,12 +688,38 @@ class Path(object):
     def total_weight(self):
         return self._totalWeight
 
+    def stats(self):
+        # graph.search_stats.SearchStats of the search which has found this path (None for paths made by hand)
+        return self._stats
+
+    def set_stats(self, stats):
+        self._stats = stats
+
     def append(self, head, tail, edge):
-        self._totalWeight += edge.weight()
-        self._totalWeight += tail.weight()
+        self.append_arc(head.id(), tail.id(), edge.id(), edge.weight(), head.weight(), tail.weight())
+
+    def append_arc(self, head_id, tail_id, edge_id, edge_weight, head_weight, tail_weight):
+        self._totalWeight += edge_weight
+        self._totalWeight += tail_weight
         if not self._path:
-            self._totalWeight += head.weight()
-        self._path.append(EdgeInfo(edge.id(), head, tail))
+            self._totalWeight += head_weight
+        self._path.append(EdgeInfo(edge_id, head_id, tail_id))
+
+
+def path_from_parents(parents, begin, end, iterations=0):
+    # "parents" maps node id to (head node, tail node, edge) tuple of the edge used to reach that node
+    path = []
+    current = end
+    while current != begin:
+        entry = parents.get(current, None)
+        if entry is None:
+            return Path()
+        path.append(entry)
+        current = entry[0].id()
+    if not path:
+        return Path()
+    path.reverse()
+    return Path(path, iterations)
 
 #######################################################################################################################
 #######################################################################################################################
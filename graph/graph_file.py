@@ -0,0 +1,283 @@
+# coding=utf-8
+# -----------------
+# file      : graph_file.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Binary graph file opened with mmap.
+
+Layout (little-endian, every section starts at 8-byte boundary):
+    header (64 bytes)   - magic, format version, flags, nodes number n, arcs number m, edges number, graph version;
+    ids                 - int64[n], ascending;
+    node weights        - int64[n] or double[n] (flag FLOAT_NODE_WEIGHTS);
+    offsets             - int64[n + 1], arcs of node i are arcs[offsets[i]:offsets[i + 1]];
+    targets             - int64[m], node indices;
+    edge ids            - int64[m];
+    edge weights        - int64[m] or double[m] (flag FLOAT_EDGE_WEIGHTS);
+    directions          - uint8[m], EdgeDirection.STRAIGHT or EdgeDirection.MUTUAL of the edge of every arc;
+    coordinates         - double[n] xs and double[n] ys (flag COORDINATES);
+    reverse arrays      - int64[n + 1] offsets, int64[m] sources, int64[m] arcs (flag REVERSE).
+
+open_graph() maps the file read-only and wraps sections into CompactGraph without reading them, pages are
+faulted in on demand and shared between all processes which open the same file.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import sys
+import mmap
+import struct
+from array import array
+from .graph import Graph, EdgeDirection
+from .compact_graph import CompactGraph, _typecode
+
+#######################################################################################################################
+#######################################################################################################################
+
+FORMAT_VERSION = 1
+
+_magic = b'GRAPHBIN'
+_header = struct.Struct('<8sIIQQQQ')
+_header_size = 64
+
+
+class GraphFileFlags(object):
+
+    FLOAT_NODE_WEIGHTS = 1
+    FLOAT_EDGE_WEIGHTS = 2
+    COORDINATES = 4
+    REVERSE = 8
+
+
+def _aligned(size):
+    return (size + 7) & ~7
+
+
+def _arc_directions(graph):
+    # an edge id met twice among arcs belongs to a mutual edge
+    counts = {}
+    for uid in graph.edge_ids():
+        counts[uid] = counts.get(uid, 0) + 1
+    return array('B', (EdgeDirection.MUTUAL if counts[uid] > 1 else EdgeDirection.STRAIGHT
+                       for uid in graph.edge_ids()))
+
+
+def _little_endian(values):
+    if sys.byteorder != 'little':
+        values = array(_typecode(values), values)
+        values.byteswap()
+    return values
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def write_graph(graph, file_name, coordinates=None, reverse=False):
+
+    # "graph" is a Graph or a CompactGraph, "coordinates" are used for Graph only (see CompactGraph).
+    # If "reverse" is True then reverse arrays are written too (used by backward and bidirectional searches).
+
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph(graph, coordinates)
+    elif graph.blocked_arcs() is not None:
+        raise ValueError('masked graph can not be written, write a CompactGraph of its SubgraphView instead')
+
+    flags = 0
+    if _typecode(graph.node_weights()) == 'd':
+        flags |= GraphFileFlags.FLOAT_NODE_WEIGHTS
+    if _typecode(graph.edge_weights()) == 'd':
+        flags |= GraphFileFlags.FLOAT_EDGE_WEIGHTS
+
+    sections = [graph.ids(), graph.node_weights(), graph.offsets(), graph.targets(), graph.edge_ids(),
+                graph.edge_weights(), _arc_directions(graph)]
+    if graph.has_coordinates():
+        flags |= GraphFileFlags.COORDINATES
+        sections.extend(graph.coordinates())
+    if reverse:
+        flags |= GraphFileFlags.REVERSE
+        sections.extend((graph.reverse_offsets(), graph.reverse_sources(), graph.reverse_arcs()))
+
+    header = _header.pack(_magic, FORMAT_VERSION, flags, graph.nodes_number(), graph.arcs_number(),
+                          graph.edges_number(), graph.version())
+
+    with open(file_name, 'wb') as file:
+        file.write(header.ljust(_header_size, b'\0'))
+        for values in sections:
+            data = memoryview(_little_endian(values)).cast('B')
+            file.write(data)
+            file.write(b'\0' * (_aligned(len(data)) - len(data)))
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class GraphFile(object):
+
+    # Use open_graph() to create it. The graph must not be used after close().
+
+    def __init__(self, file_name):
+        object.__init__(self)
+        if sys.byteorder != 'little':
+            raise ValueError('memory-mapped graph files are supported on little-endian platforms only')
+
+        self._fileName = file_name
+        self._views = []
+        with open(file_name, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def file_name(self):
+        return self._fileName
+
+    def format_version(self):
+        return self._formatVersion
+
+    def graph(self):
+        return self._graph
+
+    def directions(self):
+        # EdgeDirection of the edge of every arc (in CompactGraph arc order)
+        return self._directions
+
+    def close(self):
+        if self._map is None:
+            return
+        self._graph = None
+        self._directions = None
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._map.close()
+        self._map = None
+
+    def _section(self, offset, typecode, length, item_size=8):
+        size = length * item_size
+        if offset + size > len(self._map):
+            raise ValueError('graph file {0!r} is truncated'.format(self._fileName))
+        view = memoryview(self._map)[offset:offset + size]
+        self._views.append(view)
+        view = view.cast(typecode)
+        self._views.append(view)
+        return view, offset + _aligned(size)
+
+    def _read(self):
+        if len(self._map) < _header_size:
+            raise ValueError('{0!r} is not a graph file'.format(self._fileName))
+        magic, version, flags, n, m, edges_number, graph_version = _header.unpack_from(self._map, 0)
+        if magic != _magic:
+            raise ValueError('{0!r} is not a graph file'.format(self._fileName))
+        if version > FORMAT_VERSION:
+            raise ValueError('graph file {0!r} has unsupported format version {1}'.format(self._fileName, version))
+        self._formatVersion = version
+
+        node_typecode = 'd' if flags & GraphFileFlags.FLOAT_NODE_WEIGHTS else 'q'
+        edge_typecode = 'd' if flags & GraphFileFlags.FLOAT_EDGE_WEIGHTS else 'q'
+
+        offset = _header_size
+        ids, offset = self._section(offset, 'q', n)
+        node_weights, offset = self._section(offset, node_typecode, n)
+        offsets, offset = self._section(offset, 'q', n + 1)
+        targets, offset = self._section(offset, 'q', m)
+        edge_ids, offset = self._section(offset, 'q', m)
+        edge_weights, offset = self._section(offset, edge_typecode, m)
+        self._directions, offset = self._section(offset, 'B', m, 1)
+
+        xs = ys = None
+        if flags & GraphFileFlags.COORDINATES:
+            xs, offset = self._section(offset, 'd', n)
+            ys, offset = self._section(offset, 'd', n)
+
+        reverse = (None, None, None)
+        if flags & GraphFileFlags.REVERSE:
+            reverse_offsets, offset = self._section(offset, 'q', n + 1)
+            reverse_sources, offset = self._section(offset, 'q', m)
+            reverse_arcs, offset = self._section(offset, 'q', m)
+            reverse = (reverse_offsets, reverse_sources, reverse_arcs)
+
+        self._graph = CompactGraph.from_arrays(graph_version, ids, node_weights, offsets, targets, edge_ids,
+                                               edge_weights, edges_number, xs, ys, *reverse)
+
+
+def open_graph(file_name):
+    return GraphFile(file_name)
+
+
+def read_graph(file_name, graph=None):
+
+    # Loads the file into a Graph (new one or given "graph") with the same node and edge ids.
+    # Returns (graph, coordinates) where coordinates are {node id: (x, y)} or None.
+
+    if graph is None:
+        graph = Graph()
+
+    with open_graph(file_name) as graph_file:
+        compact = graph_file.graph()
+        ids = compact.ids()
+        node_weights = compact.node_weights()
+        offsets = compact.offsets()
+        targets = compact.targets()
+        edge_ids = compact.edge_ids()
+        edge_weights = compact.edge_weights()
+        directions = graph_file.directions()
+
+        graph.add_nodes((ids[i], node_weights[i]) for i in range(len(ids)))
+
+        def edges():
+            added = set()
+            for head in range(len(ids)):
+                for arc in range(offsets[head], offsets[head + 1]):
+                    uid = edge_ids[arc]
+                    if uid in added:
+                        continue
+                    added.add(uid)
+                    yield uid, ids[head], ids[targets[arc]], directions[arc], edge_weights[arc]
+
+        graph.add_edges(edges())
+
+        coordinates = None
+        if compact.has_coordinates():
+            xs, ys = compact.coordinates()
+            coordinates = dict((ids[i], (xs[i], ys[i])) for i in range(len(ids)))
+
+    return graph, coordinates
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,267 @@
+# coding=utf-8
+# -----------------
+# file      : landmarks.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+ALT (A*, landmarks, triangle inequality) lower bounds.
+
+For every landmark L distances d(L, v) and d(v, L) to all nodes are precomputed, then
+d(v, t) >= max(d(v, L) - d(t, L), d(L, t) - d(L, v)) is used as A* heuristics.
+Tables are built on a CompactGraph snapshot, so they must be rebuilt if weights of the graph decrease.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from random import Random
+from .compact_graph import CompactGraph
+
+#######################################################################################################################
+#######################################################################################################################
+
+_infinity = float('inf')
+
+
+class LandmarkStrategy(object):
+
+    RANDOM = 'random'
+    FARTHEST = 'farthest'
+    AVOID = 'avoid'
+
+    @staticmethod
+    def appropriate(strategy):
+        return strategy in (LandmarkStrategy.RANDOM, LandmarkStrategy.FARTHEST, LandmarkStrategy.AVOID)
+
+
+def _costs(graph, source, backward=False):
+    node_weights = graph.node_weights()
+    edge_weights = graph.edge_weights()
+    blocked_arcs = graph.blocked_arcs()
+    if backward:
+        offsets = graph.reverse_offsets()
+        nodes = graph.reverse_sources()
+        arcs = graph.reverse_arcs()
+    else:
+        offsets = graph.offsets()
+        nodes = graph.targets()
+        arcs = None
+
+    n = graph.nodes_number()
+    costs = [_infinity] * n
+    parents = [-1] * n
+    costs[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        cost, current = heappop(heap)
+        if cost > costs[current]:
+            continue
+        for i in range(offsets[current], offsets[current + 1]):
+            if blocked_arcs is not None and blocked_arcs[arcs[i] if backward else i]:
+                continue
+            node = nodes[i]
+            if backward:
+                node_cost = cost + edge_weights[arcs[i]] + node_weights[current]
+            else:
+                node_cost = cost + edge_weights[i] + node_weights[node]
+            if node_cost < costs[node]:
+                costs[node] = node_cost
+                parents[node] = current
+                heappush(heap, (node_cost, node))
+
+    return costs, parents
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class LandmarkTable(object):
+
+    def __init__(self, graph, count=8, strategy=LandmarkStrategy.AVOID, seed=0):
+        object.__init__(self)
+        if not LandmarkStrategy.appropriate(strategy):
+            raise ValueError('unknown landmark selection strategy: {0!r}'.format(strategy))
+        self._graph = graph if isinstance(graph, CompactGraph) else CompactGraph(graph)
+        self._random = Random(seed)
+        self._landmarks = []
+        self._distances_from = []
+        self._distances_to = []
+
+        count = min(count, self._graph.nodes_number())
+        select = {LandmarkStrategy.RANDOM: self._select_random,
+                  LandmarkStrategy.FARTHEST: self._select_farthest,
+                  LandmarkStrategy.AVOID: self._select_avoid}[strategy]
+        while len(self._landmarks) < count:
+            landmark = select()
+            if landmark < 0:
+                break
+            self._add_landmark(landmark)
+
+        self._random = None
+
+    def graph(self):
+        return self._graph
+
+    def version(self):
+        return self._graph.version()
+
+    def index(self, uid):
+        return self._graph.index(uid)
+
+    def landmarks(self):
+        return self._landmarks
+
+    def landmark_ids(self):
+        return [self._graph.node_id(landmark) for landmark in self._landmarks]
+
+    def distances_from(self, i):
+        return self._distances_from[i]
+
+    def distances_to(self, i):
+        return self._distances_to[i]
+
+    def lower_bound(self, index, target):
+        return self.heuristics(target)(index)
+
+    def heuristics(self, target):
+        # returns function which calculates lower bound of distance from node with given index to "target"
+        if target < 0:
+            return lambda index: 0
+        rows = []
+        for distances_from, distances_to in zip(self._distances_from, self._distances_to):
+            rows.append((distances_from, distances_to, distances_from[target], distances_to[target]))
+
+        def lower_bound(index):
+            if index < 0:
+                return 0
+            bound = 0
+            for distances_from, distances_to, from_landmark, to_landmark in rows:
+                if to_landmark != _infinity:
+                    to_node = distances_to[index]
+                    if to_node == _infinity:
+                        # target can reach the landmark and node can not, so node can not reach target
+                        return _infinity
+                    if to_node - to_landmark > bound:
+                        bound = to_node - to_landmark
+                if from_landmark != _infinity:
+                    from_node = distances_from[index]
+                    if from_node != _infinity and from_landmark - from_node > bound:
+                        bound = from_landmark - from_node
+            return bound
+
+        return lower_bound
+
+    def _add_landmark(self, landmark):
+        self._landmarks.append(landmark)
+        self._distances_from.append(array('d', _costs(self._graph, landmark)[0]))
+        self._distances_to.append(array('d', _costs(self._graph, landmark, backward=True)[0]))
+
+    def _candidates(self):
+        landmarks = set(self._landmarks)
+        return [node for node in range(self._graph.nodes_number()) if node not in landmarks]
+
+    def _select_random(self):
+        candidates = self._candidates()
+        return self._random.choice(candidates) if candidates else -1
+
+    def _select_farthest(self):
+        # next landmark is the node with the greatest distance to the closest of already selected landmarks
+        # (the first one is the farthest node from a random node)
+        if not self._landmarks:
+            root = self._select_random()
+            if root < 0:
+                return -1
+            sources = [_costs(self._graph, root)[0]]
+        else:
+            sources = self._distances_from
+        best = -1
+        best_cost = -1
+        for node in self._candidates():
+            cost = min(distances[node] for distances in sources)
+            if cost != _infinity and cost > best_cost:
+                best = node
+                best_cost = cost
+        return best if best >= 0 else self._select_random()
+
+    def _select_avoid(self):
+        # "avoid" heuristics of Goldberg and Werneck: grow shortest path tree from a random root, weight every node
+        # by how bad current lower bound from the root is, and take a leaf in the heaviest subtree without landmarks
+        root = self._select_random()
+        if root < 0:
+            return -1
+        costs, parents = _costs(self._graph, root)
+
+        n = self._graph.nodes_number()
+        children = [[] for _ in range(n)]
+        for node in range(n):
+            if parents[node] >= 0:
+                children[parents[node]].append(node)
+
+        order = []
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            queue.extend(children[node])
+
+        landmarks = set(self._landmarks)
+        sizes = [0] * n
+        covered = bytearray(n)
+        for node in reversed(order):
+            if node in landmarks:
+                covered[node] = 1
+            size = costs[node] - self._root_bound(root, node)
+            for child in children[node]:
+                if covered[child]:
+                    covered[node] = 1
+                size += sizes[child]
+            sizes[node] = 0 if covered[node] else size
+
+        best = max(order, key=lambda x: sizes[x])
+        if sizes[best] <= 0:
+            return self._select_random()
+        while children[best]:
+            best = max(children[best], key=lambda x: sizes[x])
+        return best if best not in landmarks else self._select_random()
+
+    def _root_bound(self, root, node):
+        bound = 0
+        for distances_from, distances_to in zip(self._distances_from, self._distances_to):
+            if distances_to[node] != _infinity and distances_to[root] != _infinity:
+                bound = max(bound, distances_to[root] - distances_to[node])
+            if distances_from[node] != _infinity and distances_from[root] != _infinity:
+                bound = max(bound, distances_from[node] - distances_from[root])
+        return bound
+
+#######################################################################################################################
+#######################################################################################################################
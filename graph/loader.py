@@ -0,0 +1,375 @@
+# coding=utf-8
+# -----------------
+# file      : loader.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Streaming loaders for edge lists.
+
+Supported formats:
+    * CSV edge list - one edge per row: head, tail[, weight[, direction[, edge id]]]; rows starting with "#"
+      and a header row are skipped, direction is EdgeDirection value (1, 2, 3) or its name;
+    * DIMACS shortest path format - ".gr" file with "a head tail weight" arcs and optional ".co" file with
+      "v id x y" coordinates.
+
+Files are read in chunks of lines, every chunk is added to the Graph in bulk (Graph.add_nodes(), Graph.add_edges())
+or directly to the arrays of CompactGraph if "compact" is True (no Node and Edge objects are created at all).
+Files with ".gz" extension are decompressed on the fly.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import csv
+import gzip
+import time
+from array import array
+from itertools import islice
+from .graph import Graph, EdgeDirection
+from .compact_graph import CompactGraph, _weights_array
+
+#######################################################################################################################
+#######################################################################################################################
+
+_directions = {'straight': EdgeDirection.STRAIGHT, 'reverse': EdgeDirection.REVERSE, 'mutual': EdgeDirection.MUTUAL}
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _direction(text, default):
+    if not text:
+        return default
+    direction = _directions.get(text.strip().lower(), None)
+    if direction is None:
+        direction = int(text)
+    if not EdgeDirection.appropriate(direction):
+        raise ValueError('wrong edge direction: {0!r}'.format(text))
+    return direction
+
+
+def _open(source):
+    # "source" is a file name or a text file object, returns (file, True if it has to be closed here)
+    if not isinstance(source, str):
+        return source, False
+    if source.endswith('.gz'):
+        return gzip.open(source, 'rt'), True
+    return open(source, 'r'), True
+
+
+def _chunks(lines, chunk_size):
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class LoadStatistics(object):
+
+    def __init__(self):
+        object.__init__(self)
+        self.lines = 0
+        self.nodes = 0
+        self.edges = 0
+        self.seconds = 0.0
+
+    def lines_per_second(self):
+        return self.lines / self.seconds if self.seconds > 0 else 0.0
+
+    def edges_per_second(self):
+        return self.edges / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        return '{0} nodes, {1} edges, {2} lines in {3:.3f} s ({4:.0f} edges/s)'.format(
+            self.nodes, self.edges, self.lines, self.seconds, self.edges_per_second())
+
+
+class LoadResult(object):
+
+    def __init__(self, graph, statistics, coordinates=None):
+        object.__init__(self)
+        self._graph = graph
+        self._statistics = statistics
+        self._coordinates = coordinates
+
+    def graph(self):
+        # Graph or CompactGraph
+        return self._graph
+
+    def statistics(self):
+        return self._statistics
+
+    def coordinates(self):
+        # {node id: (x, y)} for Graph (CompactGraph keeps coordinates itself) or None
+        return self._coordinates
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class _GraphBuilder(object):
+
+    # adds chunks of nodes and edges into a Graph
+
+    def __init__(self, graph, node_weight):
+        object.__init__(self)
+        self._graph = graph if graph is not None else Graph()
+        self._nodeWeight = node_weight
+        self._addedNodes = 0
+
+    def added_nodes(self):
+        return self._addedNodes
+
+    def add_nodes(self, ids):
+        weight = self._nodeWeight
+        self._addedNodes += self._graph.add_nodes((uid, weight) for uid in ids)
+
+    def add_edges(self, edges):
+        graph = self._graph
+        self.add_nodes([uid for edge in edges for uid in (edge[1], edge[2]) if graph.node(uid) is None])
+        return graph.add_edges(edges)
+
+    def finish(self, statistics, coordinates):
+        return LoadResult(self._graph, statistics, coordinates)
+
+
+class _CompactBuilder(object):
+
+    # collects arrays of edges and builds CompactGraph at the end
+
+    def __init__(self, node_weight):
+        object.__init__(self)
+        self._nodeWeight = node_weight
+        self._nodes = set()
+        self._edgeIds = array('q')
+        self._heads = array('q')
+        self._tails = array('q')
+        self._weights = []
+        self._nextId = 1
+        self._usedIds = set()
+
+    def added_nodes(self):
+        return len(self._nodes)
+
+    def add_nodes(self, ids):
+        self._nodes.update(uid for uid in ids if uid > 0)
+
+    def add_edges(self, edges):
+        nodes = self._nodes
+        used_ids = self._usedIds
+        added = 0
+        for uid, head, tail, direction, weight in edges:
+            if head == tail or head < 1 or tail < 1:
+                continue
+            if uid < 1:
+                while self._nextId in used_ids:
+                    self._nextId += 1
+                uid = self._nextId
+            elif uid in used_ids:
+                continue
+            used_ids.add(uid)
+            nodes.add(head)
+            nodes.add(tail)
+            if direction == EdgeDirection.REVERSE:
+                head, tail = tail, head
+            self._edgeIds.append(uid)
+            self._heads.append(head)
+            self._tails.append(tail)
+            self._weights.append(weight)
+            if direction == EdgeDirection.MUTUAL:
+                self._edgeIds.append(uid)
+                self._heads.append(tail)
+                self._tails.append(head)
+                self._weights.append(weight)
+            added += 1
+        return added
+
+    def finish(self, statistics, coordinates):
+        ids = array('q', sorted(self._nodes))
+        n = len(ids)
+        if n and ids[-1] == n:
+            index = None  # ids are 1..n as in DIMACS files
+        else:
+            index = dict((uid, i) for i, uid in enumerate(ids))
+
+        heads = self._heads
+        if index is None:
+            heads = array('q', (uid - 1 for uid in heads))
+            tails = array('q', (uid - 1 for uid in self._tails))
+        else:
+            heads = array('q', (index[uid] for uid in heads))
+            tails = array('q', (index[uid] for uid in self._tails))
+
+        # counting sort of arcs by head (stable, so arcs of a node stay in edge id order if they were read so)
+        edge_ids = self._edgeIds
+        offsets = [0] * (n + 1)
+        for head in heads:
+            offsets[head + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        positions = offsets[:-1]
+        order = [0] * len(heads)
+        for arc, head in enumerate(heads):
+            order[positions[head]] = arc
+            positions[head] += 1
+        for i in range(n):
+            arcs = order[offsets[i]:offsets[i + 1]]
+            if any(edge_ids[arcs[k]] > edge_ids[arcs[k + 1]] for k in range(len(arcs) - 1)):
+                order[offsets[i]:offsets[i + 1]] = sorted(arcs, key=edge_ids.__getitem__)
+
+        weights = self._weights
+        xs = ys = None
+        if coordinates is not None and n and all(uid in coordinates for uid in ids):
+            xs = array('d', (coordinates[uid][0] for uid in ids))
+            ys = array('d', (coordinates[uid][1] for uid in ids))
+
+        graph = CompactGraph.from_arrays(0, ids, _weights_array([self._nodeWeight] * n), array('q', offsets),
+                                         array('q', (tails[arc] for arc in order)),
+                                         array('q', (edge_ids[arc] for arc in order)),
+                                         _weights_array([weights[arc] for arc in order]), len(self._usedIds),
+                                         xs, ys)
+        return LoadResult(graph, statistics)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _load(rows, builder, statistics, progress):
+    # "rows" yields parsed chunks: (number of lines, node ids or None, list of (uid, head, tail, direction, weight))
+    started = time.perf_counter()
+    for chunk_lines, nodes, edges in rows:
+        if nodes:
+            builder.add_nodes(nodes)
+        if edges:
+            statistics.edges += builder.add_edges(edges)
+        statistics.nodes = builder.added_nodes()
+        statistics.lines += chunk_lines
+        statistics.seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(statistics)
+
+
+def _edge_list_rows(file, chunk_size, delimiter, direction, weight):
+    lines = (line for line in file if line.strip() and not line.lstrip().startswith('#'))
+    first = True
+    for chunk in _chunks(csv.reader(lines, delimiter=delimiter, skipinitialspace=True), chunk_size):
+        edges = []
+        for row in chunk:
+            if first:
+                first = False
+                try:
+                    int(row[0])
+                except ValueError:
+                    continue  # header
+            columns = len(row)
+            if columns < 2:
+                raise ValueError('edge list row must contain at least head and tail: {0!r}'.format(row))
+            edges.append((int(row[4]) if columns > 4 and row[4] else 0, int(row[0]), int(row[1]),
+                          _direction(row[3], direction) if columns > 3 else direction,
+                          _number(row[2]) if columns > 2 and row[2] else weight))
+        yield len(chunk), None, edges
+
+
+def load_edge_list(source, graph=None, compact=False, direction=EdgeDirection.STRAIGHT, weight=1, node_weight=1,
+                   delimiter=',', chunk_size=65536, progress=None):
+
+    # "source" is a file name or a text file object. Nodes are created for all ids mentioned in the file.
+    # "direction" and "weight" are used for rows without these columns.
+    # "progress" is called with LoadStatistics after every chunk. Returns LoadResult.
+
+    builder = _CompactBuilder(node_weight) if compact else _GraphBuilder(graph, node_weight)
+    statistics = LoadStatistics()
+    file, close = _open(source)
+    try:
+        _load(_edge_list_rows(file, chunk_size, delimiter, direction, weight), builder, statistics, progress)
+    finally:
+        if close:
+            file.close()
+    return builder.finish(statistics, None)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _dimacs_rows(file, chunk_size, direction):
+    for chunk in _chunks(iter(file), chunk_size):
+        nodes = None
+        edges = []
+        for line in chunk:
+            if line.startswith('a'):
+                _, head, tail, weight = line.split()
+                edges.append((0, int(head), int(tail), direction, _number(weight)))
+            elif line.startswith('p'):
+                fields = line.split()
+                nodes = range(1, int(fields[2]) + 1)
+        yield len(chunk), nodes, edges
+
+
+def _dimacs_coordinates(source):
+    coordinates = {}
+    file, close = _open(source)
+    try:
+        for line in file:
+            if line.startswith('v'):
+                _, uid, x, y = line.split()
+                coordinates[int(uid)] = (_number(x), _number(y))
+    finally:
+        if close:
+            file.close()
+    return coordinates
+
+
+def load_dimacs(gr_source, co_source=None, graph=None, compact=False, direction=EdgeDirection.STRAIGHT,
+                node_weight=1, chunk_size=65536, progress=None):
+
+    # DIMACS arcs are directed, road networks list both directions of a road as separate arcs.
+    # Coordinates from "co_source" go into CompactGraph or into LoadResult.coordinates() for Graph.
+
+    builder = _CompactBuilder(node_weight) if compact else _GraphBuilder(graph, node_weight)
+    statistics = LoadStatistics()
+    file, close = _open(gr_source)
+    try:
+        _load(_dimacs_rows(file, chunk_size, direction), builder, statistics, progress)
+    finally:
+        if close:
+            file.close()
+
+    coordinates = _dimacs_coordinates(co_source) if co_source is not None else None
+    return builder.finish(statistics, coordinates)
+
+#######################################################################################################################
+#######################################################################################################################
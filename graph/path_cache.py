@@ -0,0 +1,200 @@
+# coding=utf-8
+# -----------------
+# file      : path_cache.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Memoizing layer in front of search functions.
+
+Results are kept in LRU order within limits on number of entries and estimated memory.
+Before every lookup the cache reads Graph.changes_since() and evicts entries affected by the changes:
+ - weight growth, edge removal or disabling evicts only paths going through changed nodes or edges;
+ - weight decrease also evicts every result of weight-dependent algorithms (any path may become shorter);
+ - new edges or enabling clears the cache.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from collections import OrderedDict
+from sys import getsizeof
+from .graph import ChangeKind
+from .algorithms import search_algorithm, unweighted_algorithms
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def _object_size(obj):
+    size = getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += getsizeof(obj.__dict__)
+    return size
+
+
+def _path_size(path):
+    size = _object_size(path) + getsizeof(path._path)
+    for edge_info in path:
+        size += _object_size(edge_info)
+    return size
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class PathCache(object):
+
+    def __init__(self, graph, capacity=4096, max_memory=32 * 1024 * 1024):
+        object.__init__(self)
+        self._graph = graph
+        self._capacity = capacity
+        self._maxMemory = max_memory
+        self._entries = OrderedDict()  # (begin, end, algorithm) -> (path, size)
+        self._byNode = {}
+        self._byEdge = {}
+        self._memory = 0
+        self._version = graph.version()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def hits(self):
+        return self._hits
+
+    def misses(self):
+        return self._misses
+
+    def evictions(self):
+        return self._evictions
+
+    def invalidations(self):
+        return self._invalidations
+
+    def memory(self):
+        return self._memory
+
+    def clear(self):
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._byNode.clear()
+        self._byEdge.clear()
+        self._memory = 0
+
+    def search(self, begin, end, algorithm='dijkstra'):
+        function = search_algorithm(algorithm)
+        self._synchronize()
+
+        key = (begin, end, function)
+        entry = self._entries.get(key, None)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self._misses += 1
+        path = function(begin, end, self._graph)
+        self._insert(key, path)
+        return path
+
+    def _insert(self, key, path):
+        size = _path_size(path)
+        if size > self._maxMemory or self._capacity < 1:
+            return
+        self._entries[key] = (path, size)
+        self._memory += size
+        for node_id in self._path_nodes(key, path):
+            self._byNode.setdefault(node_id, set()).add(key)
+        for edge_info in path:
+            self._byEdge.setdefault(edge_info.id(), set()).add(key)
+        while len(self._entries) > self._capacity or self._memory > self._maxMemory:
+            self._evictions += 1
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        path, size = self._entries.pop(key)
+        self._memory -= size
+        for node_id in self._path_nodes(key, path):
+            self._discard(self._byNode, node_id, key)
+        for edge_info in path:
+            self._discard(self._byEdge, edge_info.id(), key)
+
+    @staticmethod
+    def _path_nodes(key, path):
+        nodes = set(edge_info.tail() for edge_info in path)
+        if path:
+            nodes.add(key[0])
+        return nodes
+
+    @staticmethod
+    def _discard(index, uid, key):
+        keys = index.get(uid, None)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[uid]
+
+    def _invalidate(self, keys):
+        for key in list(keys):
+            if key in self._entries:
+                self._invalidations += 1
+                self._remove(key)
+
+    def _synchronize(self):
+        version = self._graph.version()
+        if version == self._version:
+            return
+        changes = self._graph.changes_since(self._version)
+        self._version = version
+        if changes is None:
+            self.clear()
+            return
+        for change in changes:
+            if not self._entries:
+                return
+            if change.kind() == ChangeKind.STRUCTURE and not change.increase() and not change.edges():
+                continue  # new node without edges changes nothing
+            if change.edges():
+                for edge_id in change.edges():
+                    self._invalidate(self._byEdge.get(edge_id, ()))
+            else:
+                for node_id in change.nodes():
+                    self._invalidate(self._byNode.get(node_id, ()))
+            if change.increase():
+                continue
+            if change.kind() == ChangeKind.WEIGHT:
+                self._invalidate([key for key in self._entries if key[2] not in unweighted_algorithms])
+            else:
+                self.clear()
+
+#######################################################################################################################
+#######################################################################################################################
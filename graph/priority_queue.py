@@ -0,0 +1,220 @@
+# coding=utf-8
+# -----------------
+# file      : priority_queue.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+"""
+Priority queues used by Dijkstra's and A* searches.
+
+Every queue supports push(item, key) (which is also decrease-key: a push with a greater or equal key
+for an item that is already queued is ignored), pop() -> (item, key), len() and "in".
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from heapq import heappush, heappop
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class QueueType(object):
+
+    BINARY_HEAP = 'binary'
+    RADIX_HEAP = 'radix'
+
+    @staticmethod
+    def appropriate(queue_type):
+        return queue_type in _queue_types
+
+
+def create_priority_queue(queue_type=QueueType.BINARY_HEAP):
+    if isinstance(queue_type, type):
+        return queue_type()
+    queue_class = _queue_types.get(queue_type, None)
+    if queue_class is None:
+        raise ValueError('unknown priority queue type: {0!r}'.format(queue_type))
+    return queue_class()
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class BinaryHeap(object):
+
+    # Decrease-key pushes a new entry and leaves the old one in the heap, outdated entries are skipped by pop().
+
+    def __init__(self):
+        object.__init__(self)
+        self._heap = []
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __bool__(self):
+        return bool(self._keys)
+
+    def __contains__(self, item):
+        return item in self._keys
+
+    def key(self, item):
+        return self._keys.get(item, None)
+
+    def clear(self):
+        del self._heap[:]
+        self._keys.clear()
+
+    def push(self, item, key):
+        current = self._keys.get(item, None)
+        if current is not None and current <= key:
+            return False
+        self._keys[item] = key
+        heappush(self._heap, (key, item))
+        return True
+
+    def pop(self):
+        heap = self._heap
+        keys = self._keys
+        while heap:
+            key, item = heappop(heap)
+            if keys.get(item, None) == key:
+                del keys[item]
+                return item, key
+        raise IndexError('pop from an empty priority queue')
+
+    def peek(self):
+        heap = self._heap
+        keys = self._keys
+        while heap:
+            key, item = heap[0]
+            if keys.get(item, None) == key:
+                return item, key
+            heappop(heap)
+        raise IndexError('peek from an empty priority queue')
+
+    def update(self, item, key):
+        # unlike push() this may also increase the key
+        if self._keys.get(item, None) != key:
+            self._keys[item] = key
+            heappush(self._heap, (key, item))
+
+    def remove(self, item):
+        self._keys.pop(item, None)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class RadixHeap(object):
+
+    # Monotone priority queue for non-negative integer keys (integer edge and node weights).
+    # Bucket i holds entries whose key differs from the last extracted key in bit (i - 1) at most,
+    # so every entry is moved between buckets at most O(log C) times.
+    # Keys lower than the last extracted key can only appear with inconsistent A* heuristics,
+    # such keys are raised up to the last extracted key.
+
+    def __init__(self):
+        object.__init__(self)
+        self._buckets = [[]]
+        self._keys = {}
+        self._last = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __bool__(self):
+        return bool(self._keys)
+
+    def __contains__(self, item):
+        return item in self._keys
+
+    def key(self, item):
+        return self._keys.get(item, None)
+
+    def clear(self):
+        self._buckets = [[]]
+        self._keys.clear()
+        self._last = 0
+
+    def push(self, item, key):
+        if not isinstance(key, int):
+            if key != int(key):
+                raise ValueError('radix heap requires integer keys, got {0!r}'.format(key))
+            key = int(key)
+        if key < self._last:
+            key = self._last
+        current = self._keys.get(item, None)
+        if current is not None and current <= key:
+            return False
+        self._keys[item] = key
+        self._bucket((key ^ self._last).bit_length()).append((key, item))
+        return True
+
+    def pop(self):
+        buckets = self._buckets
+        keys = self._keys
+        while keys:
+            bucket = buckets[0]
+            if not bucket:
+                self._redistribute()
+                bucket = buckets[0]
+            key, item = bucket.pop()
+            if keys.get(item, None) == key:
+                del keys[item]
+                return item, key
+        raise IndexError('pop from an empty priority queue')
+
+    def _bucket(self, i):
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append([])
+        return buckets[i]
+
+    def _redistribute(self):
+        buckets = self._buckets
+        keys = self._keys
+        for i in range(1, len(buckets)):
+            if buckets[i]:
+                entries = [entry for entry in buckets[i] if keys.get(entry[1], None) == entry[0]]
+                buckets[i] = []
+                if entries:
+                    last = min(entries)[0]
+                    self._last = last
+                    for entry in entries:
+                        buckets[(entry[0] ^ last).bit_length()].append(entry)
+                    return
+
+#######################################################################################################################
+#######################################################################################################################
+
+_queue_types = {QueueType.BINARY_HEAP: BinaryHeap, QueueType.RADIX_HEAP: RadixHeap}
+
+#######################################################################################################################
+#######################################################################################################################
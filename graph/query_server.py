@@ -0,0 +1,387 @@
+# coding=utf-8
+# -----------------
+# file      : query_server.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Local multi-process query server.
+
+The graph is loaded once and published into shared memory (see graph.shared_graph), N worker processes
+attach to it and answer queries in parallel. Clients connect to a TCP port on localhost or to a Unix socket
+and send one JSON object per line:
+
+    {"id": 1, "begin": 10, "end": 20, "algorithm": "dijkstra"}  ->  {"id": 1, "nodes": [...], "edges": [...],
+                                                                      "total_weight": ..., "iterations": ...}
+    {"command": "statistics"}                                   ->  {"statistics": {...}}
+
+Identical queries (same begin, end and algorithm) that are in flight at the same time are calculated once.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import os
+import json
+import time
+import socket
+import socketserver
+import threading
+import multiprocessing
+from .algorithms import search_algorithm
+from .shared_graph import share_graph, attach_graph
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def path_result(path):
+    # JSON friendly representation of a Path
+    nodes = []
+    edges = []
+    for edge_info in path:
+        if not nodes:
+            nodes.append(edge_info.head())
+        nodes.append(edge_info.tail())
+        edges.append(edge_info.id())
+    return {'nodes': nodes, 'edges': edges, 'total_weight': path.total_weight(), 'iterations': path.iterations()}
+
+
+def _worker_main(index, descriptor, tasks, results):
+    shared = attach_graph(descriptor)
+    graph = shared.graph()
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            uid, begin, end, algorithm, enqueued = task
+            started = time.monotonic()
+            try:
+                result = path_result(search_algorithm(algorithm)(begin, end, graph))
+            except Exception as error:
+                result = {'error': str(error)}
+            results.put((uid, index, result, enqueued, started, time.monotonic()))
+    finally:
+        graph = None
+        shared.close()
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class WorkerStatistics(object):
+
+    def __init__(self, index):
+        object.__init__(self)
+        self.index = index
+        self.queries = 0
+        self.busy_time = 0.0
+        self.queue_latency = 0.0
+        self.max_queue_latency = 0.0
+
+    def add(self, enqueued, started, finished):
+        latency = max(0.0, started - enqueued)
+        self.queries += 1
+        self.busy_time += finished - started
+        self.queue_latency += latency
+        self.max_queue_latency = max(self.max_queue_latency, latency)
+
+    def as_dict(self, uptime):
+        queries = self.queries
+        return {
+            'worker': self.index,
+            'queries': queries,
+            'busy_time': self.busy_time,
+            'throughput': queries / uptime if uptime > 0 else 0.0,  # queries per second of server uptime
+            'busy_throughput': queries / self.busy_time if self.busy_time > 0 else 0.0,
+            'mean_queue_latency': self.queue_latency / queries if queries else 0.0,
+            'max_queue_latency': self.max_queue_latency
+        }
+
+
+class _PendingQuery(object):
+
+    def __init__(self, key):
+        object.__init__(self)
+        self.key = key
+        self.done = threading.Event()
+        self.result = None
+        self.waiters = 1
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        query_server = self.server.query_server
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            request = {}
+            try:
+                request = json.loads(line.decode('utf-8'))
+                if not isinstance(request, dict):
+                    request = {}
+                    raise ValueError('request must be a JSON object')
+                if request.get('command', None) == 'statistics':
+                    response = {'statistics': query_server.statistics()}
+                else:
+                    response = query_server.search(request['begin'], request['end'],
+                                                   request.get('algorithm', 'dijkstra'))
+            except KeyError as error:
+                response = {'error': 'missing request field: {0}'.format(error.args[0])}
+            except (ValueError, TypeError) as error:
+                response = {'error': str(error)}
+            if 'id' in request:
+                response = dict(response, id=request['id'])
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:
+    _UnixServer = None
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class QueryServer(object):
+
+    # "address" is a (host, port) tuple for TCP (port 0 picks a free port) or a path of Unix socket.
+
+    def __init__(self, graph, address=('127.0.0.1', 0), workers=None):
+        object.__init__(self)
+        self._graph = graph
+        self._address = address
+        self._workersNumber = workers if workers is not None else multiprocessing.cpu_count()
+        self._shared = None
+        self._workers = []
+        self._tasks = None
+        self._results = None
+        self._server = None
+        self._threads = []
+        self._lock = threading.Lock()
+        self._inFlight = {}
+        self._byTask = {}
+        self._nextTask = 0
+        self._workerStatistics = [WorkerStatistics(i) for i in range(self._workersNumber)]
+        self._queries = 0
+        self._coalesced = 0
+        self._started = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def address(self):
+        # actual address the server listens to (with the real port number if port 0 was requested)
+        if self._server is not None:
+            return self._server.server_address
+        return self._address
+
+    def start(self):
+        if self._started is not None:
+            return self.address()
+
+        self._shared = share_graph(self._graph)
+        self._graph = None  # the snapshot is all the server needs
+
+        context = multiprocessing.get_context()
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        descriptor = self._shared.descriptor()
+        for i in range(self._workersNumber):
+            worker = context.Process(target=_worker_main, args=(i, descriptor, self._tasks, self._results))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+        if isinstance(self._address, str):
+            if _UnixServer is None:
+                raise ValueError('Unix sockets are not supported on this platform')
+            self._server = _UnixServer(self._address, _RequestHandler)
+        else:
+            self._server = _TCPServer(self._address, _RequestHandler)
+        self._server.query_server = self
+
+        self._started = time.monotonic()
+        for target in (self._dispatch_results, self._server.serve_forever):
+            thread = threading.Thread(target=target)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+        return self.address()
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while self._server is not None:
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.unlink(self._address)
+        self._server = None
+
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+        self._results.put(None)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads = []
+
+        with self._lock:
+            for pending in self._inFlight.values():
+                pending.result = {'error': 'server is shut down'}
+                pending.done.set()
+            self._inFlight.clear()
+            self._byTask.clear()
+
+        self._shared.close()
+        self._shared = None
+
+    def search(self, begin, end, algorithm='dijkstra'):
+        # blocks until a worker answers, returns the same dict as path_result() or {"error": message}
+
+        search_algorithm(algorithm)  # raises ValueError for unknown algorithms
+        if not isinstance(algorithm, str):
+            raise ValueError('algorithm must be specified by name')
+
+        key = (begin, end, algorithm)
+        with self._lock:
+            if self._server is None:
+                return {'error': 'server is not running'}
+            self._queries += 1
+            pending = self._inFlight.get(key, None)
+            if pending is not None:
+                pending.waiters += 1
+                self._coalesced += 1
+            else:
+                pending = _PendingQuery(key)
+                self._inFlight[key] = pending
+                uid = self._nextTask
+                self._nextTask += 1
+                self._byTask[uid] = pending
+                self._tasks.put((uid, begin, end, algorithm, time.monotonic()))
+
+        pending.done.wait()
+        return pending.result
+
+    def statistics(self):
+        with self._lock:
+            uptime = time.monotonic() - self._started if self._started is not None else 0.0
+            return {
+                'uptime': uptime,
+                'queries': self._queries,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._inFlight),
+                'workers': [statistics.as_dict(uptime) for statistics in self._workerStatistics]
+            }
+
+    def _dispatch_results(self):
+        while True:
+            message = self._results.get()
+            if message is None:
+                break
+            uid, index, result, enqueued, started, finished = message
+            with self._lock:
+                self._workerStatistics[index].add(enqueued, started, finished)
+                pending = self._byTask.pop(uid, None)
+                if pending is None:
+                    continue
+                del self._inFlight[pending.key]
+            pending.result = result
+            pending.done.set()
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class QueryClient(object):
+
+    def __init__(self, address):
+        object.__init__(self)
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.connect(address)
+        self._file = self._socket.makefile('rwb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def request(self, request):
+        self._file.write(json.dumps(request).encode('utf-8') + b'\n')
+        self._file.flush()
+        return json.loads(self._file.readline().decode('utf-8'))
+
+    def search(self, begin, end, algorithm='dijkstra'):
+        return self.request({'begin': begin, 'end': end, 'algorithm': algorithm})
+
+    def statistics(self):
+        return self.request({'command': 'statistics'})['statistics']
+
+#######################################################################################################################
+#######################################################################################################################
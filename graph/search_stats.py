@@ -0,0 +1,226 @@
+# coding=utf-8
+# -----------------
+# file      : search_stats.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Statistics of a single search and optional profiling hooks.
+
+Every search function attaches SearchStats to the returned Path (see Path.stats()):
+
+    settled      - nodes taken from the queue (or the stack) and expanded
+    relaxations  - arcs tried for a node which is not settled yet
+    pushes, pops - priority queue (or frontier) operations
+    peak_queue   - maximum number of entries in the queue
+    peak_memory  - estimated size in bytes of bookkeeping containers (costs, parents, visited flags, queue):
+                   their size when the search ends plus peak_queue times the size of one queue entry. Costs,
+                   parents and visited flags only grow, so this estimates the peak, it is not a measured one
+    phases       - wall-clock seconds of 'prepare', 'search' and 'path' phases
+
+Search functions also accept "hooks" - an object with on_settle(node, cost), on_relax(head, tail, edge, cost)
+and on_push(node, key) methods (node and edge ids), see SearchHooks. Without hooks only one "is not None" check
+per event is made. SearchStatsAggregate sums statistics of many queries.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+import sys
+from time import perf_counter
+
+#######################################################################################################################
+#######################################################################################################################
+
+# estimated size of a priority queue entry: (key, item) tuple, its slot in the heap list and a slot in the keys dict
+queue_entry_size = 120
+# estimated size of a depth-first stack entry: _StackEntry with an iterator over node edges (Graph)
+# or [node, arc] list with the arc position (CompactGraph)
+stack_entry_size = 160
+compact_stack_entry_size = 104
+# breadth-first frontier entry: a reference in the queue, nodes themselves are not copied
+frontier_entry_size = 8
+
+counters = ('settled', 'relaxations', 'pushes', 'pops', 'peak_queue', 'peak_memory')
+phases = ('prepare', 'search', 'path')
+
+
+def containers_size(*containers):
+    # size in bytes of containers themselves (not of shared items), None entries are skipped
+    return sum(sys.getsizeof(container) for container in containers if container is not None)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SearchHooks(object):
+
+    # Base class for profiling hooks, override needed methods. Methods of a compact search get node and edge ids too.
+
+    def on_settle(self, node, cost):
+        pass
+
+    def on_relax(self, head, tail, edge, cost):
+        pass
+
+    def on_push(self, node, key):
+        pass
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SearchStats(object):
+
+    def __init__(self):
+        object.__init__(self)
+        self._settled = 0
+        self._relaxations = 0
+        self._pushes = 0
+        self._pops = 0
+        self._peakQueue = 0
+        self._peakMemory = 0
+        self._phases = {}
+        self._mark = perf_counter()
+
+    def settled(self):
+        return self._settled
+
+    def relaxations(self):
+        return self._relaxations
+
+    def pushes(self):
+        return self._pushes
+
+    def pops(self):
+        return self._pops
+
+    def peak_queue(self):
+        return self._peakQueue
+
+    def peak_memory(self):
+        return self._peakMemory
+
+    def phases(self):
+        return self._phases
+
+    def time(self):
+        return sum(self._phases.values())
+
+    def record(self, settled, relaxations, pushes, pops, peak_queue, peak_memory):
+        # counters of a search, called once by search functions (bidirectional searches pass sums of both directions)
+        self._settled += settled
+        self._relaxations += relaxations
+        self._pushes += pushes
+        self._pops += pops
+        self._peakQueue = max(self._peakQueue, peak_queue)
+        self._peakMemory += peak_memory
+
+    def lap(self, phase):
+        # adds time passed since the previous lap (or construction) to "phase"
+        now = perf_counter()
+        self._phases[phase] = self._phases.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def attach(self, path):
+        # finishes the last phase and attaches statistics to "path", returns the path
+        self.lap('path' if 'search' in self._phases else 'prepare')
+        path.set_stats(self)
+        return path
+
+    def as_dict(self):
+        result = dict((name, getattr(self, name)()) for name in counters)
+        result['phases'] = dict(self._phases)
+        return result
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SearchStatsAggregate(object):
+
+    # Sums statistics of many searches: counters and phase times are summed, peaks are maximums.
+
+    def __init__(self):
+        object.__init__(self)
+        self._queries = 0
+        self._totals = dict((name, 0) for name in counters)
+        self._phases = dict((name, 0.0) for name in phases)
+
+    def add(self, stats):
+        # "stats" is SearchStats or Path (paths without statistics are counted as queries only)
+        if not isinstance(stats, SearchStats):
+            stats = stats.stats()
+        self._queries += 1
+        if stats is None:
+            return
+        totals = self._totals
+        for name in counters:
+            value = getattr(stats, name)()
+            if name.startswith('peak_'):
+                totals[name] = max(totals[name], value)
+            else:
+                totals[name] += value
+        for name, seconds in stats.phases().items():
+            self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def merge(self, other):
+        self._queries += other._queries
+        for name in counters:
+            if name.startswith('peak_'):
+                self._totals[name] = max(self._totals[name], other._totals[name])
+            else:
+                self._totals[name] += other._totals[name]
+        for name, seconds in other._phases.items():
+            self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def queries(self):
+        return self._queries
+
+    def total(self, name):
+        # sum of a counter (maximum for peak_queue and peak_memory)
+        return self._totals[name]
+
+    def mean(self, name):
+        if not self._queries:
+            return 0.0
+        return self._totals[name] / float(self._queries)
+
+    def phase_time(self, phase):
+        return self._phases.get(phase, 0.0)
+
+    def time(self):
+        return sum(self._phases.values())
+
+    def as_dict(self):
+        result = {'queries': self._queries, 'phases': dict(self._phases)}
+        result.update(self._totals)
+        return result
+
+#######################################################################################################################
+#######################################################################################################################
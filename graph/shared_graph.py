@@ -0,0 +1,160 @@
+# coding=utf-8
+# -----------------
+# file      : shared_graph.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+CompactGraph snapshot published in shared memory.
+
+share_graph() copies all arrays of a snapshot into one shared memory block once, other processes
+call attach_graph() with the picklable descriptor and get a CompactGraph whose arrays are
+memoryviews of the same pages (nothing is copied or unpickled).
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from multiprocessing.shared_memory import SharedMemory
+from .compact_graph import CompactGraph, _typecode
+
+#######################################################################################################################
+#######################################################################################################################
+
+# every array is int64 ('q') or double ('d')
+_item_size = 8
+
+
+def _graph_arrays(graph):
+    # the same order as arguments of CompactGraph.from_arrays() (except edges number)
+    xs, ys = graph.coordinates()
+    return (graph.ids(), graph.node_weights(), graph.offsets(), graph.targets(), graph.edge_ids(),
+            graph.edge_weights(), xs, ys, graph.reverse_offsets(), graph.reverse_sources(), graph.reverse_arcs())
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SharedGraph(object):
+
+    # Use share_graph() and attach_graph() instead of creating SharedGraph directly.
+
+    def __init__(self, memory, descriptor, owner):
+        object.__init__(self)
+        self._memory = memory
+        self._descriptor = descriptor
+        self._owner = owner
+        self._views = []
+
+        _, version, edges_number, layout = descriptor
+        arrays = []
+        for typecode, offset, length in layout:
+            if typecode is None:
+                arrays.append(None)
+                continue
+            view = memory.buf[offset:offset + length * _item_size]
+            self._views.append(view)
+            view = view.cast(typecode)
+            self._views.append(view)
+            arrays.append(view)
+
+        self._graph = CompactGraph.from_arrays(version, arrays[0], arrays[1], arrays[2], arrays[3], arrays[4],
+                                               arrays[5], edges_number, *arrays[6:])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def name(self):
+        return self._memory.name
+
+    def size(self):
+        return self._memory.size
+
+    def descriptor(self):
+        # picklable (name, version, edges number, layout) tuple for attach_graph()
+        return self._descriptor
+
+    def graph(self):
+        return self._graph
+
+    def close(self):
+        # The graph must not be used after close(). The owner also destroys the shared memory block.
+        if self._memory is None:
+            return
+        self._graph = None
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+        self._memory = None
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def share_graph(graph, name=None):
+    # "graph" is a Graph or a CompactGraph, reverse arrays are built before publishing so they are shared too
+
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph(graph)
+    elif graph.blocked_arcs() is not None:
+        raise ValueError('masked graph can not be shared, share a CompactGraph of its SubgraphView instead')
+
+    arrays = _graph_arrays(graph)
+    layout = []
+    size = 0
+    for values in arrays:
+        if values is None:
+            layout.append((None, 0, 0))
+            continue
+        layout.append((_typecode(values), size, len(values)))
+        size += len(values) * _item_size
+
+    memory = SharedMemory(name=name, create=True, size=max(size, 1))
+    try:
+        for values, (typecode, offset, length) in zip(arrays, layout):
+            if typecode is not None and length:
+                memory.buf[offset:offset + length * _item_size] = memoryview(values).cast('B')
+        descriptor = (memory.name, graph.version(), graph.edges_number(), tuple(layout))
+        return SharedGraph(memory, descriptor, True)
+    except Exception:
+        memory.close()
+        memory.unlink()
+        raise
+
+
+def attach_graph(descriptor):
+    return SharedGraph(SharedMemory(name=descriptor[0]), descriptor, False)
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,171 @@
+# coding=utf-8
+# -----------------
+# file      : shortest_path_tree.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+One-to-all shortest paths: a single Dijkstra's search from one source stored as compact
+distance and parent arrays, Path to any target is extracted on demand.
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from array import array
+from .graph import Path
+from .compact_graph import CompactGraph
+from .dijkstra_search import compact_dijkstra
+from .priority_queue import QueueType
+from .search_stats import SearchStats
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class ShortestPathTree(object):
+
+    # Arrays are indexed by node indices of graph() (see CompactGraph.index()).
+    # Cost of a node does not include weight of the source node, distance() does (like Path.total_weight()).
+    # The only exception is the source itself: its distance is 0, as total weight of the empty path(source)
+    # and as the diagonal of DistanceMatrix.
+    # If the tree was built for a limited set of targets, nodes which were not settled are reported as unreachable.
+
+    def __init__(self, graph, source, costs, parents, parent_arcs, iterations=0, stats=None):
+        object.__init__(self)
+        self._graph = graph
+        self._source = source
+        self._costs = costs
+        self._parents = parents
+        self._parent_arcs = parent_arcs
+        self._iterations = iterations
+        self._stats = stats
+
+    def stats(self):
+        # SearchStats of the tree search, it is shared by all paths taken from the tree
+        return self._stats
+
+    def graph(self):
+        return self._graph
+
+    def source(self):
+        return self._graph.node_id(self._source)
+
+    def iterations(self):
+        return self._iterations
+
+    def costs(self):
+        return self._costs
+
+    def parents(self):
+        return self._parents
+
+    def parent_arcs(self):
+        return self._parent_arcs
+
+    def reachable(self, uid):
+        i = self._graph.index(uid)
+        return i >= 0 and (i == self._source or self._parent_arcs[i] >= 0)
+
+    def distance(self, uid):
+        i = self._graph.index(uid)
+        if i < 0 or self._parent_arcs[i] < 0:
+            return 0 if i == self._source and i >= 0 else None
+        return self._costs[i] + self._graph.node_weights()[self._source]
+
+    def parent(self, uid):
+        i = self._graph.index(uid)
+        if i < 0 or self._parent_arcs[i] < 0:
+            return None
+        return self._graph.node_id(self._parents[i])
+
+    def path(self, uid):
+        i = self._graph.index(uid)
+        if i < 0 or i == self._source or self._parent_arcs[i] < 0:
+            path = Path()
+        else:
+            path = self._graph.path_from_parents(self._parents, self._parent_arcs, self._source, i, self._iterations)
+        path.set_stats(self._stats)
+        return path
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+def shortest_path_tree(begin, graph, queue_type=QueueType.BINARY_HEAP, targets=None, cancellation=None, hooks=None):
+
+    # "graph" is a Graph or a CompactGraph (a snapshot of a Graph is taken, reuse CompactGraph for many sources).
+    # If "targets" (node ids) are given then the search stops as soon as all of them are settled.
+
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph(graph)
+
+    start = graph.index(begin)
+    if start < 0:
+        return None
+
+    target_indices = None
+    if targets is not None:
+        target_indices = [i for i in (graph.index(uid) for uid in targets) if i >= 0]
+
+    stats = SearchStats()
+    costs, parents, parent_arcs, iterations = tree_arrays(graph, start, target_indices, queue_type, cancellation,
+                                                          hooks, stats)
+    stats.lap('path')
+    return ShortestPathTree(graph, start, costs, parents, parent_arcs, iterations, stats)
+
+
+def tree_arrays(graph, start, targets=None, queue_type=QueueType.BINARY_HEAP, cancellation=None, hooks=None,
+                stats=None):
+
+    # Same as shortest_path_tree() but for node indices, returns arrays of ShortestPathTree and number of iterations.
+
+    if targets is not None and not targets:
+        # nothing to wait for: only the source is settled, no search is made
+        n = graph.nodes_number()
+        costs = array('q', [-1]) * n if graph.integer_weights() else array('d', [float('inf')]) * n
+        costs[start] = 0
+        return costs, array('q', [-1]) * n, array('q', [-1]) * n, 0
+
+    costs, parents, parent_arcs, visited_nodes, iterations = compact_dijkstra(graph, start, targets, queue_type,
+                                                                           cancellation, hooks, stats)
+
+    for i in range(len(parent_arcs)):
+        if not visited_nodes[i]:
+            parent_arcs[i] = -1
+            parents[i] = -1
+
+    if graph.integer_weights():
+        costs = array('q', (cost if visited_nodes[i] else -1 for i, cost in enumerate(costs)))
+    else:
+        costs = array('d', (cost if visited_nodes[i] else float('inf') for i, cost in enumerate(costs)))
+
+    return costs, array('q', parents), array('q', parent_arcs), iterations
+
+#######################################################################################################################
+#######################################################################################################################
@@ -0,0 +1,311 @@
+# coding=utf-8
+# -----------------
+# file      : subgraph.py
+# date      : 2026/10/18
+# author    : Victor Zarubkin
+# contact   : victor.zarubkin@gmail.com
+# copyright : Copyright (C) 2015  Victor Zarubkin
+# license   : This file is part of GraphTutorial.
+#           :
+#           : GraphTutorial is free software: you can redistribute it and/or modify
+#           : it under the terms of the GNU General Public License as published by
+#           : the Free Software Foundation, either version 3 of the License, or
+#           : (at your option) any later version.
+#           :
+#           : GraphTutorial is distributed in the hope that it will be useful,
+#           : but WITHOUT ANY WARRANTY; without even the implied warranty of
+#           : MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#           : GNU General Public License for more details.
+#           :
+#           : You should have received a copy of the GNU General Public License
+#           : along with BehaviorStudio. If not, see <http://www.gnu.org/licenses/>.
+#           :
+#           : A copy of the GNU General Public License can be found in file LICENSE.
+############################################################################
+
+
+"""
+Masked subgraphs which share storage with the original graph.
+
+SubgraphView wraps Graph and hides nodes and edges rejected by filters (by default disabled items are hidden)
+or blocked explicitly. Every search function accepts the view instead of Graph. The view keeps one byte per node
+and per edge id and refreshes only items reported by Graph.changes_since(), so enabling or disabling an item
+costs a mask update on the next search instead of a rebuild.
+
+CompactSubgraph is CompactGraph sharing all arrays of another snapshot plus a per arc mask, compact searches
+skip masked arcs. SubgraphView.compact() creates one which follows the view. ContractionHierarchy and
+LandmarkTable built over CompactSubgraph use the mask as it was at construction time. Masked arrays can not be
+shared or written to a file: share_graph() and write_graph() raise ValueError for them.
+
+    view = SubgraphView(graph)
+    snapshot = view.compact()
+    graph.edge(7).disable()
+    path = dijkstra_search(1, 2, snapshot)  # edge 7 is not used
+"""
+
+__author__ = 'Victor Zarubkin'
+__copyright__ = 'Copyright (C) 2015  Victor Zarubkin'
+__credits__ = ['Victor Zarubkin']
+__license__ = ['GPLv3']
+__version__ = '0.0.1'  # this is last application version when this script file was changed
+__email__ = 'victor.zarubkin@gmail.com'
+############################################################################
+
+from weakref import WeakSet
+from .compact_graph import CompactGraph
+
+#######################################################################################################################
+#######################################################################################################################
+
+_FILTERED = 1  # item is rejected by the filter
+_BLOCKED = 2  # item is blocked explicitly
+
+_keep_blocked = bytes(value & _BLOCKED for value in range(256))
+
+
+def _enabled(item):
+    return item.enabled()
+
+
+def _mark(mask, uid, bit, value):
+    # sets or clears "bit" of mask[uid], returns True if the item became hidden or visible
+    if uid >= len(mask):
+        if not value:
+            return False
+        mask.extend(bytes(uid + 1 - len(mask)))
+    old = mask[uid]
+    new = old | bit if value else old & ~bit
+    mask[uid] = new
+    return (old == 0) != (new == 0)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class SubgraphView(object):
+
+    # "node_filter(node)" and "edge_filter(edge)" return True for items which belong to the subgraph.
+    # Filters are re-evaluated for items touched by every logged change (state, weight or structure),
+    # so they may depend on anything a change is reported for.
+
+    def __init__(self, graph, node_filter=None, edge_filter=None):
+        object.__init__(self)
+        self._graph = graph
+        self._nodeFilter = node_filter if node_filter is not None else _enabled
+        self._edgeFilter = edge_filter if edge_filter is not None else _enabled
+        self._nodeMask = bytearray()  # indexed by node id
+        self._edgeMask = bytearray()  # indexed by edge id
+        self._version = None
+        self._compacts = WeakSet()
+        self._rebuild()
+
+    def graph(self):
+        return self._graph
+
+    def version(self):
+        return self._graph.version()
+
+    def set_filters(self, node_filter=None, edge_filter=None):
+        self._nodeFilter = node_filter if node_filter is not None else _enabled
+        self._edgeFilter = edge_filter if edge_filter is not None else _enabled
+        self._rebuild()
+
+    def node_blocked(self, uid):
+        self.synchronize()
+        return uid < len(self._nodeMask) and self._nodeMask[uid] != 0
+
+    def edge_blocked(self, uid):
+        self.synchronize()
+        return uid < len(self._edgeMask) and self._edgeMask[uid] != 0
+
+    def block_node(self, uid, blocked=True):
+        if _mark(self._nodeMask, uid, _BLOCKED, blocked):
+            hidden = self._nodeMask[uid] != 0
+            for compact in self._compacts:
+                compact.block_node(uid, hidden)
+
+    def block_edge(self, uid, blocked=True):
+        if _mark(self._edgeMask, uid, _BLOCKED, blocked):
+            hidden = self._edgeMask[uid] != 0
+            for compact in self._compacts:
+                compact.block_edge(uid, hidden)
+
+    def node(self, identifier):
+        mask = self._nodeMask
+        if identifier < len(mask) and mask[identifier]:
+            return None
+        return self._graph.node(identifier)
+
+    def edge(self, identifier):
+        mask = self._edgeMask
+        if identifier < len(mask) and mask[identifier]:
+            return None
+        return self._graph.edge(identifier)
+
+    def nodes(self):
+        # new dict with visible nodes only, O(n)
+        mask = self._nodeMask
+        size = len(mask)
+        return dict((uid, node) for uid, node in self._graph.nodes().items() if uid >= size or not mask[uid])
+
+    def may_reach(self, begin, end):
+        # every search calls this first: bring masks up to date with the graph
+        self.synchronize()
+        return self._graph.may_reach(begin, end)
+
+    def compact(self, snapshot=None):
+        # CompactSubgraph over "snapshot" (CompactGraph of the same graph, created if None) following this view
+        if snapshot is None:
+            snapshot = CompactGraph(self._graph)
+        self.synchronize()
+        compact = CompactSubgraph(snapshot)
+        compact._load(self._nodeMask, self._edgeMask)
+        self._compacts.add(compact)
+        return compact
+
+    def synchronize(self):
+        graph = self._graph
+        changes = graph.changes_since(self._version)
+        if changes is None:
+            self._rebuild()
+            return
+        if not changes:
+            return
+        self._version = graph.version()
+
+        nodes = set()
+        edges = set()
+        for change in changes:
+            nodes.update(change.nodes())
+            edges.update(change.edges())
+
+        node_filter = self._nodeFilter
+        for uid in nodes:
+            node = graph.node(uid)
+            if _mark(self._nodeMask, uid, _FILTERED, node is not None and not node_filter(node)):
+                hidden = self._nodeMask[uid] != 0
+                for compact in self._compacts:
+                    compact.block_node(uid, hidden)
+
+        edge_filter = self._edgeFilter
+        for uid in edges:
+            edge = graph.edge(uid)
+            if _mark(self._edgeMask, uid, _FILTERED, edge is not None and not edge_filter(edge)):
+                hidden = self._edgeMask[uid] != 0
+                for compact in self._compacts:
+                    compact.block_edge(uid, hidden)
+
+    def _rebuild(self):
+        graph = self._graph
+        self._version = graph.version()
+        node_mask = self._nodeMask
+        edge_mask = self._edgeMask
+        node_mask[:] = node_mask.translate(_keep_blocked)
+        edge_mask[:] = edge_mask.translate(_keep_blocked)
+
+        node_filter = self._nodeFilter
+        edge_filter = self._edgeFilter
+        for uid, node in graph.nodes().items():
+            if not node_filter(node):
+                _mark(node_mask, uid, _FILTERED, True)
+            for edge_id in node.edges():
+                edge = graph.edge(edge_id)
+                if edge is not None and not edge_filter(edge):
+                    _mark(edge_mask, edge_id, _FILTERED, True)
+
+        for compact in self._compacts:
+            compact._load(node_mask, edge_mask)
+
+#######################################################################################################################
+#######################################################################################################################
+
+
+class CompactSubgraph(CompactGraph):
+
+    # Shares arrays of "snapshot" (no copies are made), nodes and edges are blocked by their ids.
+    # A blocked node is never entered: all arcs leading to it are masked.
+
+    def __init__(self, snapshot):
+        object.__init__(self)
+        self._assign(snapshot.version(), snapshot.ids(), snapshot.node_weights(), snapshot.offsets(),
+                     snapshot.targets(), snapshot.edge_ids(), snapshot.edge_weights(), snapshot.edges_number(),
+                     *snapshot.coordinates())
+        self._reverse_offsets = snapshot.reverse_offsets()
+        self._reverse_sources = snapshot.reverse_sources()
+        self._reverse_arcs = snapshot.reverse_arcs()
+        self._snapshot = snapshot
+        self._arcMask = bytearray(snapshot.arcs_number())  # number of reasons to skip the arc: its edge, its target
+        self._nodeMask = bytearray(snapshot.nodes_number())  # indexed by node index
+        self._blockedEdges = set()
+        self._edgeArcs = None  # edge id -> positions of its arcs, built on demand
+
+    def snapshot(self):
+        return self._snapshot
+
+    def blocked_arcs(self):
+        return self._arcMask
+
+    def may_reach(self, begin, end):
+        # the snapshot's reachability index is still valid: the subgraph can only reject more queries
+        if self.node_blocked(begin) or self.node_blocked(end):
+            return False
+        if self._reachability is None:
+            return self._snapshot.may_reach(begin, end)
+        return CompactGraph.may_reach(self, begin, end)
+
+    def node_blocked(self, uid):
+        i = self.index(uid)
+        return i >= 0 and self._nodeMask[i] != 0
+
+    def edge_blocked(self, uid):
+        return uid in self._blockedEdges
+
+    def block_node(self, uid, blocked=True):
+        i = self.index(uid)
+        if i < 0 or (self._nodeMask[i] != 0) == blocked:
+            return
+        self._nodeMask[i] = 1 if blocked else 0
+        delta = 1 if blocked else -1
+        arc_mask = self._arcMask
+        reverse_arcs = self._reverse_arcs
+        for position in range(self._reverse_offsets[i], self._reverse_offsets[i + 1]):
+            arc = reverse_arcs[position]
+            arc_mask[arc] += delta
+
+    def block_edge(self, uid, blocked=True):
+        if (uid in self._blockedEdges) == blocked:
+            return
+        arcs = self._edge_arcs().get(uid, None)
+        if arcs is None:
+            return
+        if blocked:
+            self._blockedEdges.add(uid)
+        else:
+            self._blockedEdges.discard(uid)
+        delta = 1 if blocked else -1
+        arc_mask = self._arcMask
+        for arc in arcs:
+            arc_mask[arc] += delta
+
+    def _edge_arcs(self):
+        if self._edgeArcs is None:
+            edge_arcs = {}
+            for arc, uid in enumerate(self._edge_ids):
+                edge_arcs.setdefault(uid, []).append(arc)
+            self._edgeArcs = edge_arcs
+        return self._edgeArcs
+
+    def _load(self, node_mask, edge_mask):
+        # replaces all blocks with masks of SubgraphView
+        self._arcMask[:] = bytes(len(self._arcMask))
+        self._nodeMask[:] = bytes(len(self._nodeMask))
+        self._blockedEdges.clear()
+        for uid, value in enumerate(node_mask):
+            if value:
+                self.block_node(uid)
+        for uid, value in enumerate(edge_mask):
+            if value:
+                self.block_edge(uid)
+
+#######################################################################################################################
+#######################################################################################################################
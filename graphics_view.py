@@ -42,6 +42,8 @@ from graph.depth_first_search import depth_first_search as dfs
 from graph.breadth_first_search import breadth_first_search as bfs
 from graph.dijkstra_search import dijkstra_search as dijkstra
 from graph.astar_search import astar_search as astar
+from graph.bidirectional_dijkstra_search import bidirectional_dijkstra_search as bidirectional_dijkstra
+from graph.path_cache import PathCache
 import diagram
 
 #######################################################################################################################
@@ -72,13 +74,15 @@ class Scene(QGraphicsScene):
             Qt.Key_1: self._runDFS,
             Qt.Key_2: self._runBFS,
             Qt.Key_3: self._runDijkstra,
-            Qt.Key_4: self._runAstar
+            Qt.Key_4: self._runAstar,
+            Qt.Key_5: self._runBidirectionalDijkstra
             }
 
         self._nodes = {}
         self._edges = {}
         self._begin = 0
         self._end = 0
+        self._pathCache = PathCache(graph.graph)
 
         half_size = Scene._defaultSize
         self._topLeft = QPointF(-half_size, -half_size)
@@ -122,7 +126,8 @@ class Scene(QGraphicsScene):
                                                   '\'1\' = Depth first search\n'
                                                   '\'2\' = Breadth first search\n'
                                                   '\'3\' = Dijkstra\'s search\n'
-                                                  '\'4\' = A* search')
+                                                  '\'4\' = A* search\n'
+                                                  '\'5\' = Bidirectional Dijkstra\'s search')
 
     def _addNewNode(self):
         new_node = graph.graph.add_node(1)
@@ -146,7 +151,7 @@ class Scene(QGraphicsScene):
                     if isinstance(item, diagram.Node):
                         if item.id() != selected.id():
                             edge = graph.graph.connect_nodes(selected.id(), item.id(),
-                                                             graph.EdgeDirection.STRAIGHT, 1)
+                                                             graph.EdgeDirection.STRAIGHT, 1, True)
                             if edge.id() in self._edges:
                                 self.edge(edge.id()).initialize(edge.id())
                             else:
@@ -219,6 +224,15 @@ class Scene(QGraphicsScene):
             self.update()
             print('iterations = %d // A*' % path.iterations())
 
+    def _runBidirectionalDijkstra(self):
+        # Bidirectional Dijkstra's Search
+        path = self._runSearch(bidirectional_dijkstra)
+        if path:
+            self._cleanHighlight()
+            self._highlightPath(path)
+            self.update()
+            print('iterations = %d // Bidirectional Dijkstra' % path.iterations())
+
     def _clearPath(self):
         self._cleanHighlight()
         self.update()
@@ -271,7 +285,7 @@ class Scene(QGraphicsScene):
 
     def _runSearch(self, search_algorithm):
         if self._begin != 0 and self._end != 0 and search_algorithm is not None:
-            return search_algorithm(self._begin, self._end, graph.graph)
+            return self._pathCache.search(self._begin, self._end, search_algorithm)
         return []
 
 #######################################################################################################################